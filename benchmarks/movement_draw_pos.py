@@ -0,0 +1,132 @@
+__author__ = "Kaya Arkin"
+__copyright__ = "Copyright Kaya Arkin"
+__license__ = "GPL"
+__email__ = "karkin2002@gmail.com"
+__status__ = "Development"
+
+"""
+This file is part of Arctic Engine Project by Kaya Arkin. For more information,
+look at the README.md file in the root directory, or visit the
+GitHub Repo: https://github.com/karkin2002/Arctic-Engine.
+"""
+
+## Microbenchmark of Movement.get_draw_pos, the per object cost of resolving a draw position every frame. Compares the
+## current implementation against the previous one, which rebuilt the point of origin adjustment from the alignment
+## dict (allocating several Vector2s) on every call. Run from the root directory:
+##
+##     python -m benchmarks.movement_draw_pos
+
+from timeit import timeit
+from pygame import Vector2
+from scripts.utility.logger import Logger
+from scripts.game.components.movement import Movement
+from scripts.services.service_locator import ServiceLocator
+from scripts.services.utility.time_service import TimeService
+
+OBJECT_COUNT = 10000
+REPEATS = 20
+
+
+class PreviousMovement:
+    """
+    The draw position calculation as it was before the point of origin offset was cached.
+    """
+
+    def __init__(self, pos: Vector2, dim: Vector2, **alignment_kwargs: bool):
+        self.pos = Vector2(pos)
+        self.previous_pos = Vector2(pos)
+        self.dim = Vector2(dim)
+        self.point_of_origin_adjustment = None
+        self.point_of_origin_alignment = Movement.DEFAULT_ALIGN_DICT.copy()
+        self.point_of_origin_alignment.update(alignment_kwargs)
+        self.pos_with_point_of_origin_adjustment = self.get_pos_with_point_of_origin_adjustment(self.pos)
+        self.time_service: TimeService = ServiceLocator.get(TimeService)
+        self.movement_filter = None
+
+    def get_pos_with_point_of_origin_adjustment(self, pos: Vector2) -> Vector2:
+        new_pos = Vector2(pos) - Vector2(self.dim.x / 2, self.dim.y / 2)
+        if self.point_of_origin_alignment[Movement.ALIGN_TOP_KW]:
+            new_pos += Vector2(0, self.dim.y / 2)
+        if self.point_of_origin_alignment[Movement.ALIGN_BOTTOM_KW]:
+            new_pos -= Vector2(0, self.dim.y / 2)
+        if self.point_of_origin_alignment[Movement.ALIGN_RIGHT_KW]:
+            new_pos -= Vector2(self.dim.x / 2, 0)
+        if self.point_of_origin_alignment[Movement.ALIGN_LEFT_KW]:
+            new_pos += Vector2(self.dim.x / 2, 0)
+        if self.point_of_origin_adjustment:
+            new_pos += self.point_of_origin_adjustment
+        return new_pos
+
+    def apply_movement_filter(self, draw_pos: Vector2):
+        new_pos = Vector2(draw_pos.x, draw_pos.y)
+        if self.movement_filter:
+            new_pos = self.movement_filter.apply(draw_pos)
+        return new_pos
+
+    def move_pos(self, velocity: Vector2):
+        self.pos += velocity * self.time_service.fixed_delta_time
+
+    def get_draw_pos(self) -> Vector2:
+        interpolated_time = max(0.0, min(1.0, self.time_service.interpolated_time))
+        if self.previous_pos != self.pos:
+            drawn_pos = self.previous_pos + (self.pos - self.previous_pos) * interpolated_time
+            self.previous_pos = Vector2(self.pos)
+            self.pos_with_point_of_origin_adjustment = self.get_pos_with_point_of_origin_adjustment(self.pos)
+            return self.apply_movement_filter(self.get_pos_with_point_of_origin_adjustment(drawn_pos))
+        else:
+            return self.apply_movement_filter(self.pos_with_point_of_origin_adjustment)
+
+
+def time_per_object_ns(movements: list, moving: bool) -> float:
+    """
+    Returns the mean time (ns) to resolve one object's draw position, for a frame in which every object has (or hasn't)
+    moved since the last frame.
+    """
+
+    velocity = Vector2(30, 15)
+
+    def frame():
+        if moving:
+            for movement in movements:
+                movement.move_pos(velocity)
+        for movement in movements:
+            movement.get_draw_pos()
+
+    move_time = 0.0
+    if moving:
+        move_time = timeit(lambda: [movement.move_pos(velocity) for movement in movements], number=REPEATS)
+
+    return (timeit(frame, number=REPEATS) - move_time) / (REPEATS * len(movements)) * 1e9
+
+
+def main():
+
+    Logger.print_log = False
+
+    time_service = TimeService()
+    time_service.interpolated_time = 0.5
+    ServiceLocator.register(TimeService, time_service)
+
+    pos = [Vector2(i % 100 * 16, i // 100 * 16) for i in range(OBJECT_COUNT)]
+    dim = Vector2(16, 32)
+
+    ## Check both implementations agree before timing them.
+    previous = PreviousMovement(pos[1], dim, align_bottom=True)
+    current = Movement(pos[1], dim, align_bottom=True)
+    for velocity in (Vector2(30, 15), Vector2(0, 0)):
+        previous.move_pos(velocity)
+        current.move_pos(velocity)
+        assert previous.get_draw_pos() == current.get_draw_pos()
+
+    print(f"Movement.get_draw_pos, {OBJECT_COUNT} objects, {REPEATS} frames. Mean ns per object:")
+
+    for moving in (False, True):
+        previous_ns = time_per_object_ns([PreviousMovement(p, dim, align_bottom=True) for p in pos], moving)
+        current_ns = time_per_object_ns([Movement(p, dim, align_bottom=True) for p in pos], moving)
+
+        print(f"  {'moving' if moving else 'static':<7} previous: {previous_ns:7.1f} ns   "
+              f"current: {current_ns:7.1f} ns   ({previous_ns / current_ns:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
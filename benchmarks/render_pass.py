@@ -0,0 +1,110 @@
+__author__ = "Kaya Arkin"
+__copyright__ = "Copyright Kaya Arkin"
+__license__ = "GPL"
+__email__ = "karkin2002@gmail.com"
+__status__ = "Development"
+
+"""
+This file is part of Arctic Engine Project by Kaya Arkin. For more information,
+look at the README.md file in the root directory, or visit the
+GitHub Repo: https://github.com/karkin2002/Arctic-Engine.
+"""
+
+## Benchmark of the GameObjectHandler render pass at 1k, 5k & 20k on screen, static sprites. Times the full render
+## pass (draw_game_objects_to_window) as it used to run, resolving every sprite's draw position & blitting each sprite
+## with its own Surface.blit call, against the batched pass with & without reusing the blit pairs of sprites that
+## haven't moved (GameObjectHandler.reuse_static_draws). The per sprite blit path is the same render pass drawing to a
+## window surface whose blits makes a blit call per pair, i.e. the calls the render pass made before it was batched.
+## Runs headless. Run from the root directory:
+##
+##     python -m benchmarks.render_pass
+
+import random
+from timeit import repeat
+import pygame
+from pygame import Surface, Vector2
+from scripts.utility.logger import Logger
+from scripts.arctic_engine import ArcticEngine
+from scripts.game.game_objects.game_object import GameObject
+
+SPRITE_COUNTS = (1000, 5000, 20000)
+SPRITE_DIM = (16, 16)
+FRAMES = 10
+REPEATS = 5
+
+
+class BenchmarkSprite(GameObject):
+
+    def __init__(self, surface: Surface, pos: Vector2):
+        super().__init__(pos=pos, dim=Vector2(SPRITE_DIM))
+        self.__surface = surface
+
+    def draw(self) -> Surface | None:
+        return self.__surface
+
+
+class BlitPerSpriteSurface(Surface):
+    """
+    A window surface that submits a blit sequence with a Surface.blit call per pair, as the render pass did before it
+    was batched.
+    """
+
+    def blits(self, blit_sequence, doreturn: bool = True):
+        for surf, pos in blit_sequence:
+            self.blit(surf, pos)
+
+
+def main():
+
+    Logger.print_log = False
+    pygame.init()
+
+    engine = ArcticEngine(win_dim=(1024, 576), headless=True)
+
+    ## Both paths draw to an off screen surface with the window's format, so only the submission differs.
+    display_win = engine.window.win
+    blit_win = BlitPerSpriteSurface(display_win.get_size(), 0, display_win)
+    blits_win = Surface(display_win.get_size(), 0, display_win)
+
+    sprite_surf = Surface(SPRITE_DIM).convert()
+    sprite_surf.fill((200, 120, 40))
+
+    random.seed(0)
+
+    print(f"Render pass, best of {REPEATS} runs of {FRAMES} frames. Mean ns per sprite:")
+
+    for sprite_count in SPRITE_COUNTS:
+
+        for ident in [f"sprite{i}" for i in range(sprite_count)]:
+            pos = Vector2(random.uniform(-500, 500), random.uniform(-280, 280))
+            engine.game_objects.add(ident, BenchmarkSprite(sprite_surf, pos), False)
+
+        per_sprite = FRAMES * sprite_count / 1e9
+
+        def time_render_pass(win: Surface, reuse_static_draws: bool) -> float:
+            engine.window.win = win
+            engine.game_objects.reuse_static_draws = reuse_static_draws
+
+            ## An untimed pass first, so no path includes building the indexes or the reused blit pairs.
+            render_pass = engine.game_objects.draw_game_objects_to_window
+            render_pass()
+
+            return min(repeat(render_pass, repeat=REPEATS, number=FRAMES)) / per_sprite
+
+        blit_ns = time_render_pass(blit_win, False)
+        blits_ns = time_render_pass(blits_win, False)
+        reused_ns = time_render_pass(blits_win, True)
+
+        print(f"  {sprite_count:>6} sprites   blit per sprite: {blit_ns:7.1f} ns   "
+              f"blits per layer: {blits_ns:7.1f} ns ({blit_ns / blits_ns:.2f}x)   "
+              f"+ static reuse: {reused_ns:7.1f} ns ({blit_ns / reused_ns:.2f}x)")
+
+        for ident in [f"sprite{i}" for i in range(sprite_count)]:
+            engine.game_objects.remove(ident, False)
+
+    engine.window.win = display_win
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -38,7 +38,7 @@ ae.image.add_folder("static/images/textures/map/")
 test_map = Map((10, 10))
 test_map.add_map_layer()
 test_map.get_map_layer(0).generate_map_array(["simple_tile"], [1])
-test_map.set_map_surf()
+test_map.invalidate_chunks()
 test_map.draw_order = 0
 ae.game_objects.add("map", test_map)
 
@@ -13,6 +13,7 @@ look at the README.md file in the root directory, or visit the
 GitHub Repo: https://github.com/karkin2002/Arctic-Engine.
 """
 
+from time import perf_counter_ns
 from pygame import event as pygame_event, VIDEORESIZE, QUIT, key as pygame_key, K_w, K_a, K_s, K_d, Vector2, SCALED, FULLSCREEN
 from scripts.utility.logger import Logger
 from scripts.services.service_locator import ServiceLocator
@@ -24,6 +25,8 @@ from scripts.services.audio.audio_service import AudioService
 from scripts.services.utility.persistent_storage_service import PersistentDataService
 from scripts.game.game_objects.game_object_handler import GameObjectHandler
 from scripts.services.visual.particle_service import ParticleService
+from scripts.services.visual.scaled_surface_service import ScaledSurfaceService
+from scripts.services.utility.profiler_service import ProfilerService
 import scripts.utility.glob as glob
 glob.init()
 
@@ -37,11 +40,22 @@ class ArcticEngine:
                  vsync: bool = True,
                  framerate: int = 0,
                  update_time_ms: float = 20.0,
-                 temp_image_lifespan: int = 600000):
+                 temp_image_lifespan: int = 600000,
+                 temp_image_budget_bytes: int | None = None,
+                 async_image_loading: bool = False,
+                 image_cache_dir: str | None = None,
+                 use_movement_store: bool = False,
+                 scaled_surface_budget_bytes: int = 64 * 1024 * 1024,
+                 dirty_rect_mode: bool = False,
+                 headless: bool = False):
 
         ## Logging
         Logger.log_info(self.__START_UP_INFO_TEXT)
 
+        ## Profiler, times each phase of every frame while enabled.
+        self.profiler = ProfilerService()
+        ServiceLocator.register(ProfilerService, self.profiler)
+
         ## Save Data
         self.persistent_data = PersistentDataService()
         ServiceLocator.register(PersistentDataService, self.persistent_data)
@@ -51,27 +65,37 @@ class ArcticEngine:
         ServiceLocator.register(ColourService, self.colour)
 
         ## WindowService Essentials
-        self.window = WindowService(win_dim, flags, vsync)
+        self.window = WindowService(win_dim, flags, vsync, headless)
+        self.window.dirty_rect_mode = dirty_rect_mode
         ServiceLocator.register(WindowService, self.window)
 
         ## Clock / Framerate
         self.time = TimeService(framerate, update_time_ms)
         ServiceLocator.register(TimeService, self.time)
 
+        ## Headless runs are deterministic: every frame is one fixed update long, without waiting on the clock.
+        if headless:
+            self.time.set_fixed_frame_time(update_time_ms)
+
         ## Audio Service
-        self.audio = AudioService(80)
+        self.audio = AudioService(80, headless=headless)
         ServiceLocator.register(AudioService, self.audio)
 
         ## Setup Image Service
-        self.image = ImageService(temp_image_lifespan)
+        self.image = ImageService(temp_image_lifespan, temp_image_budget_bytes, cache_dir=image_cache_dir)
         ServiceLocator.register(ImageService, self.image)
 
+        ## Scaled Surface Service, caches scaled copies of surfaces drawn while the camera is zoomed.
+        self.scaled_surface = ScaledSurfaceService(scaled_surface_budget_bytes)
+        self.scaled_surface.background_rescaling = not headless
+        ServiceLocator.register(ScaledSurfaceService, self.scaled_surface)
+
         ## Particle Service
-        self.particle = ParticleService()
+        self.particle = ParticleService(async_image_loading)
         ServiceLocator.register(ParticleService, self.particle)
 
         ## Game Objects
-        self.game_objects = GameObjectHandler()
+        self.game_objects = GameObjectHandler(use_movement_store=use_movement_store)
 
 
 
@@ -83,6 +107,21 @@ class ArcticEngine:
             bool: True if the engine is still running, False otherwise.
         """
 
+        ## Every phase of the frame is timed while the profiler is enabled.
+        self.profiler.begin_frame()
+
+        if not self.profiler.enabled:
+            return self.__handle_events()
+
+        start_ns = perf_counter_ns()
+        running = self.__handle_events()
+        self.profiler.record_phase(ProfilerService.EVENTS, start_ns, perf_counter_ns())
+
+        return running
+
+
+    def __handle_events(self) -> bool:
+
         glob.update_delta_time()
 
         for event in pygame_event.get():
@@ -103,36 +142,72 @@ class ArcticEngine:
         Updates all __game_objects that have an implemented update function & updates the clock. This method runs every frame.
         """
 
+        if not self.profiler.enabled:
+            self.__update(False)
+            return
+
+        start_ns = perf_counter_ns()
+        self.__update(True)
+        self.profiler.record_phase(ProfilerService.UPDATE, start_ns, perf_counter_ns())
+
+
+    def __update(self, profiling: bool):
+
         ## Updates time
         self.time.tick()
 
+        ## Adds images that have finished loading in the background & frees temp images that haven't been used recently.
+        self.image.process_loaded_images()
+        self.image.unload_expired_temp_images()
+
+        ## Adds surfaces that have finished scaling in the background, for a zoomed camera.
+        self.scaled_surface.update()
+
         ## Potentially runs multiple times if there is a large lag, i.e. game is rendering at lower ms than
         ## update_time_ms.
         while self.time.is_update():
-            self.game_objects.update()
 
-            keys = pygame_key.get_pressed()
+            if profiling:
+                start_ns = perf_counter_ns()
+                self.__fixed_update()
+                self.profiler.record_phase(ProfilerService.FIXED_UPDATE, start_ns, perf_counter_ns())
+
+            else:
+                self.__fixed_update()
+
+
+    def __fixed_update(self):
+
+        self.game_objects.update()
+
+        keys = pygame_key.get_pressed()
 
-            velocity = 100
+        velocity = 100
 
-            move_camera = Vector2(0, 0)
+        move_camera = Vector2(0, 0)
 
-            entity: Man = self.game_objects.get("square1", False)
+        ## Demo controls, skipped if the demo's game objects aren't there (e.g. in headless runs).
+        camera = self.game_objects.get_camera()
 
-            if keys[K_w]:
-                    move_camera.y -= velocity
+        if camera is None or not self.game_objects.exists("square1"):
+            return
 
-            if keys[K_a]:
-                    move_camera.x -= velocity
+        entity: Man = self.game_objects.get("square1", False)
 
-            if keys[K_s]:
-                    move_camera.y += velocity
+        if keys[K_w]:
+                move_camera.y -= velocity
 
-            if keys[K_d]:
-                    move_camera.x += velocity
+        if keys[K_a]:
+                move_camera.x -= velocity
 
-            self.game_objects.get(self.game_objects.get_camera_ident(), False).move.move_pos(move_camera)
-            entity.move.move_pos(move_camera)
+        if keys[K_s]:
+                move_camera.y += velocity
+
+        if keys[K_d]:
+                move_camera.x += velocity
+
+        camera.move.move_pos(move_camera)
+        entity.move.move_pos(move_camera)
 
 
 
@@ -142,10 +217,51 @@ class ArcticEngine:
         Draws all __game_objects that have an implemented draw function.
         """
 
-        self.window.draw_background()
+        if not self.profiler.enabled:
+            self.__draw(False)
+            return
+
+        start_ns = perf_counter_ns()
+        self.__draw(True)
+        self.profiler.record_phase(ProfilerService.DRAW, start_ns, perf_counter_ns())
+
+        self.profiler.end_frame()
+
+
+    def __draw(self, profiling: bool):
+
+        ## In dirty rect mode, the game object handler clears only the areas it redraws.
+        if not self.window.dirty_rect_mode:
+            self.window.draw_background()
+
+        dirty_rects = self.game_objects.draw_game_objects_to_window()
+
+        if profiling:
+            start_ns = perf_counter_ns()
+            self.window.draw(dirty_rects)
+            self.profiler.record_phase(ProfilerService.PRESENT, start_ns, perf_counter_ns())
+
+        else:
+            self.window.draw(dirty_rects)
+
+
+
+    def step(self, frames: int = 1) -> bool:
+        """
+        Runs the engine for a number of frames (handling events, updating & drawing), e.g. to drive a headless engine.
+
+        Args:
+            frames (int, optional): The number of frames to run. Defaults to 1.
 
-        self.game_objects.draw_game_objects_to_window()
+        Returns:
+            bool: True if the engine is still running, False otherwise.
+        """
 
-        self.window.draw()
+        for _ in range(frames):
+            if not self.handle_events():
+                return False
 
+            self.update()
+            self.draw()
 
+        return True
@@ -1,7 +1,10 @@
-from pygame import time as py_time, Vector2
+from weakref import finalize
+from pygame import Surface, Vector2
 from scripts.utility.logger import Logger
 from scripts.services.service_locator import ServiceLocator
-from scripts.services.visual.image_service import ImageService
+from scripts.services.utility.animation_clock import AnimationClock, AnimationGroup
+from scripts.services.utility.time_service import TimeService
+from scripts.services.visual.image_service import ImageService, Image
 
 
 class Animation:
@@ -12,13 +15,24 @@ class Animation:
     def __init__(self, frames: list[str], animation_length_ms: int = 1000, repeat = True):
 
         self.__frames: list[str] = []
-        self.__image_service = ServiceLocator.get(ImageService)
+        self.__image_service: ImageService = ServiceLocator.get(ImageService)
 
-        self.animation_length_ms: int = animation_length_ms
-        self.repeat: bool = repeat
+        ## The frames' images, found in the image service once rather than looked up by name every frame. They're found
+        ## again whenever the image service's image version changes (an image added or removed). Only the images are
+        ## kept, not their surfaces, so a converted, unloaded or reloaded surface is picked up by the next draw.
+        self.__frame_images: tuple[Image | None, ...] = ()
+        self.__image_version: int = -1
 
-        self.__start_time: int = py_time.get_ticks()
-        self.finished = False
+        ## Progress is measured against the shared animation clock. The animation's start time is kept in the clock's
+        ## group for animations with the same definition, which computes the current frame of all of them at once.
+        self.__clock: AnimationClock = ServiceLocator.get(TimeService).animation_clock
+        self.__start_ms: float = self.__clock.time_ms
+        self.__group: AnimationGroup | None = None
+        self.__slot: int = 0
+        self.__slot_finalizer: finalize | None = None
+
+        self.__animation_length_ms: int = animation_length_ms
+        self.__repeat: bool = repeat
 
         self.__dim = Vector2(0, 0)
 
@@ -48,27 +62,113 @@ class Animation:
 
         self.__frames = frames
         self.__dim.update(max_width, max_height)
+        self.__resolve_frame_images()
+        self.__join_group()
         Logger.log_info(self.__NEW_FRAMES_SET.format(frames=self.__frames))
 
         return True
 
 
+    def __resolve_frame_images(self):
+        """
+        Finds the frames' images, without reloading unloaded temp images (only the frame being drawn is reloaded).
+        """
+
+        frame_images: list[Image | None] = []
+
+        for image_name in self.__frames:
+
+            ## Images still loading are waited on (or a placeholder is used), the same as ImageService.get.
+            if self.__image_service.is_pending(image_name):
+                frame_images.append(self.__image_service.get(image_name))
+
+            else:
+                frame_images.append(self.__image_service.find(image_name))
+
+        self.__frame_images = tuple(frame_images)
+
+        ## Taken after the images are found, as finishing a pending image adds it, changing the version.
+        self.__image_version = self.__image_service.get_image_version()
+
+
+    def __join_group(self):
+        """
+        Moves the animation's slot to the clock's group for its current definition, keeping its start time.
+        """
+
+        if self.__group is not None:
+            self.__start_ms = self.__group.get_start_ms(self.__slot)
+            self.__slot_finalizer.detach()
+            self.__group.remove_slot(self.__slot)
+            self.__group = None
+
+        if self.__frames:
+            self.__group = self.__clock.get_group(len(self.__frames), self.__animation_length_ms, self.__repeat)
+            self.__slot = self.__group.add_slot(self.__start_ms)
+
+            ## Frees the slot once the animation is garbage collected.
+            self.__slot_finalizer = finalize(self, self.__group.remove_slot, self.__slot)
+
+
+    @property
+    def animation_length_ms(self) -> int:
+        return self.__animation_length_ms
+
+
+    @animation_length_ms.setter
+    def animation_length_ms(self, animation_length_ms: int):
+        self.__animation_length_ms = animation_length_ms
+        self.__join_group()
+
+
+    @property
+    def repeat(self) -> bool:
+        return self.__repeat
+
+
+    @repeat.setter
+    def repeat(self, repeat: bool):
+        self.__repeat = repeat
+        self.__join_group()
+
+
+    @property
+    def finished(self) -> bool:
+        return self.__group is not None and self.__group.is_finished(self.__slot)
+
+
+    def __get_current_frame_index(self) -> int:
+        return self.__group.get_frame_index(self.__slot)
+
+
     def get_current_frame(self) -> str | None:
 
         if not self.__frames:
             return None
 
-        if not self.repeat and (py_time.get_ticks() - self.__start_time) >= self.animation_length_ms:
-            self.finished = True
-            return self.__frames[len(self.__frames) - 1]
+        return self.__frames[self.__get_current_frame_index()]
 
-        elapsed_time = (py_time.get_ticks() - self.__start_time) % self.animation_length_ms
 
-        frame_duration = self.animation_length_ms / len(self.__frames)
+    def get_current_frame_surface(self) -> Surface | None:
+        """
+        Gets the surface of the current frame, without looking the frame up in the image service.
 
-        frame_index = int(elapsed_time // frame_duration)
+        Returns:
+            Surface | None: The frame's surface, or None if there are no frames or the frame's image does not exist.
+        """
 
-        return self.__frames[frame_index]
+        if not self.__frames:
+            return None
+
+        if self.__image_version != self.__image_service.get_image_version():
+            self.__resolve_frame_images()
+
+        image = self.__frame_images[self.__get_current_frame_index()]
+
+        if image is None:
+            return None
+
+        return self.__image_service.get_surface(image)
 
 
     def get_dim(self) -> Vector2:
@@ -76,8 +176,11 @@ class Animation:
 
 
     def reset(self):
-        self.__start_time = py_time.get_ticks()
-        self.finished = False
+
+        self.__start_ms = self.__clock.time_ms
+
+        if self.__group is not None:
+            self.__group.restart_slot(self.__slot)
 
 
 
@@ -6,7 +6,7 @@ from scripts.utility.logger import Logger
 from scripts.game.components.animation import Animation
 from scripts.services.service_locator import ServiceLocator
 from scripts.services.visual.colour_service import ColourService
-from scripts.services.visual.image_service import ImageService
+from scripts.services.visual.image_service import ImageService, Image
 
 class AnimationHandler:
 
@@ -28,7 +28,11 @@ class AnimationHandler:
         self.__current_animation: str | None = None
         self.__default_animation: str | None = None
 
-        self.__image_service = ServiceLocator.get(ImageService)
+        self.__image_service: ImageService = ServiceLocator.get(ImageService)
+
+        ## Images of single image animations, by image name, found at the image service's image version.
+        self.__images: dict[str, Image | None] = {}
+        self.__images_version: int = -1
 
 
     def add(self, name: str, animation: Animation | str):
@@ -95,10 +99,31 @@ class AnimationHandler:
                 else:
                     Logger.log_warning(self.__DEFAULT_ANIMATION_NOT_SET.format(animation_name=self.__current_animation))
 
-            return self.__image_service.get(self.__animations[self.__current_animation].get_current_frame()).surface
+            frame_surf = self.__animations[self.__current_animation].get_current_frame_surface()
 
         else:
-            return self.__image_service.get(self.__animations[self.__current_animation]).surface
+            frame_surf = self.__get_image_surf(self.__animations[self.__current_animation])
+
+        return frame_surf if frame_surf is not None else self.__default_surface
+
+
+    def __get_image_surf(self, image_name: str) -> Surface | None:
+
+        image_version = self.__image_service.get_image_version()
+
+        if self.__images_version != image_version:
+            self.__images.clear()
+            self.__images_version = image_version
+
+        if image_name not in self.__images:
+            self.__images[image_name] = self.__image_service.get(image_name)
+
+            ## Taken after the lookup, as finishing a pending image adds it, changing the version.
+            self.__images_version = self.__image_service.get_image_version()
+
+        image = self.__images[image_name]
+
+        return self.__image_service.get_surface(image) if image is not None else None
 
 
     def is_current_animation_finished(self) -> bool:
@@ -0,0 +1,167 @@
+from abc import abstractmethod, ABC
+from weakref import finalize, WeakSet
+import numpy as np
+from pygame import Vector2
+from scripts.game.components.filters.filter import Filter
+from scripts.services.service_locator import ServiceLocator
+from scripts.services.utility.time_service import TimeService
+
+
+class BankedFilter(Filter):
+    """
+    A filter whose state is a slot in a FilterBank. Can be used anywhere a Filter is, e.g. Movement.movement_filter.
+    Applying it only sets the filter's target, the filtered value is advanced by the bank once per fixed update, so the
+    smoothing doesn't depend on the framerate or on how many times the filter is applied.
+    """
+
+    def __init__(self, bank: "FilterBank", slot: int):
+        self.__bank = bank
+        self.__slot = slot
+
+        ## Frees the slot once the filter is garbage collected.
+        finalize(self, bank.remove, slot)
+
+
+    def apply(self, value: Vector2) -> Vector2:
+        self.__bank.target[self.__slot] = value
+        return self.get_value()
+
+
+    def get_value(self) -> Vector2:
+        return Vector2(*self.__bank.value[self.__slot])
+
+
+class FilterBank(ABC):
+    """
+    Holds the state of many filters of one type in NumPy arrays (one row per filter), and advances all of them at once
+    every fixed update (run by the GameObjectHandler, for every bank with filters, see get_banks). Filters are created
+    with create, which returns a BankedFilter.
+
+    Subclasses add any arrays their filters need with add_array, set a new filter's parameters in init_slot, and
+    advance every filter in step.
+    """
+
+    __INITIAL_CAPACITY = 16
+
+    ## Every bank that has created a filter, advanced by the GameObjectHandler. Weak, so a bank is dropped once it's no
+    ## longer used.
+    __banks: "WeakSet[FilterBank]" = WeakSet()
+
+    def __init__(self):
+
+        self.__time_service: TimeService = ServiceLocator.get(TimeService)
+
+        self.__capacity = self.__INITIAL_CAPACITY
+        self.__array_names: list[str] = []
+        self.__free_slots: list[int] = []
+        self.__slot_count = 0
+
+        ## The filtered value & the most recently applied value of each filter.
+        self.value: np.ndarray = self.add_array("value", (2,))
+        self.target: np.ndarray = self.add_array("target", (2,))
+
+
+    def add_array(self, name: str, shape: tuple[int, ...] = (), dtype: type = np.float64) -> np.ndarray:
+        """
+        Adds a per filter array to the bank, as an attribute. The array is reallocated as the bank grows.
+
+        Args:
+            name (str): The attribute name of the array.
+            shape (tuple[int, ...], optional): The shape of each filter's row. Defaults to (), a single value.
+            dtype (type, optional): The array's data type. Defaults to np.float64.
+
+        Returns:
+            np.ndarray: The array.
+        """
+
+        array = np.zeros((self.__capacity,) + shape, dtype=dtype)
+        setattr(self, name, array)
+        self.__array_names.append(name)
+
+        return array
+
+
+    def __grow(self):
+
+        self.__capacity *= 2
+
+        for array_name in self.__array_names:
+            array = getattr(self, array_name)
+            grown_array = np.zeros((self.__capacity,) + array.shape[1:], dtype=array.dtype)
+            grown_array[:len(array)] = array
+            setattr(self, array_name, grown_array)
+
+
+    def create(self, initial_value: Vector2, **params) -> BankedFilter:
+        """
+        Creates a new filter in the bank.
+
+        Args:
+            initial_value (Vector2): The filter's starting value.
+            **params: The filter's parameters, see the subclass's init_slot.
+
+        Returns:
+            BankedFilter: The filter.
+        """
+
+        if self.__free_slots:
+            slot = self.__free_slots.pop()
+
+        else:
+            if self.__slot_count == self.__capacity:
+                self.__grow()
+
+            slot = self.__slot_count
+            self.__slot_count += 1
+
+        self.value[slot] = initial_value
+        self.target[slot] = initial_value
+        self.init_slot(slot, **params)
+
+        FilterBank.__banks.add(self)
+
+        return BankedFilter(self, slot)
+
+
+    @classmethod
+    def get_banks(cls) -> list["FilterBank"]:
+        """
+        Gets every bank that has created a filter, & so needs advancing every fixed update.
+
+        Returns:
+            list[FilterBank]: The banks.
+        """
+        return list(cls.__banks)
+
+
+    def remove(self, slot: int):
+        self.__free_slots.append(slot)
+
+
+    def get_count(self) -> int:
+        return self.__slot_count - len(self.__free_slots)
+
+
+    def update(self):
+        """
+        Advances every filter in the bank by one fixed update.
+        """
+
+        if self.__slot_count:
+            self.step(self.__slot_count, self.__time_service.fixed_delta_time)
+
+
+    @abstractmethod
+    def init_slot(self, slot: int, **params):
+        """
+        Sets the state & parameters of a new filter.
+        """
+        pass
+
+
+    @abstractmethod
+    def step(self, count: int, delta_time: float):
+        """
+        Advances the first count filters by delta_time seconds, moving each value towards its target.
+        """
+        pass
@@ -1,6 +1,8 @@
+import numpy as np
 from pygame import Vector2
 
 from scripts.game.components.filters.filter import Filter
+from scripts.game.components.filters.filter_bank import FilterBank
 
 class LowPassFilter(Filter):
 
@@ -12,4 +14,24 @@ class LowPassFilter(Filter):
 
         self.filtered_value = (self.alpha * new_value) + (1.0 - self.alpha) * self.filtered_value
 
-        return self.filtered_value
\ No newline at end of file
+        return self.filtered_value
+
+
+class LowPassFilterBank(FilterBank):
+    """
+    Batched LowPassFilters, each moving alpha of the way towards its target every fixed update.
+
+    Filter parameters:
+        alpha (float): The fraction of the distance to the target moved each fixed update, from 0 to 1.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.alpha: np.ndarray = self.add_array("alpha")
+
+    def init_slot(self, slot: int, alpha: float = 0.1):
+        self.alpha[slot] = alpha
+
+    def step(self, count: int, delta_time: float):
+        value = self.value[:count]
+        value += (self.target[:count] - value) * self.alpha[:count, np.newaxis]
@@ -0,0 +1,73 @@
+from collections import deque
+
+import numpy as np
+from pygame import Vector2
+
+from scripts.game.components.filters.filter import Filter
+from scripts.game.components.filters.filter_bank import FilterBank
+
+
+class MovingAverageFilter(Filter):
+    """
+    The mean of the last window_size values applied. Smooths out jitter, lagging behind the target by about half the
+    window.
+    """
+
+    def __init__(self, window_size: int, initial_value: float | Vector2):
+        self.window_size = window_size
+
+        initial_value = self.__copy_value(initial_value)
+        self.__values = deque([initial_value] * window_size, maxlen=window_size)
+        self.__total = initial_value * window_size
+        self.filtered_value = initial_value
+
+    @staticmethod
+    def __copy_value(value: float | Vector2) -> float | Vector2:
+        """
+        Copies vectors, as callers may pass the same vector each time, changed in place (e.g. Movement.get_draw_pos).
+        """
+        return Vector2(value) if isinstance(value, Vector2) else value
+
+    def apply(self, new_value: float | Vector2) -> float | Vector2:
+
+        new_value = self.__copy_value(new_value)
+
+        self.__total = self.__total - self.__values[0] + new_value
+        self.__values.append(new_value)
+        self.filtered_value = self.__total / self.window_size
+
+        return self.filtered_value
+
+
+class MovingAverageFilterBank(FilterBank):
+    """
+    Batched MovingAverageFilters, each averaging its target over the last window_size fixed updates. Every filter in
+    the bank shares the same window size.
+    """
+
+    def __init__(self, window_size: int = 8):
+        super().__init__()
+        self.window_size = window_size
+        self.history: np.ndarray = self.add_array("history", (window_size, 2))
+        self.total: np.ndarray = self.add_array("total", (2,))
+
+        ## The history column overwritten by the next step, shared by every filter.
+        self.__history_index = 0
+
+    def init_slot(self, slot: int):
+        self.history[slot] = self.value[slot]
+        self.total[slot] = self.value[slot] * self.window_size
+
+    def step(self, count: int, delta_time: float):
+
+        history = self.history[:count, self.__history_index]
+        total = self.total[:count]
+        target = self.target[:count]
+
+        total -= history
+        history[:] = target
+        total += target
+
+        np.divide(total, self.window_size, out=self.value[:count])
+
+        self.__history_index = (self.__history_index + 1) % self.window_size
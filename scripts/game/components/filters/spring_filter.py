@@ -0,0 +1,76 @@
+from math import exp
+
+import numpy as np
+from pygame import Vector2
+
+from scripts.game.components.filters.filter import Filter
+from scripts.game.components.filters.filter_bank import FilterBank
+from scripts.services.service_locator import ServiceLocator
+from scripts.services.utility.time_service import TimeService
+
+
+class SpringFilter(Filter):
+    """
+    Critically damped spring. Follows the target as quickly as possible without overshooting, and unlike a low pass
+    filter, eases in as well as out when the target starts moving. Advanced by the time since the last frame each time
+    it's applied.
+    """
+
+    def __init__(self, frequency: float, initial_value: Vector2):
+        """
+        Args:
+            frequency (float): The spring's angular frequency. Higher is stiffer, roughly settling in 4 / frequency
+            seconds.
+            initial_value (Vector2): The starting value.
+        """
+        self.frequency = frequency
+        self.filtered_value = Vector2(initial_value)
+        self.velocity = Vector2(0, 0)
+
+        self.__time_service: TimeService = ServiceLocator.get(TimeService)
+
+    def apply(self, new_value: Vector2) -> Vector2:
+
+        delta_time = self.__time_service.elapsed_time / 1000.0
+
+        ## Exact solution of the critically damped spring over delta_time, so it's stable at any framerate.
+        decay = exp(-self.frequency * delta_time)
+        offset = self.filtered_value - new_value
+        change = (self.velocity + offset * self.frequency) * delta_time
+
+        self.velocity = (self.velocity - change * self.frequency) * decay
+        self.filtered_value = new_value + (offset + change) * decay
+
+        return self.filtered_value
+
+
+class SpringFilterBank(FilterBank):
+    """
+    Batched SpringFilters, advanced every fixed update.
+
+    Filter parameters:
+        frequency (float): The spring's angular frequency. Higher is stiffer, roughly settling in 4 / frequency seconds.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.frequency: np.ndarray = self.add_array("frequency")
+        self.velocity: np.ndarray = self.add_array("velocity", (2,))
+
+    def init_slot(self, slot: int, frequency: float = 10.0):
+        self.frequency[slot] = frequency
+        self.velocity[slot] = 0
+
+    def step(self, count: int, delta_time: float):
+
+        frequency = self.frequency[:count, np.newaxis]
+        value = self.value[:count]
+        velocity = self.velocity[:count]
+        target = self.target[:count]
+
+        decay = np.exp(-frequency * delta_time)
+        offset = value - target
+        change = (velocity + offset * frequency) * delta_time
+
+        velocity[:] = (velocity - change * frequency) * decay
+        value[:] = target + (offset + change) * decay
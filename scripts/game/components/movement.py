@@ -1,6 +1,7 @@
 from pygame import Vector2
 
 from scripts.game.components.filters.filter import Filter
+from scripts.game.components.movement_store import MovementStore
 from scripts.services.service_locator import ServiceLocator
 from scripts.services.utility.time_service import TimeService
 from scripts.utility.logger import Logger
@@ -20,6 +21,7 @@ class Movement:
         ALIGN_LEFT_KW: False}
 
     __ALIGNMENT_KW_DOES_NOT_EXIST = "Alignment '{align_kw}' does not exist."
+    __VELOCITY_NOT_STORED = "Velocity is only integrated for movements in a MovementStore. Velocity not set."
 
     def __init__(self,
                  pos: Vector2 | None = None,
@@ -27,6 +29,16 @@ class Movement:
                  point_of_origin_pixel_adjustment: Vector2 | None = None,
                  **point_of_origin_alignment_kwargs: bool):
 
+        ## If attached to a MovementStore, the position, previous position, dim & point of origin offset are kept in the
+        ## store's arrays at __slot instead, and this class is only a view of them (see attach_store).
+        self.__store: MovementStore | None = None
+        self.__slot: int = 0
+
+        ## The name the movement's object is tracked by & the set its name is added to whenever it changes, see
+        ## track_changes.
+        self.__tracked_name: str | None = None
+        self.__changed_names: set[str] | None = None
+
         self.__pos = Vector2(pos) if pos is not None else Vector2(0, 0)
         self.__previous_pos = Vector2(0, 0)
         self.__previous_pos = Vector2(self.__pos)
@@ -35,13 +47,137 @@ class Movement:
 
         self.__point_of_origin_adjustment = point_of_origin_pixel_adjustment
         self.__point_of_origin_alignment = self.DEFAULT_ALIGN_DICT.copy()
+
+        ## Offset from the position to the object's top left, from the dim, alignment & pixel adjustment. Recomputed
+        ## only when one of those changes, so adjusting a position is a single add.
+        self.__point_of_origin_offset = Vector2(0, 0)
         self.__pos_with_point_of_origin_adjustment = Vector2(self.__pos)
+
+        ## Reused by get_draw_pos, rather than allocating a new vector every frame.
+        self.__draw_pos = Vector2(0, 0)
+
         self.set_point_of_origin_alignment(**point_of_origin_alignment_kwargs)
 
         self.__time_service: TimeService = ServiceLocator.get(TimeService)
 
         self.movement_filter: Filter | None = None
 
+        ## Set whenever the position or bounds are changed through this class's setters (set_pos, move_pos, set_dim,
+        ## set_point_of_origin_alignment). Cleared by the GameObjectHandler once it has updated its indexes. Modifying
+        ## the vector returned by get_pos directly will NOT set this flag.
+        self.__pos_changed = False
+
+
+    @property
+    def pos_changed(self) -> bool:
+        if self.__store is not None:
+            return bool(self.__store.changed[self.__slot])
+
+        return self.__pos_changed
+
+
+    @pos_changed.setter
+    def pos_changed(self, pos_changed: bool):
+        if self.__store is not None:
+            self.__store.changed[self.__slot] = pos_changed
+
+        else:
+            self.__pos_changed = pos_changed
+
+        if pos_changed and self.__changed_names is not None:
+            self.__changed_names.add(self.__tracked_name)
+
+
+    def track_changes(self, name: str | None, changed_names: set[str] | None):
+        """
+        Adds a name to a set whenever the position or bounds change (i.e. whenever pos_changed is set), so the changes
+        can be found without checking every movement. Used by the GameObjectHandler to keep its indexes up to date.
+
+        Args:
+            name (str | None): The name added to the set. None to stop tracking.
+            changed_names (set[str] | None): The set. None to stop tracking.
+        """
+
+        self.__tracked_name = name
+        self.__changed_names = changed_names if name is not None else None
+
+
+    def attach_store(self, store: MovementStore):
+        """
+        Moves the movement's state into a slot of a MovementStore, so it's updated along with every other movement in
+        the store. While attached, get_pos & get_dim return copies, so modifying them has no effect.
+
+        Args:
+            store (MovementStore): The store.
+        """
+
+        if self.__store is not None:
+            self.detach_store()
+
+        slot = store.add(self)
+
+        store.pos[slot] = self.__pos
+        store.previous_pos[slot] = self.__previous_pos
+        store.dim[slot] = self.__dim
+        store.origin_offset[slot] = self.__point_of_origin_offset
+        store.changed[slot] = self.__pos_changed
+
+        self.__store = store
+        self.__slot = slot
+
+
+    def detach_store(self):
+        """
+        Moves the movement's state out of its MovementStore, back into this class.
+        """
+
+        if self.__store is None:
+            return
+
+        store = self.__store
+        slot = self.__slot
+
+        self.__pos = Vector2(*store.pos[slot])
+        self.__previous_pos = Vector2(*store.previous_pos[slot])
+        self.__dim = Vector2(*store.dim[slot])
+        self.__pos_changed = bool(store.changed[slot])
+        self.__pos_with_point_of_origin_adjustment = self.__get_pos_with_point_of_origin_adjustment(self.__pos)
+
+        store.remove(slot)
+        self.__store = None
+
+
+    def get_store(self) -> MovementStore | None:
+        return self.__store
+
+
+    def set_velocity(self, velocity: Vector2) -> bool:
+        """
+        Sets the velocity the object moves at, integrated every fixed update by its MovementStore. Only available while
+        attached to a store, otherwise use move_pos.
+
+        Args:
+            velocity (Vector2): The velocity of the object (pixels per second).
+
+        Returns:
+            bool: True if the velocity was set, False if the movement isn't attached to a store.
+        """
+
+        if self.__store is None:
+            Logger.log_warning(self.__VELOCITY_NOT_STORED)
+            return False
+
+        self.__store.velocity[self.__slot] = velocity
+        return True
+
+
+    def get_velocity(self) -> Vector2:
+
+        if self.__store is None:
+            return Vector2(0, 0)
+
+        return Vector2(*self.__store.velocity[self.__slot])
+
 
     def set_point_of_origin_alignment(self,
                                       pixel_adjustment: Vector2 | None = None,
@@ -56,17 +192,36 @@ class Movement:
                 else:
                     Logger.log_warning(self.__ALIGNMENT_KW_DOES_NOT_EXIST.format(align_kw=align_name))
 
+        self.__update_point_of_origin_offset()
         self.__pos_with_point_of_origin_adjustment = self.__get_pos_with_point_of_origin_adjustment(self.__pos)
+        self.__store_origin_offset()
+        self.pos_changed = True
+
+
+    def __store_origin_offset(self):
+        if self.__store is not None:
+            self.__store.origin_offset[self.__slot] = self.__point_of_origin_offset
 
 
     def set_dim(self, dim: Vector2):
-        if self.__dim != dim:
+        if self.get_dim() != dim:
             if not Logger.raise_incorrect_type(dim, Vector2):
                 self.__dim = Vector2(dim)
+                self.__update_point_of_origin_offset()
                 self.__pos_with_point_of_origin_adjustment = self.__get_pos_with_point_of_origin_adjustment(self.__pos)
 
+                if self.__store is not None:
+                    self.__store.dim[self.__slot] = self.__dim
+                    self.__store_origin_offset()
+
+                self.pos_changed = True
+
 
     def get_dim(self):
+
+        if self.__store is not None:
+            return Vector2(*self.__store.dim[self.__slot])
+
         return self.__dim
 
 
@@ -78,14 +233,25 @@ class Movement:
             pos (Vector2): The new position of the object.
         """
 
-        if pos != self.__pos:
+        if self.__store is not None:
+            if pos != self.get_pos():
+                self.__store.pos[self.__slot] = pos
+                self.pos_changed = True
+                return True
+
+        elif pos != self.__pos:
             self.__pos = Vector2(pos)
+            self.pos_changed = True
             return True
 
         return False
 
 
     def get_pos(self):
+
+        if self.__store is not None:
+            return Vector2(*self.__store.pos[self.__slot])
+
         return self.__pos
 
 
@@ -100,32 +266,63 @@ class Movement:
         """
 
         if velocity.length_squared() > 0:
-            self.__pos += velocity * self.__time_service.fixed_delta_time
+
+            if self.__store is not None:
+                self.__store.pos[self.__slot] += velocity * self.__time_service.fixed_delta_time
+
+            else:
+                self.__pos += velocity * self.__time_service.fixed_delta_time
+
+            self.pos_changed = True
             return True
 
         return False
 
 
-    def __get_pos_with_point_of_origin_adjustment(self, pos: Vector2) -> Vector2:
+    def __update_point_of_origin_offset(self):
 
-        new_pos = Vector2(pos) - Vector2(self.__dim.x / 2, self.__dim.y / 2)
+        offset_x = -self.__dim.x / 2
+        offset_y = -self.__dim.y / 2
 
         if self.__point_of_origin_alignment[self.ALIGN_TOP_KW]:
-            new_pos += Vector2(0, self.__dim.y / 2)
+            offset_y += self.__dim.y / 2
 
         if self.__point_of_origin_alignment[self.ALIGN_BOTTOM_KW]:
-            new_pos -= Vector2(0, self.__dim.y / 2)
+            offset_y -= self.__dim.y / 2
 
         if self.__point_of_origin_alignment[self.ALIGN_RIGHT_KW]:
-            new_pos -= Vector2(self.__dim.x / 2, 0)
+            offset_x -= self.__dim.x / 2
 
         if self.__point_of_origin_alignment[self.ALIGN_LEFT_KW]:
-            new_pos += Vector2(self.__dim.x / 2, 0)
+            offset_x += self.__dim.x / 2
 
         if self.__point_of_origin_adjustment:
-            new_pos += self.__point_of_origin_adjustment
+            offset_x += self.__point_of_origin_adjustment.x
+            offset_y += self.__point_of_origin_adjustment.y
+
+        self.__point_of_origin_offset.update(offset_x, offset_y)
+
+
+    def __get_pos_with_point_of_origin_adjustment(self, pos: Vector2) -> Vector2:
+        return pos + self.__point_of_origin_offset
+
+    def get_world_rect(self) -> tuple[float, float, float, float]:
+        """
+        Returns the bounds of the object in world space, taking into account the point of origin adjustment. Does not
+        take into account interpolation or the movement filter.
+
+        Returns:
+            tuple[float, float, float, float]: The bounds of the object (left, top, width, height).
+        """
+        if self.__store is not None:
+            left, top = self.__store.pos[self.__slot] + self.__store.origin_offset[self.__slot]
+            width, height = self.__store.dim[self.__slot]
+            return float(left), float(top), float(width), float(height)
+
+        top_left = self.__get_pos_with_point_of_origin_adjustment(self.__pos)
+
+        return top_left.x, top_left.y, self.__dim.x, self.__dim.y
 
-        return new_pos
 
     def apply_movement_filter(self, draw_pos: Vector2):
         """Apply filter to self.__pos every frame to smooth towards target."""
@@ -136,26 +333,54 @@ class Movement:
 
         return new_pos
 
+    def sync_previous_pos(self):
+        """
+        Sets the previous position to the current position, without resolving a draw position. Used for objects that
+        weren't drawn this frame, so they don't interpolate from a stale position once they are.
+        """
+        if self.__store is not None:
+            self.__store.previous_pos[self.__slot] = self.__store.pos[self.__slot]
+
+        elif self.__previous_pos != self.__pos:
+            self.__previous_pos.update(self.__pos)
+            self.__pos_with_point_of_origin_adjustment = self.__get_pos_with_point_of_origin_adjustment(self.__pos)
+
     def get_draw_pos(self) -> Vector2:
         """
         Returns the position to draw the object at. Takes into account interpolated time. ONLY RUN THIS METHOD ONCE PER
-        FRAME PER OBJECT, as it sets the objects previous position.
+        FRAME PER OBJECT, as it sets the objects previous position. For movements attached to a MovementStore, this is
+        the draw position computed for every object at once by MovementStore.update_draw_positions.
+
+        The returned vector is reused by the next call, so copy it if it needs to be kept.
 
         Returns:
             Vector2: The position to draw the object at.
         """
-        interpolated_time = max(0.0, min(1.0, self.__time_service.interpolated_time))
+        draw_pos = self.__draw_pos
 
-        if self.__previous_pos != self.__pos:
-            drawn_pos = self.__previous_pos + (self.__pos - self.__previous_pos) * interpolated_time
-            self.__previous_pos = Vector2(self.__pos)
+        if self.__store is not None:
+            draw_pos.update(*self.__store.draw_pos[self.__slot])
 
-            self.__pos_with_point_of_origin_adjustment = self.__get_pos_with_point_of_origin_adjustment(self.__pos)
+        elif self.__previous_pos != self.__pos:
+            interpolated_time = max(0.0, min(1.0, self.__time_service.interpolated_time))
 
-            return self.apply_movement_filter(self.__get_pos_with_point_of_origin_adjustment(drawn_pos))
+            pos = self.__pos
+            previous_pos = self.__previous_pos
+            offset = self.__point_of_origin_offset
+
+            draw_pos.update(previous_pos.x + (pos.x - previous_pos.x) * interpolated_time + offset.x,
+                            previous_pos.y + (pos.y - previous_pos.y) * interpolated_time + offset.y)
+
+            previous_pos.update(pos)
+            self.__pos_with_point_of_origin_adjustment.update(pos.x + offset.x, pos.y + offset.y)
 
         else:
-            return self.apply_movement_filter(self.__pos_with_point_of_origin_adjustment)
+            draw_pos.update(self.__pos_with_point_of_origin_adjustment)
+
+        if self.movement_filter:
+            return self.movement_filter.apply(draw_pos)
+
+        return draw_pos
 
 
 
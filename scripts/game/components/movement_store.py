@@ -0,0 +1,148 @@
+import numpy as np
+from scripts.services.service_locator import ServiceLocator
+from scripts.services.utility.time_service import TimeService
+
+
+class MovementStore:
+    """
+    Structure-of-arrays storage for many Movements. Each Movement attached to the store is a slot (row) in a set of
+    contiguous NumPy arrays, so velocity integration, interpolation & point of origin adjustment for every object run as
+    a few vectorised operations per frame, rather than one set of Vector2 operations per object.
+
+    The arrays are reallocated as the store grows, so don't hold references to them across frames.
+    """
+
+    __INITIAL_CAPACITY = 64
+
+    def __init__(self, capacity: int = __INITIAL_CAPACITY):
+
+        self.__time_service: TimeService = ServiceLocator.get(TimeService)
+
+        capacity = max(1, capacity)
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.previous_pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.dim = np.zeros((capacity, 2), dtype=np.float64)
+
+        ## Offset from a position to the top left of the object, from the point of origin alignment & adjustment.
+        self.origin_offset = np.zeros((capacity, 2), dtype=np.float64)
+
+        ## Pixels per second, integrated every fixed update by integrate.
+        self.velocity = np.zeros((capacity, 2), dtype=np.float64)
+
+        ## The top left position to draw each object at this frame, before the camera transform. Set by
+        ## update_draw_positions.
+        self.draw_pos = np.zeros((capacity, 2), dtype=np.float64)
+
+        ## Movement.pos_changed for each slot.
+        self.changed = np.zeros(capacity, dtype=bool)
+
+        self.__active = np.zeros(capacity, dtype=bool)
+        self.__free_slots: list[int] = []
+
+        ## The Movement viewing each slot, None for free slots. Movements moved by integrate are flagged through these.
+        self.__movements: list = [None] * capacity
+        self.__slot_count = 0
+
+
+    def __grow(self):
+
+        capacity = len(self.pos) * 2
+
+        for array_name in ("pos", "previous_pos", "dim", "origin_offset", "velocity", "draw_pos", "changed"):
+            array = getattr(self, array_name)
+            grown_array = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            grown_array[:len(array)] = array
+            setattr(self, array_name, grown_array)
+
+        grown_active = np.zeros(capacity, dtype=bool)
+        grown_active[:len(self.__active)] = self.__active
+        self.__active = grown_active
+
+        self.__movements.extend([None] * (capacity - len(self.__movements)))
+
+
+    def add(self, movement) -> int:
+        """
+        Allocates a slot, with every value zeroed.
+
+        Args:
+            movement (Movement): The movement viewing the slot.
+
+        Returns:
+            int: The slot.
+        """
+
+        if self.__free_slots:
+            slot = self.__free_slots.pop()
+
+        else:
+            if self.__slot_count == len(self.pos):
+                self.__grow()
+
+            slot = self.__slot_count
+            self.__slot_count += 1
+
+        self.pos[slot] = 0
+        self.previous_pos[slot] = 0
+        self.dim[slot] = 0
+        self.origin_offset[slot] = 0
+        self.velocity[slot] = 0
+        self.draw_pos[slot] = 0
+        self.changed[slot] = False
+        self.__active[slot] = True
+        self.__movements[slot] = movement
+
+        return slot
+
+
+    def remove(self, slot: int):
+        self.__active[slot] = False
+        self.velocity[slot] = 0
+        self.__movements[slot] = None
+        self.__free_slots.append(slot)
+
+
+    def get_count(self) -> int:
+        return self.__slot_count - len(self.__free_slots)
+
+
+    def integrate(self):
+        """
+        Moves every object with a velocity by one fixed update. Run every fixed update by the GameObjectHandler.
+        """
+
+        count = self.__slot_count
+        velocity = self.velocity[:count]
+
+        ## Removed slots have their velocity zeroed, so are never moving.
+        moving = velocity.any(axis=1)
+
+        if moving.any():
+            self.pos[:count][moving] += velocity[moving] * self.__time_service.fixed_delta_time
+
+            ## Flagged through each movement, so its change is tracked (see Movement.track_changes).
+            movements = self.__movements
+
+            for slot in np.flatnonzero(moving).tolist():
+                movements[slot].pos_changed = True
+
+
+    def update_draw_positions(self):
+        """
+        Sets the draw position of every object from its interpolated position & point of origin offset, then sets every
+        previous position to the current position. Run once per frame by the GameObjectHandler, before drawing.
+        """
+
+        count = self.__slot_count
+        interpolated_time = max(0.0, min(1.0, self.__time_service.interpolated_time))
+
+        pos = self.pos[:count]
+        previous_pos = self.previous_pos[:count]
+
+        np.subtract(pos, previous_pos, out=self.draw_pos[:count])
+        self.draw_pos[:count] *= interpolated_time
+        self.draw_pos[:count] += previous_pos
+        self.draw_pos[:count] += self.origin_offset[:count]
+
+        previous_pos[:] = pos
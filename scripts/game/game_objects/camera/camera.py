@@ -10,9 +10,11 @@ look at the README.md file in the root directory, or visit the
 GitHub Repo: https://github.com/karkin2002/Arctic-Engine.
 """
 
+import numpy as np
 from pygame import Vector2
 from scripts.services.service_locator import ServiceLocator
 from scripts.services.utility.time_service import TimeService
+from scripts.services.visual.scaled_surface_service import ScaledSurfaceService
 from scripts.game.game_objects.game_object import GameObject
 
 
@@ -23,31 +25,106 @@ class Camera(GameObject):
 
     __LOW_PASS_FILTER_ALPHA = 0.1
 
+    ## How long (ms) the scale must stay the same before the zoom is considered settled.
+    __ZOOM_SETTLE_MS = 150
+
     def __init__(self,
             pos: Vector2 = Vector2(0, 0),
             scale: float = 1):
 
         super().__init__(pos = pos, display=False)
 
-        ## The implementation for scale is currently not implemented. The general structure for it is in place, but it's
-        ## full implementation was never fleshed out.
-        ##
-        ## Idea: Camera obj stores a scale value. gameObjects scale based on the camera's scale value. When the scale
-        ## changes or new object comes into view, we can cache their scaled up surface (caching could be preformed on a
-        ## separate thread to reduce workload). This would additionally require chunking the map, so that only visible
-        ## segments would be loaded / visible.
-        ##
-        ## This feature will be revisited at a later date, for now I will work on something else...
+        ## The camera's zoom. Game objects are drawn with their surfaces scaled through the ScaledSurfaceService, which
+        ## caches a scaled copy per surface & quantized scale. The scale used to draw is quantized the same way, so
+        ## surfaces & positions always agree.
         self.scale = scale
 
         self.time_service: TimeService = ServiceLocator.get(TimeService)
 
-    def world_to_screen(self, world_pos: Vector2, window_center: Vector2):
-        filtered_pos = self.move.apply_movement_filter(self.move.get_pos())
+        ## Measured in frame time rather than wall clock time, so zooming behaves the same when frame time is fixed.
+        self.__zoom_changed_ms = self.time_service.total_time_ms
+
+        ## The camera's transform for the current frame, set once per frame by update_transform: its position after the
+        ## movement filter was applied, and its scale.
+        self.__filtered_pos = Vector2(self.move.get_pos())
+        self.__transform_scale = scale
+
+    def update_transform(self):
+        """
+        Advances the camera's movement filter & caches its position and scale for this frame. Run once per frame by the
+        GameObjectHandler before drawing, so every object drawn that frame is transformed the same way.
+        """
+        self.__filtered_pos = Vector2(self.move.apply_movement_filter(self.move.get_pos()))
+
+        transform_scale = self.scale
+        if ServiceLocator.is_registered(ScaledSurfaceService):
+            transform_scale = ServiceLocator.get(ScaledSurfaceService).quantize_scale(transform_scale)
+
+        if transform_scale != self.__transform_scale:
+            self.__transform_scale = transform_scale
+            self.__zoom_changed_ms = self.time_service.total_time_ms
+
+    def get_transform_scale(self) -> float:
+        """
+        Returns the scale objects are drawn at this frame, as cached by update_transform.
+        """
+        return self.__transform_scale
+
+    def is_zoom_settled(self) -> bool:
+        """
+        Returns whether the scale has stayed the same for a short time, i.e. the camera is no longer zooming.
+        """
+        return self.time_service.total_time_ms - self.__zoom_changed_ms >= self.__ZOOM_SETTLE_MS
+
+    def world_to_screen(self, world_pos: Vector2, window_center: Vector2) -> Vector2:
+        """
+        Transforms a world position to a screen position, using the transform cached by update_transform.
+
+        Args:
+            world_pos (Vector2): The world position.
+            window_center (Vector2): The center of the window.
+
+        Returns:
+            Vector2: The screen position.
+        """
+        scale = self.__transform_scale
+
+        return Vector2(window_center.x + (world_pos.x - self.__filtered_pos.x) * scale,
+                       window_center.y + (world_pos.y - self.__filtered_pos.y) * scale)
+
+    def world_to_screen_many(self, world_positions: np.ndarray, window_center: Vector2) -> np.ndarray:
+        """
+        Transforms many world positions to screen positions at once, using the transform cached by update_transform.
+
+        Args:
+            world_positions (np.ndarray): The world positions, an array of shape (n, 2).
+            window_center (Vector2): The center of the window.
+
+        Returns:
+            np.ndarray: The screen positions, an array of shape (n, 2).
+        """
+        scale = self.__transform_scale
+
+        return (world_positions - (self.__filtered_pos.x, self.__filtered_pos.y)) * scale + (window_center.x,
+                                                                                             window_center.y)
+
+    def get_view_rect(self, window_dim: Vector2) -> tuple[float, float, float, float]:
+        """
+        Returns the area of the world visible to the camera, based on the transform cached by update_transform.
+
+        Args:
+            window_dim (Vector2): The dimensions of the window.
 
-        relative = (world_pos - filtered_pos) * self.scale
+        Returns:
+            tuple[float, float, float, float]: The visible area in world space (left, top, width, height).
+        """
+        view_width = window_dim.x / self.__transform_scale
+        view_height = window_dim.y / self.__transform_scale
 
-        return window_center + relative
+        return (self.__filtered_pos.x - view_width / 2,
+                self.__filtered_pos.y - view_height / 2,
+                view_width,
+                view_height)
 
     def adjust_scale(self, scale: float):
         new_scale = self.scale + (scale * self.time_service.elapsed_time)
@@ -0,0 +1,160 @@
+from bisect import insort
+from typing import Iterator
+from scripts.game.game_objects.game_object import GameObject
+
+
+class DrawOrderIndex:
+    """
+    Maintains the order game objects are drawn in. Objects are bucketed by their draw_order, and each bucket is kept
+    sorted by the object's y position (objects further down are drawn on top). Rather than sorting every object every
+    frame, a bucket is only re-sorted when one of its objects has moved, which for a mostly sorted list is close to
+    linear.
+    """
+
+    def __init__(self):
+
+        ## Each entry is (name, game_object, insertion_sequence). The insertion sequence breaks ties between objects
+        ## sharing the same y position, so that they keep the order they were added in.
+        self.__buckets: dict[int, list[tuple[str, GameObject, int]]] = {}
+        self.__bucket_keys: list[int] = []
+
+        self.__entries: dict[str, tuple[str, GameObject, int]] = {}
+        self.__entry_bucket: dict[str, int] = {}
+
+        self.__sequence = 0
+
+
+    @staticmethod
+    def __y_key(entry: tuple[str, GameObject, int]) -> tuple[float, int]:
+        return entry[1].move.get_pos().y, entry[2]
+
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+
+    def __iter__(self) -> Iterator[tuple[str, GameObject]]:
+        """
+        Iterates over all game objects in draw order.
+
+        Returns:
+            Iterator[tuple[str, GameObject]]: (name, game object) pairs in the order they should be drawn.
+        """
+
+        for draw_order in self.__bucket_keys:
+            for name, game_obj, _ in self.__buckets[draw_order]:
+                yield name, game_obj
+
+
+    def __insert_entry(self, entry: tuple[str, GameObject, int]):
+
+        draw_order = entry[1].draw_order
+
+        if draw_order not in self.__buckets:
+            self.__buckets[draw_order] = []
+            insort(self.__bucket_keys, draw_order)
+
+        insort(self.__buckets[draw_order], entry, key=self.__y_key)
+        self.__entry_bucket[entry[0]] = draw_order
+
+
+    def __remove_entry(self, entry: tuple[str, GameObject, int]):
+
+        draw_order = self.__entry_bucket.pop(entry[0])
+        bucket = self.__buckets[draw_order]
+        bucket.remove(entry)
+
+        if not bucket:
+            del self.__buckets[draw_order]
+            self.__bucket_keys.remove(draw_order)
+
+
+    def add(self, name: str, game_object: GameObject):
+        """
+        Adds a game object to the index. If the name is already indexed, the previous object is replaced.
+
+        Args:
+            name (str): The name of the game object.
+            game_object (GameObject): The game object.
+        """
+
+        if name in self.__entries:
+            self.remove(name)
+
+        entry = (name, game_object, self.__sequence)
+        self.__sequence += 1
+
+        self.__entries[name] = entry
+        self.__insert_entry(entry)
+
+
+    def remove(self, name: str):
+        """
+        Removes a game object from the index.
+
+        Args:
+            name (str): The name of the game object.
+        """
+
+        entry = self.__entries.pop(name, None)
+
+        if entry is not None:
+            self.__remove_entry(entry)
+
+
+    def sort_key(self, name: str) -> tuple[int, float, int]:
+        """
+        Returns the key the index orders a game object by, allowing a subset of game objects to be sorted into the same
+        order as the index.
+
+        Args:
+            name (str): The name of the game object.
+
+        Returns:
+            tuple[int, float, int]: (draw_order, y position, insertion sequence).
+        """
+
+        entry = self.__entries[name]
+        return entry[1].draw_order, entry[1].move.get_pos().y, entry[2]
+
+
+    def refresh(self, changed_names: set[str]) -> list[str]:
+        """
+        Repairs the index for the objects whose draw_order or position has changed (see GameObject.track_changes).
+        Objects whose draw_order has changed are moved to their new bucket, and any other bucket containing a changed
+        object is re-sorted. Only the changed objects are visited. Should be run once per frame before iterating.
+
+        Args:
+            changed_names (set[str]): The names of the changed objects. Names no longer indexed are ignored.
+
+        Returns:
+            list[str]: The names of the changed objects that are indexed.
+        """
+
+        changed: list[str] = []
+        misplaced: list[tuple[str, GameObject, int]] = []
+        dirty_draw_orders: set[int] = set()
+
+        for name in changed_names:
+            entry = self.__entries.get(name)
+
+            if entry is None:
+                continue
+
+            changed.append(name)
+            draw_order = self.__entry_bucket[name]
+
+            if entry[1].draw_order != draw_order:
+                misplaced.append(entry)
+
+            else:
+                dirty_draw_orders.add(draw_order)
+
+        for draw_order in dirty_draw_orders:
+            self.__buckets[draw_order].sort(key=self.__y_key)
+
+        for entry in misplaced:
+            self.__remove_entry(entry)
+            self.__insert_entry(entry)
+
+        return changed
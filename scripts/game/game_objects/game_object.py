@@ -1,4 +1,4 @@
-from pygame import Surface, Vector2
+from pygame import Rect, Surface, Vector2
 from scripts.game.components.movement import Movement
 from scripts.game.components.tag_handler import TagHandler
 from scripts.services.visual.colour_service import ColourService
@@ -9,6 +9,9 @@ class GameObject:
 
     comp_num = 0
 
+    ## If True, the object is drawn with draw_chunks instead of draw, for objects too large to draw as one surface.
+    chunked = False
+
     __default_surface = Surface((20, 20))
     __default_surface.fill(ColourService.ERROR_COLOUR_VALUE)
 
@@ -21,12 +24,60 @@ class GameObject:
         self.ident = ident
         self.move = Movement(pos, dim)
         self.display = display
+
+        ## The name the object is tracked by & the set its name is added to whenever its draw order or position
+        ## changes, see track_changes.
+        self.__tracked_name: str | None = None
+        self.__changed_names: set[str] | None = None
+
         self.draw_order = 0
         self.tag = TagHandler()
         self.delete: bool = False
 
+        ## The GameObjectPool the object was taken from, if any. Pooled objects are returned to their pool instead of
+        ## being discarded once deleted.
+        self.pool = None
+
         GameObject.comp_num += 1
 
+    @property
+    def draw_order(self) -> int:
+        return self.__draw_order
+
+    @draw_order.setter
+    def draw_order(self, draw_order: int):
+        self.__draw_order = draw_order
+
+        if self.__changed_names is not None:
+            self.__changed_names.add(self.__tracked_name)
+
+    def track_changes(self, name: str | None, changed_names: set[str] | None):
+        """
+        Adds a name to a set whenever the object's draw order or position changes, so the GameObjectHandler can update
+        its indexes without checking every object.
+
+        Args:
+            name (str | None): The name added to the set. None to stop tracking.
+            changed_names (set[str] | None): The set. None to stop tracking.
+        """
+        self.__tracked_name = name
+        self.__changed_names = changed_names if name is not None else None
+        self.move.track_changes(name, changed_names)
+
+    def reset(self, pos: Vector2 | None = None):
+        """
+        Re-initialises a game object taken from a pool, so it can be reused. Subclasses should extend this to reset any
+        of their own state.
+
+        Args:
+            pos (Vector2 | None): The position to place the object at. Defaults to None, leaving the position as is.
+        """
+        self.delete = False
+
+        if pos is not None:
+            self.move.set_pos(pos)
+            self.move.sync_previous_pos()
+
     def update(self):
         """
         Updates the game object every frame. By default, this method has no implementation.
@@ -37,4 +88,29 @@ class GameObject:
         """
         Draws the game object. By default, this method has no implementation.
         """
-        return self.__default_surface
\ No newline at end of file
+        return self.__default_surface
+
+    def draw_chunks(self, draw_pos: Vector2, view_dim: Vector2) -> list[tuple[Surface, tuple[int, int]]]:
+        """
+        Draws only the visible parts of the game object, used instead of draw when chunked is True. By default, this
+        method has no implementation.
+
+        Args:
+            draw_pos (Vector2): The screen position of the object's top left corner.
+            view_dim (Vector2): The dimensions of the screen.
+
+        Returns:
+            list[tuple[Surface, tuple[int, int]]]: The surfaces to draw and the screen positions to draw them at.
+        """
+        return []
+
+    def get_redrawn_rects(self) -> list[Rect]:
+        """
+        Gets the areas of the surfaces returned by the last draw_chunks call that were drawn to in place, since they
+        were last returned. Used in dirty rect mode, where a surface drawn at the same position isn't redrawn otherwise.
+        By default, nothing is redrawn in place.
+
+        Returns:
+            list[Rect]: The redrawn areas, relative to the object's top left, in unscaled pixels.
+        """
+        return []
\ No newline at end of file
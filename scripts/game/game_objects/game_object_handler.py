@@ -1,10 +1,17 @@
-from pygame import Vector2
-from collections import OrderedDict
+from math import ceil
+from time import perf_counter_ns
+from pygame import Rect, Surface, Vector2
 from scripts.utility.logger import Logger
+from scripts.game.components.movement_store import MovementStore
+from scripts.game.components.filters.filter_bank import FilterBank
 from scripts.game.game_objects.camera.camera import Camera
 from scripts.game.game_objects.game_object import GameObject
+from scripts.game.game_objects.draw_order_index import DrawOrderIndex
+from scripts.game.game_objects.spatial_index import SpatialIndex
 from scripts.services.service_locator import ServiceLocator
+from scripts.services.utility.profiler_service import ProfilerService
 from scripts.services.utility.window_service import WindowService
+from scripts.services.visual.scaled_surface_service import ScaledSurfaceService
 
 
 class GameObjectHandler:
@@ -20,12 +27,69 @@ class GameObjectHandler:
     __CAMERA_SET_NONE_TEXT = "Camera has been unset."
     __CAMERA_SET_TEXT = "Camera has been set to '{camera_ident}'."
 
-    def __init__(self):
+    ## Padding (px) added around the camera's view when culling, so objects whose drawn position lags behind their
+    ## world position (interpolation or a movement filter) aren't culled early.
+    __VIEW_PADDING = 64
+
+    ## If fewer than 1 / __SORT_CANDIDATES_RATIO game objects are candidates for drawing, the candidates are sorted
+    ## directly. Otherwise, the draw order index is walked, skipping any non-candidates.
+    __SORT_CANDIDATES_RATIO = 8
+
+    ## In dirty rect mode, if more than this many areas changed in a frame, the whole window is redrawn instead.
+    __MAX_DIRTY_RECTS = 128
+
+    def __init__(self, spatial_index_cell_size: int = 128, use_movement_store: bool = False):
+        """
+        Args:
+            spatial_index_cell_size (int, optional): The cell size (px) of the spatial index used for culling. Defaults
+            to 128.
+            use_movement_store (bool, optional): If True, the movement of every game object added is kept in a shared
+            MovementStore, so interpolation & velocity integration run for all objects at once. Worthwhile for scenes
+            with many moving objects. Defaults to False.
+        """
 
         self.__game_objects: dict[str, GameObject] = {}
 
+        self.__movement_store = MovementStore() if use_movement_store else None
+
+        ## Draw order is maintained incrementally, instead of sorting every game object every frame.
+        self.__draw_order_index = DrawOrderIndex()
+
+        ## Grid of game object bounds in world space, used to cull objects outside the camera's view.
+        self.__spatial_index = SpatialIndex(spatial_index_cell_size)
+
+        ## Names of the game objects whose position or draw order has changed since the indexes were last refreshed.
+        ## Game objects add their own names as they change (see GameObject.track_changes), so refreshing the indexes
+        ## only visits the objects that changed.
+        self.__changed: set[str] = set()
+
+        ## Game objects that have moved since the last draw. Used to keep the interpolation state of moved objects that
+        ## were culled (and so never had their draw position resolved) up to date.
+        self.__moved_since_draw: set[str] = set()
+
+        ## How each game object that hasn't moved was last drawn, as (draw position, whether on screen, blit pair), by
+        ## name. Reused while the camera's view is unchanged, rather than resolving the object's draw position, on
+        ## screen check & blit pair again every frame. Objects are dropped once they move, & every object whenever the
+        ## view changes. Like the indexes, this relies on objects being moved through Movement's setters, so can be
+        ## turned off with reuse_static_draws for objects moved by modifying their position vectors directly.
+        self.reuse_static_draws = True
+        self.__static_draws: dict[str, tuple[Vector2, bool, tuple[Surface, tuple[int, int]] | None]] = {}
+        self.__static_draws_view: tuple | None = None
+
         self.__window_service = ServiceLocator.get(WindowService)
 
+        self.__profiler: ProfilerService | None = None
+        if ServiceLocator.is_registered(ProfilerService):
+            self.__profiler = ServiceLocator.get(ProfilerService)
+
+        ## Dirty rect mode state (see WindowService.dirty_rect_mode). What each game object drew last frame, as its
+        ## (surface, position) pairs, and the camera's view it was drawn with. Objects whose pairs change are redrawn,
+        ## along with anything they overlap. Objects also report the areas of surfaces they redrew in place (see
+        ## GameObject.get_redrawn_rects), which can't be detected from their pairs.
+        self.__drawn_blits: dict[str, tuple[tuple[Surface, tuple[int, int]], ...]] = {}
+        self.__drawn_view: tuple | None = None
+        self.__marked_dirty: set[str] = set()
+
         ## Camera
         # Setting camera to the identifier for a Camera object stored in the __game_objects dictionary, applies those
         # camera's modifiers to the screen / __game_objects (e.g. move everything to the left, the center is the center
@@ -40,7 +104,7 @@ class GameObjectHandler:
     def add(self, name: str, new_game_object: GameObject, safety_check: bool = True):
 
         if safety_check:
-            if new_game_object in self.__game_objects:
+            if name in self.__game_objects:
                 Logger.log_warning(self.__GAME_OBJECT_REPLACED.format(
                     game_object_name = name,
                     pre_game_object = self.__game_objects[name],
@@ -49,7 +113,25 @@ class GameObjectHandler:
             else:
                 Logger.log_info(self.__GAME_OBJECT_ADDED.format(game_object_name = name, game_object = new_game_object))
 
+        if name in self.__game_objects:
+            replaced_game_object = self.__detach(name)
+
+            if replaced_game_object is not new_game_object:
+                self.__release(replaced_game_object)
+
+        self.__static_draws.pop(name, None)
+
+        if self.__movement_store is not None:
+            new_game_object.move.attach_store(self.__movement_store)
+
         self.__game_objects[name] = new_game_object
+        self.__draw_order_index.add(name, new_game_object)
+        self.__spatial_index.insert(name, new_game_object.move.get_world_rect())
+
+        new_game_object.track_changes(name, self.__changed)
+
+        if new_game_object.move.pos_changed:
+            self.__changed.add(name)
 
 
     def get(self, name: str, safety_check: bool = True) -> GameObject | None:
@@ -66,10 +148,48 @@ class GameObjectHandler:
 
 
 
+    def exists(self, name: str) -> bool:
+        return name in self.__game_objects
+
+
+    def __detach(self, name: str) -> GameObject:
+        """
+        Removes a game object from the handler & its indexes.
+        """
+
+        game_obj = self.__game_objects.pop(name)
+        game_obj.track_changes(None, None)
+        self.__changed.discard(name)
+        game_obj.move.detach_store()
+        self.__draw_order_index.remove(name)
+        self.__spatial_index.remove(name)
+
+        return game_obj
+
+
+    @staticmethod
+    def __release(game_obj: GameObject):
+        """
+        Returns a pooled game object to its pool to be reused, rather than discarded.
+        """
+
+        if game_obj.pool is not None:
+            game_obj.pool.release(game_obj)
+
+
     def remove(self, name: str, safety_check: bool = True) -> GameObject | None:
+        """
+        Removes a game object. Objects taken from a GameObjectPool are returned to it, so shouldn't be used after being
+        removed.
+
+        Args:
+            name (str): The name of the game object.
+            safety_check (bool): If True, a missing game object is logged rather than raising a KeyError. Defaults to
+            True.
+        """
 
         if not safety_check:
-            del self.__game_objects[name]
+            self.__release(self.__detach(name))
 
         elif not Logger.raise_key_error(
                 self.__game_objects,
@@ -77,7 +197,7 @@ class GameObjectHandler:
                 self.__GAME_OBJECT_DOES_NOT_EXIST.format(game_object_name = name),
                 False):
 
-            del self.__game_objects[name]
+            self.__release(self.__detach(name))
 
             Logger.log_info(self.__GAME_OBJECT_REMOVED.format(game_object_name = name))
 
@@ -126,47 +246,437 @@ class GameObjectHandler:
             return game_object.move.get_draw_pos() + self.__window_service.center
 
 
+    def __is_on_screen(self, draw_pos: Vector2, dim: Vector2) -> bool:
+
+        return not (draw_pos.x + dim.x < 0 or
+                    draw_pos.x > self.__window_service.dim.x or
+                    draw_pos.y + dim.y < 0 or
+                    draw_pos.y > self.__window_service.dim.y)
+
+
     def is_visible(self, name: str, safety_check = True) -> bool:
+        """
+        Checks whether a game object's bounds are within the camera's view. Uses the object's world position, so
+        doesn't take into account interpolation or movement filters, but unlike drawing it does not modify the object's
+        movement state, so can be called any number of times per frame.
+        """
 
         game_obj = self.get(name, safety_check)
 
         if game_obj is None or not game_obj.display:
             return False
 
-        draw_pos = self.__get_draw_pos(game_obj)
+        obj_left, obj_top, obj_width, obj_height = game_obj.move.get_world_rect()
+        view_left, view_top, view_width, view_height = self.__get_view_rect(0)
+
+        return not (obj_left + obj_width < view_left or
+                    obj_left > view_left + view_width or
+                    obj_top + obj_height < view_top or
+                    obj_top > view_top + view_height)
+
+
+    def __refresh_indexes(self):
+        """
+        Repairs the handler's indexes for any game objects that have moved or changed draw order since the last frame,
+        then clears the objects' moved flags.
+        """
+
+        moved = self.__draw_order_index.refresh(self.__changed)
 
-        obj_left = draw_pos.x
-        obj_top = draw_pos.y
-        obj_right = obj_left + game_obj.move.get_dim().x
-        obj_bottom = obj_top + game_obj.move.get_dim().y
+        ## Cleared in place, as the game objects hold a reference to the set.
+        self.__changed.clear()
 
-        win_left = 0
-        win_top = 0
-        win_right = self.__window_service.dim.x
-        win_bottom = self.__window_service.dim.y
+        for game_obj_ident in moved:
+            game_obj = self.__game_objects[game_obj_ident]
 
-        return not (obj_right < win_left or
-                    obj_left > win_right or
-                    obj_bottom < win_top or
-                    obj_top > win_bottom)
+            self.__spatial_index.insert(game_obj_ident, game_obj.move.get_world_rect())
+            self.__static_draws.pop(game_obj_ident, None)
+            game_obj.move.pos_changed = False
 
+        self.__moved_since_draw.update(moved)
 
-    def draw_game_objects_to_window(self):
 
-        sorted_game_objects = OrderedDict(sorted(self.__game_objects.items(), key=lambda item: item[1].move.get_pos().y))
-        sorted_game_objects = OrderedDict(sorted(sorted_game_objects.items(), key=lambda item: item[1].draw_order))
+    def refresh_indexes(self):
+        """
+        Updates the draw order & spatial indexes with any changes since they were last refreshed. This is done
+        automatically at the start of every draw, so only needs to be called if queries need to reflect movement made
+        earlier in the same frame.
+        """
+
+        self.__refresh_indexes()
+
+
+    def get_in_rect(self, rect: tuple[float, float, float, float]) -> dict[str, GameObject]:
+        """
+        Gets all game objects whose bounds overlap an area of the world. Positions are as of the last index refresh.
+
+        Args:
+            rect (tuple[float, float, float, float]): The area in world space (left, top, width, height).
+
+        Returns:
+            dict[str, GameObject]: The overlapping game objects.
+        """
+
+        return {name: self.__game_objects[name] for name in self.__spatial_index.query_rect(rect)}
+
+
+    def get_near_point(self, point: Vector2 | tuple[float, float], radius: float = 0) -> dict[str, GameObject]:
+        """
+        Gets all game objects whose bounds are within a radius of a point in the world. Positions are as of the last
+        index refresh.
+
+        Args:
+            point (Vector2 | tuple[float, float]): The point in world space.
+            radius (float): The distance from the point to search. Defaults to 0.
+
+        Returns:
+            dict[str, GameObject]: The game objects near the point.
+        """
+
+        return {name: self.__game_objects[name] for name in self.__spatial_index.query_point(point, radius)}
+
+
+    def __get_view_rect(self, padding: float = __VIEW_PADDING) -> tuple[float, float, float, float]:
+
+        camera = self.get_camera()
+
+        if camera:
+            left, top, width, height = camera.get_view_rect(self.__window_service.dim)
+        else:
+            left, top = -self.__window_service.center
+            width, height = self.__window_service.dim
+
+        return left - padding, top - padding, width + padding * 2, height + padding * 2
+
+
+    def __get_draw_candidates(self):
+        """
+        Yields the game objects near the camera's view, in draw order.
+        """
 
-        for game_obj_ident, game_obj in sorted_game_objects.items():
+        candidates = self.__spatial_index.get_candidates(self.__get_view_rect())
 
-            if game_obj.display and self.is_visible(game_obj_ident, False):
+        if len(candidates) * self.__SORT_CANDIDATES_RATIO < len(self.__draw_order_index):
+            for game_obj_ident in sorted(candidates, key=self.__draw_order_index.sort_key):
+                yield game_obj_ident, self.__game_objects[game_obj_ident]
 
-                comp_surf = game_obj.draw()
+        else:
+            for game_obj_ident, game_obj in self.__draw_order_index:
+                if game_obj_ident in candidates:
+                    yield game_obj_ident, game_obj
+
+
+    def get_movement_store(self) -> MovementStore | None:
+        return self.__movement_store
 
-                if comp_surf is not None and game_obj_ident != self.__camera:
 
-                    draw_pos = self.__get_draw_pos(game_obj)
+    def mark_dirty(self, name: str):
+        """
+        In dirty rect mode, forces a game object to be redrawn next frame. Only needed for objects that draw to the same
+        surface in place without reporting it through GameObject.get_redrawn_rects, as changes to an object's position,
+        surface or visibility are detected automatically.
+
+        Args:
+            name (str): The name of the game object.
+        """
+        self.__marked_dirty.add(name)
 
-                    self.__window_service.win.blit(comp_surf, (int(draw_pos.x), int(draw_pos.y)))
+
+    def redraw_all(self):
+        """
+        In dirty rect mode, forces the whole window to be redrawn next frame, e.g. after drawing over it elsewhere.
+        """
+        self.__drawn_view = None
+
+
+    @staticmethod
+    def __get_blits_rect(blits: tuple[tuple[Surface, tuple[int, int]], ...]) -> Rect:
+        rect = Rect(blits[0][1], blits[0][0].get_size())
+
+        for surf, pos in blits[1:]:
+            rect.union_ip(Rect(pos, surf.get_size()))
+
+        return rect
+
+
+    def __get_dirty_rects(self,
+                          drawn_blits: dict[str, tuple[tuple[Surface, tuple[int, int]], ...]],
+                          redrawn_rects: list[Rect]) -> list[Rect]:
+        """
+        Gets the areas of the window that changed since last frame, merged so none overlap.
+        """
+
+        dirty_rects: list[Rect] = list(redrawn_rects)
+
+        for game_obj_ident, blits in drawn_blits.items():
+            previous_blits = self.__drawn_blits.get(game_obj_ident)
+
+            if blits != previous_blits or game_obj_ident in self.__marked_dirty:
+                dirty_rects.append(self.__get_blits_rect(blits))
+
+                if previous_blits:
+                    dirty_rects.append(self.__get_blits_rect(previous_blits))
+
+        for game_obj_ident, previous_blits in self.__drawn_blits.items():
+            if game_obj_ident not in drawn_blits:
+                dirty_rects.append(self.__get_blits_rect(previous_blits))
+
+        if len(dirty_rects) > self.__MAX_DIRTY_RECTS:
+            return [self.__window_service.win.get_rect()]
+
+        window_rect = self.__window_service.win.get_rect()
+        merged_rects: list[Rect] = []
+
+        for rect in dirty_rects:
+            rect = rect.clip(window_rect)
+
+            if not rect.width or not rect.height:
+                continue
+
+            overlap_index = rect.collidelist(merged_rects)
+
+            while overlap_index != -1:
+                rect.union_ip(merged_rects.pop(overlap_index))
+                overlap_index = rect.collidelist(merged_rects)
+
+            merged_rects.append(rect)
+
+        return merged_rects
+
+
+    def __draw_dirty(self,
+                     blit_sequence: list[tuple[Surface, tuple[int, int]]],
+                     drawn_blits: dict[str, tuple[tuple[Surface, tuple[int, int]], ...]],
+                     redrawn_rects: list[Rect],
+                     view: tuple) -> list[Rect] | None:
+        """
+        Redraws only the areas of the window that changed since last frame. Returns the areas redrawn, or None if the
+        whole window was redrawn.
+        """
+
+        win = self.__window_service.win
+        full_redraw = view != self.__drawn_view
+
+        dirty_rects: list[Rect] = []
+
+        if not full_redraw:
+            dirty_rects = self.__get_dirty_rects(drawn_blits, redrawn_rects)
+            dirty_area = sum(rect.width * rect.height for rect in dirty_rects)
+            full_redraw = dirty_area > win.get_width() * win.get_height() * self.__window_service.dirty_rect_threshold
+
+        self.__drawn_blits = drawn_blits
+        self.__drawn_view = view
+        self.__marked_dirty.clear()
+
+        if full_redraw:
+            self.__window_service.draw_background()
+            win.blits(blit_sequence, doreturn=False)
+            return None
+
+        if dirty_rects:
+            blit_rects = [Rect(pos, surf.get_size()) for surf, pos in blit_sequence]
+
+            ## Each area is cleared & everything overlapping it redrawn in draw order, clipped to the area.
+            for dirty_rect in dirty_rects:
+                win.set_clip(dirty_rect)
+                self.__window_service.draw_background()
+                win.blits([blit_sequence[i] for i in dirty_rect.collidelistall(blit_rects)], doreturn=False)
+
+            win.set_clip(None)
+
+        return dirty_rects
+
+
+    def draw_game_objects_to_window(self) -> list[Rect] | None:
+        """
+        Draws every visible game object to the window.
+
+        Returns:
+            list[Rect] | None: In dirty rect mode, the areas of the window redrawn, which are all that needs updating on
+            the display. None if the whole window was drawn.
+        """
+
+        ## Phases are only timed while the profiler is enabled, & each object only for a class breakdown or trace.
+        profiler = self.__profiler if self.__profiler is not None and self.__profiler.enabled else None
+        profile_objects = profiler is not None and (profiler.class_breakdown or profiler.tracing)
+
+        if profiler:
+            prepare_start_ns = perf_counter_ns()
+
+        self.__refresh_indexes()
+
+        ## The camera's transform is resolved once per frame, rather than for every object drawn.
+        camera = self.get_camera()
+        scale = 1.0
+        zoom_settled = True
+
+        if camera:
+            camera.update_transform()
+            scale = camera.get_transform_scale()
+            zoom_settled = camera.is_zoom_settled()
+
+        scaled_surface_service: ScaledSurfaceService | None = None
+        if scale != 1 and ServiceLocator.is_registered(ScaledSurfaceService):
+            scaled_surface_service = ServiceLocator.get(ScaledSurfaceService)
+        else:
+            scale = 1.0
+
+        if self.__movement_store is not None:
+            self.__movement_store.update_draw_positions()
+
+        win = self.__window_service.win
+        view_dim = self.__window_service.dim
+
+        view = (camera.get_view_rect(view_dim) if camera else None, scale, tuple(view_dim), id(win))
+
+        if view != self.__static_draws_view or not self.reuse_static_draws:
+            self.__static_draws.clear()
+            self.__static_draws_view = view
+
+        static_draws = self.__static_draws
+
+        ## Surfaces are collected into a blit sequence & submitted with a single Surface.blits call per draw layer,
+        ## rather than a blit call per object. In dirty rect mode, the whole frame's sequence is collected first, along
+        ## with each object's part of it.
+        blit_sequence: list[tuple[Surface, tuple[int, int]]] = []
+        add_blit = blit_sequence.append
+        draw_order = None
+
+        dirty_rect_mode = self.__window_service.dirty_rect_mode
+        drawn_blits: dict[str, tuple[tuple[Surface, tuple[int, int]], ...]] = {}
+        redrawn_rects: list[Rect] = []
+
+        if profiler:
+            objects_start_ns = perf_counter_ns()
+            profiler.record_phase(ProfilerService.DRAW_PREPARE, prepare_start_ns, objects_start_ns)
+
+        ## Time spent blitting within the object loop, excluded from the loop's own time.
+        blit_ns = 0
+
+        for game_obj_ident, game_obj in self.__get_draw_candidates():
+
+            if not game_obj.display or game_obj_ident == self.__camera:
+                continue
+
+            if dirty_rect_mode:
+                blits_start = len(blit_sequence)
+
+            elif game_obj.draw_order != draw_order:
+                if blit_sequence:
+                    blit_start_ns = perf_counter_ns() if profiler else 0
+                    win.blits(blit_sequence, doreturn=False)
+                    blit_sequence.clear()
+
+                    if profiler:
+                        blit_end_ns = perf_counter_ns()
+                        blit_ns += blit_end_ns - blit_start_ns
+                        profiler.trace_event("blit", ProfilerService.CATEGORY_ENGINE, blit_start_ns, blit_end_ns)
+
+                draw_order = game_obj.draw_order
+
+            if profile_objects:
+                object_start_ns = perf_counter_ns()
+
+            static_draw = static_draws.get(game_obj_ident)
+
+            if static_draw is None:
+                ## Resolved once per object per frame, as Movement.get_draw_pos updates the object's previous position.
+                draw_pos = self.__get_draw_pos(game_obj)
+                on_screen = self.__is_on_screen(draw_pos, game_obj.move.get_dim() * scale)
+                blit_pair = None
+
+            else:
+                draw_pos, on_screen, blit_pair = static_draw
+
+            if on_screen:
+
+                if game_obj.chunked:
+
+                    if scaled_surface_service is None:
+                        blit_sequence.extend(game_obj.draw_chunks(draw_pos, view_dim))
+
+                    else:
+                        ## The chunks are drawn as they would be in the unzoomed view, then scaled about the screen's
+                        ## top left.
+                        blit_sequence.extend(
+                            (scaled_surface_service.get(chunk_surf, scale, zoom_settled),
+                             (int(chunk_x * scale), int(chunk_y * scale)))
+                            for chunk_surf, (chunk_x, chunk_y) in game_obj.draw_chunks(
+                                draw_pos / scale, view_dim / scale))
+
+                    if dirty_rect_mode:
+                        for rect in game_obj.get_redrawn_rects():
+
+                            if scale == 1:
+                                redrawn_rects.append(rect.move(int(draw_pos.x), int(draw_pos.y)))
+
+                            else:
+                                ## Rounded outwards, so the area covers every pixel the scaled redrawn area touches.
+                                redrawn_rects.append(Rect(
+                                    int(draw_pos.x + rect.x * scale) - 1,
+                                    int(draw_pos.y + rect.y * scale) - 1,
+                                    ceil(rect.width * scale) + 2,
+                                    ceil(rect.height * scale) + 2))
+
+                else:
+                    comp_surf = game_obj.draw()
+
+                    if comp_surf is not None:
+
+                        if scaled_surface_service is not None:
+                            comp_surf = scaled_surface_service.get(comp_surf, scale, zoom_settled)
+
+                        if blit_pair is None or blit_pair[0] is not comp_surf:
+                            blit_pair = (comp_surf, (int(draw_pos.x), int(draw_pos.y)))
+
+                        add_blit(blit_pair)
+
+                if dirty_rect_mode and len(blit_sequence) > blits_start:
+                    drawn_blits[game_obj_ident] = tuple(blit_sequence[blits_start:])
+
+            ## Only kept for objects that didn't move this frame, as a moved object's draw position is interpolated, &
+            ## objects with a movement filter, whose draw position changes as the filter settles.
+            if static_draw is None:
+                if (self.reuse_static_draws and
+                        game_obj_ident not in self.__moved_since_draw and
+                        game_obj.move.movement_filter is None):
+                    static_draws[game_obj_ident] = (draw_pos, on_screen, blit_pair)
+
+            elif blit_pair is not static_draw[2]:
+                static_draws[game_obj_ident] = (draw_pos, on_screen, blit_pair)
+
+            if profile_objects:
+                profiler.record_object(
+                    game_obj_ident, game_obj, ProfilerService.CLASS_DRAW, object_start_ns, perf_counter_ns())
+
+        for game_obj_ident in self.__moved_since_draw:
+            game_obj = self.__game_objects.get(game_obj_ident)
+
+            if game_obj is not None:
+                game_obj.move.sync_previous_pos()
+
+        self.__moved_since_draw.clear()
+
+        if profiler:
+            blit_start_ns = perf_counter_ns()
+            profiler.add_phase_time(ProfilerService.DRAW_OBJECTS, blit_start_ns - objects_start_ns - blit_ns)
+            profiler.trace_event("draw_objects", ProfilerService.CATEGORY_ENGINE, objects_start_ns, blit_start_ns)
+
+        dirty_rects = None
+
+        if dirty_rect_mode:
+            view = (camera.get_view_rect(view_dim) if camera else None, scale, tuple(view_dim), id(win))
+            dirty_rects = self.__draw_dirty(blit_sequence, drawn_blits, redrawn_rects, view)
+
+        elif blit_sequence:
+            win.blits(blit_sequence, doreturn=False)
+
+        if profiler:
+            blit_end_ns = perf_counter_ns()
+            profiler.add_phase_time(ProfilerService.BLIT, blit_ns + blit_end_ns - blit_start_ns)
+            profiler.trace_event("blit", ProfilerService.CATEGORY_ENGINE, blit_start_ns, blit_end_ns)
+
+        return dirty_rects
 
 
 
@@ -174,11 +684,30 @@ class GameObjectHandler:
 
         game_objects_to_delete: list[str] = []
 
+        if self.__movement_store is not None:
+            self.__movement_store.integrate()
+
+        ## Every filter bank with filters is advanced once per fixed update.
+        for filter_bank in FilterBank.get_banks():
+            filter_bank.update()
+
+        profiler = self.__profiler
+        profile_objects = (profiler is not None and profiler.enabled
+                           and (profiler.class_breakdown or profiler.tracing))
+
         for ident, comp in self.__game_objects.items():
-            comp.update()
+
+            if profile_objects:
+                update_start_ns = perf_counter_ns()
+                comp.update()
+                profiler.record_object(ident, comp, ProfilerService.CLASS_UPDATE, update_start_ns, perf_counter_ns())
+
+            else:
+                comp.update()
 
             if comp.delete:
                 game_objects_to_delete.append(ident)
 
+        ## Pooled objects are returned to their pool by remove, to be reused rather than discarded.
         for ident in game_objects_to_delete:
             self.remove(ident, False)
\ No newline at end of file
@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+from typing import Callable
+from weakref import WeakSet
+from scripts.utility.logger import Logger
+from scripts.game.game_objects.game_object import GameObject
+
+
+@dataclass
+class GameObjectPoolStats:
+    hits: int
+    misses: int
+    in_use: int
+    free: int
+    high_water_mark: int
+
+
+class GameObjectPool:
+    """
+    Free list of reusable game objects of one type, for short-lived objects (e.g. particles) that would otherwise be
+    constructed & garbage collected constantly. Objects taken with acquire are returned by the GameObjectHandler once
+    they're removed from it (including when flagged for deletion), and re-initialised with GameObject.reset when next
+    acquired.
+    """
+
+    __NOT_IN_USE = "{game_object} is not in use from this pool. Not released."
+
+    def __init__(self, factory: Callable[[], GameObject], max_free: int | None = None):
+        """
+        Args:
+            factory (Callable[[], GameObject]): Creates a new object when the pool is empty.
+            max_free (int | None, optional): The most objects kept in the free list, any more released are left to be
+            garbage collected. Defaults to None, no limit.
+        """
+
+        self.__factory = factory
+        self.max_free = max_free
+
+        self.__free: list[GameObject] = []
+
+        ## Objects acquired & not yet released, so an object released twice (or taken from another pool) is rejected
+        ## rather than added to the free list again. Weak, so objects dropped without being released aren't kept alive.
+        self.__acquired: WeakSet[GameObject] = WeakSet()
+
+        ## Stats, used to size the pool.
+        self.hits = 0
+        self.misses = 0
+        self.in_use = 0
+        self.high_water_mark = 0
+
+
+    def acquire(self) -> GameObject:
+        """
+        Takes an object from the pool, creating a new one if the pool is empty. The object should be re-initialised
+        with GameObject.reset before use.
+
+        Returns:
+            GameObject: The object.
+        """
+
+        if self.__free:
+            game_obj = self.__free.pop()
+            self.hits += 1
+
+        else:
+            game_obj = self.__factory()
+            game_obj.pool = self
+            self.misses += 1
+
+        self.__acquired.add(game_obj)
+        self.in_use += 1
+
+        if self.in_use > self.high_water_mark:
+            self.high_water_mark = self.in_use
+
+        return game_obj
+
+
+    def release(self, game_obj: GameObject):
+        """
+        Returns an object to the pool. Objects that aren't in use from this pool (e.g. already released) are rejected.
+
+        Args:
+            game_obj (GameObject): The object, which must have been taken from this pool.
+        """
+
+        if game_obj not in self.__acquired:
+            Logger.log_warning(self.__NOT_IN_USE.format(game_object=game_obj))
+            return
+
+        self.__acquired.discard(game_obj)
+        self.in_use -= 1
+
+        if self.max_free is None or len(self.__free) < self.max_free:
+            self.__free.append(game_obj)
+
+
+    def get_stats(self) -> GameObjectPoolStats:
+        return GameObjectPoolStats(
+            hits=self.hits,
+            misses=self.misses,
+            in_use=self.in_use,
+            free=len(self.__free),
+            high_water_mark=self.high_water_mark)
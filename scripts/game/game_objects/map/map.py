@@ -10,25 +10,38 @@ look at the README.md file in the root directory, or visit the
 GitHub Repo: https://github.com/karkin2002/Arctic-Engine.
 """
 
+from collections import OrderedDict
 from scripts.game.game_objects.game_object import GameObject
 from scripts.game.game_objects.map.map_layer import MapLayer
+from scripts.game.game_objects.map.tile_palette import TilePalette
 from scripts.utility.logger import Logger
-from pygame import Surface, SRCALPHA, Vector2
+from scripts.services.service_locator import ServiceLocator
+from scripts.services.visual.scaled_surface_service import ScaledSurfaceService
+from pygame import Rect, Surface, SRCALPHA, Vector2
 
 
 class Map (GameObject):
-    
+
+    ## The map is drawn in chunks, only the chunks visible on screen are baked & drawn.
+    chunked = True
+
     __ADDED_NEW_MAP_LAYER_TEXT = "Added MapLayer to index {index} on {map}."
     __ERROR_REMOVING_MAP_LAYER_TEXT = "MapLayer does not exist at indexed value."
+    __SET_MAP_SURF_DEPRECATED_TEXT = "Map.set_map_surf is deprecated, use Map.invalidate_chunks instead."
     
     def __init__(self, 
                  map_dim: tuple[int, int], 
                  tile_dim: tuple[int,int] = (16, 16),
-                 transparent = False):
+                 transparent = False,
+                 chunk_dim: tuple[int, int] = (16, 16),
+                 max_cached_chunks: int = 64):
 
         super().__init__()
 
         self.__map_layer_list: list[MapLayer] = []
+
+        ## Palette shared by all the layers added through add_map_layer.
+        self.tile_palette = TilePalette()
         self.map_dim: tuple[int, int] = map_dim
 
         self.tile_dim: tuple[int,int] = tile_dim
@@ -37,14 +50,29 @@ class Map (GameObject):
             self.map_dim[0] * self.tile_dim[0], 
             self.map_dim[1] * self.tile_dim[1]))
         
-        self.map_surf: Surface | None = None
-        
         self.transparent = transparent
+
+        ## Chunks are baked when they first become visible, and the least recently drawn chunks are evicted once more
+        ## than max_cached_chunks are cached. chunk_dim is measured in tiles.
+        self.chunk_dim: tuple[int, int] = chunk_dim
+        self.max_cached_chunks = max_cached_chunks
+        self.__chunk_px_dim: tuple[int, int] = (chunk_dim[0] * tile_dim[0], chunk_dim[1] * tile_dim[1])
+        self.__chunks: OrderedDict[tuple[int, int], Surface] = OrderedDict()
+
+        ## Regions changed since the last draw, as (x_start, y_start, x_end, y_end) in tiles, end exclusive.
+        self.__dirty_regions: list[tuple[int, int, int, int]] = []
+
+        ## Areas of cached chunks redrawn by the last draw_chunks call, in map pixels.
+        self.__redrawn_rects: list[Rect] = []
+
+        ## The whole map baked to one surface, only made if draw is called (see draw).
+        self.__map_surf: Surface | None = None
         
 
 
     def add_map_layer(self):
-        self.__map_layer_list.append(MapLayer(self.map_dim))
+        self.__map_layer_list.append(MapLayer(self.map_dim, self.tile_palette))
+        self.invalidate_chunks()
         
         Logger.log_info(
             self.__ADDED_NEW_MAP_LAYER_TEXT.format(
@@ -60,6 +88,7 @@ class Map (GameObject):
                                         False):
             
             del self.__map_layer_list[layer_index]
+            self.invalidate_chunks()
 
 
 
@@ -79,6 +108,7 @@ class Map (GameObject):
             )
             
             self.__map_layer_list[layer_index] = layer
+            self.invalidate_chunks()
 
 
     def get_map_layer(self, layer_index: int) -> MapLayer | None:
@@ -95,28 +125,278 @@ class Map (GameObject):
         return len(self.__map_layer_list)
 
 
+    def invalidate_chunks(self):
+        """
+        Clears all baked chunks, so they are re-baked from the map layers the next time they are visible. Run by
+        add_map_layer, remove_map_layer & set_map_layer, but should also be run after a map layer's tiles have been
+        changed outside of set_tile / set_region (e.g. MapLayer.generate_map_array).
+        """
+        for chunk_surf in self.__chunks.values():
+            self.__invalidate_scaled_chunk(chunk_surf)
+
+        self.__chunks.clear()
+        self.__dirty_regions.clear()
+        self.__map_surf = None
+
+
     def set_map_surf(self):
+        """
+        Deprecated, use invalidate_chunks. The map is no longer baked to one surface up front.
+        """
+        Logger.log_warning(self.__SET_MAP_SURF_DEPRECATED_TEXT)
+        self.invalidate_chunks()
+
+
+    @staticmethod
+    def __invalidate_scaled_chunk(chunk_surf: Surface):
+        """
+        Drops the scaled copies of a chunk (drawn while the camera is zoomed), once the chunk is redrawn or discarded.
+        """
+
+        if ServiceLocator.is_registered(ScaledSurfaceService):
+            ServiceLocator.get(ScaledSurfaceService).invalidate(chunk_surf)
+
+
+    def get_cached_chunk_count(self) -> int:
+        return len(self.__chunks)
+
+
+    def set_tile(self, layer_index: int, x: int, y: int, tile: str | None):
+        """
+        Sets a single tile of a map layer. Only the changed tile is re-drawn, the next time the map is drawn.
+
+        Args:
+            layer_index (int): The index of the map layer.
+            x (int): The x coordinate of the tile.
+            y (int): The y coordinate of the tile.
+            tile (str | None): The texture name of the tile. None to clear the tile.
+        """
+
+        self.set_region(layer_index, x, y, 1, 1, tile)
+
+
+    def set_region(self, layer_index: int, x: int, y: int, width: int, height: int, tile: str | None):
+        """
+        Sets every tile within a rectangle of a map layer. Only the changed region is re-drawn, the next time the map
+        is drawn.
+
+        Args:
+            layer_index (int): The index of the map layer.
+            x (int): The x coordinate of the region's top left tile.
+            y (int): The y coordinate of the region's top left tile.
+            width (int): The width of the region in tiles.
+            height (int): The height of the region in tiles.
+            tile (str | None): The texture name of the tile. None to clear the region.
+        """
+
+        layer = self.get_map_layer(layer_index)
+
+        if layer is None:
+            return
+
+        tile_x_start = max(0, x)
+        tile_y_start = max(0, y)
+        tile_x_end = min(self.map_dim[0], x + width)
+        tile_y_end = min(self.map_dim[1], y + height)
+
+        if tile_x_end <= tile_x_start or tile_y_end <= tile_y_start:
+            return
+
+        layer.fill_region(x, y, width, height, tile)
+        self.__dirty_regions.append((tile_x_start, tile_y_start, tile_x_end, tile_y_end))
+        self.__map_surf = None
+
+
+    def __draw_region(self,
+                      chunk_surf: Surface,
+                      chunk_x: int,
+                      chunk_y: int,
+                      tile_x_start: int,
+                      tile_y_start: int,
+                      tile_x_end: int,
+                      tile_y_end: int):
+        """
+        Draws every map layer's tiles within a region (in tiles, end exclusive) to a chunk's surface.
+        """
+
+        tile_width, tile_height = self.tile_dim
+
+        ## Offset of the region from the chunk's top left, in pixels.
+        offset_x = (tile_x_start - chunk_x * self.chunk_dim[0]) * tile_width
+        offset_y = (tile_y_start - chunk_y * self.chunk_dim[1]) * tile_height
+
+        for layer in self.__map_layer_list:
+
+            tile_surfs = layer.palette.get_surfaces()
+            region = layer.map_array[tile_y_start:tile_y_end, tile_x_start:tile_x_end]
+
+            chunk_surf.blits(
+                [(tile_surfs[tile_id], (offset_x + tile_width * x, offset_y + tile_height * y))
+                 for y, row in enumerate(region.tolist())
+                 for x, tile_id in enumerate(row)
+                 if tile_id != TilePalette.EMPTY_TILE_ID],
+                doreturn=False)
+
+
+    def __bake_chunk(self, chunk_x: int, chunk_y: int) -> Surface:
+        """
+        Draws every map layer's tiles within a chunk to a new surface.
+        """
+
+        tile_x_start = chunk_x * self.chunk_dim[0]
+        tile_y_start = chunk_y * self.chunk_dim[1]
+        tile_x_end = min(tile_x_start + self.chunk_dim[0], self.map_dim[0])
+        tile_y_end = min(tile_y_start + self.chunk_dim[1], self.map_dim[1])
+
+        chunk_dim = ((tile_x_end - tile_x_start) * self.tile_dim[0], (tile_y_end - tile_y_start) * self.tile_dim[1])
+
         if self.transparent:
-            self.map_surf = Surface(self.move.get_dim(), SRCALPHA)
+            chunk_surf = Surface(chunk_dim, SRCALPHA)
         else:
-            self.map_surf = Surface(self.move.get_dim())
-            
-        self.draw_map_layers()
-                
+            chunk_surf = Surface(chunk_dim)
 
-    def draw_map_layers(self):
-        
-        for layer in self.__map_layer_list:
-            for y in range(len(layer.map_array)):
-                for x in range(len(layer.map_array[y])):
-                    if layer.map_array[y][x] is not None:
-                        self.map_surf.blit(
-                            layer.map_array[y][x].get_texture_surf(), 
-                            (self.tile_dim[0] * x, self.tile_dim[1] * y))
+        self.__draw_region(chunk_surf, chunk_x, chunk_y, tile_x_start, tile_y_start, tile_x_end, tile_y_end)
 
+        return chunk_surf
 
 
-    def draw(self) -> Surface | None:
-        return self.map_surf
-        
-                
\ No newline at end of file
+    def __redraw_dirty_regions(self):
+        """
+        Clears & re-draws the regions changed through set_tile / set_region on every cached chunk they overlap. Chunks
+        that aren't cached will be baked with the changes when they are next visible.
+        """
+
+        tile_width, tile_height = self.tile_dim
+        chunk_width, chunk_height = self.__chunk_px_dim
+
+        for tile_x_start, tile_y_start, tile_x_end, tile_y_end in self.__dirty_regions:
+
+            for chunk_y in range(tile_y_start // self.chunk_dim[1], (tile_y_end - 1) // self.chunk_dim[1] + 1):
+                for chunk_x in range(tile_x_start // self.chunk_dim[0], (tile_x_end - 1) // self.chunk_dim[0] + 1):
+
+                    chunk_surf = self.__chunks.get((chunk_x, chunk_y))
+
+                    if chunk_surf is None:
+                        continue
+
+                    ## Region of the dirty rect within this chunk, in tiles.
+                    region_x_start = max(tile_x_start, chunk_x * self.chunk_dim[0])
+                    region_y_start = max(tile_y_start, chunk_y * self.chunk_dim[1])
+                    region_x_end = min(tile_x_end, (chunk_x + 1) * self.chunk_dim[0])
+                    region_y_end = min(tile_y_end, (chunk_y + 1) * self.chunk_dim[1])
+
+                    region_rect = Rect(
+                        (region_x_start - chunk_x * self.chunk_dim[0]) * tile_width,
+                        (region_y_start - chunk_y * self.chunk_dim[1]) * tile_height,
+                        (region_x_end - region_x_start) * tile_width,
+                        (region_y_end - region_y_start) * tile_height)
+
+                    chunk_surf.fill((0, 0, 0, 0), region_rect)
+                    self.__redrawn_rects.append(region_rect.move(chunk_x * chunk_width, chunk_y * chunk_height))
+
+                    self.__draw_region(
+                        chunk_surf, chunk_x, chunk_y, region_x_start, region_y_start, region_x_end, region_y_end)
+                    self.__invalidate_scaled_chunk(chunk_surf)
+
+        self.__dirty_regions.clear()
+
+
+    def __get_chunk(self, chunk_x: int, chunk_y: int) -> Surface:
+
+        chunk_surf = self.__chunks.get((chunk_x, chunk_y))
+
+        if chunk_surf is None:
+            chunk_surf = self.__bake_chunk(chunk_x, chunk_y)
+            self.__chunks[(chunk_x, chunk_y)] = chunk_surf
+
+        else:
+            self.__chunks.move_to_end((chunk_x, chunk_y))
+
+        return chunk_surf
+
+
+    def draw_chunks(self, draw_pos: Vector2, view_dim: Vector2) -> list[tuple[Surface, tuple[int, int]]]:
+        """
+        Gets the chunks of the map that are visible on screen, baking any that aren't cached.
+
+        Args:
+            draw_pos (Vector2): The screen position of the map's top left corner.
+            view_dim (Vector2): The dimensions of the screen.
+
+        Returns:
+            list[tuple[Surface, tuple[int, int]]]: The visible chunks and the screen positions to draw them at.
+        """
+
+        map_width, map_height = self.move.get_dim()
+        chunk_width, chunk_height = self.__chunk_px_dim
+
+        ## Visible area in map pixel coordinates.
+        left = max(0, -draw_pos.x)
+        top = max(0, -draw_pos.y)
+        right = min(map_width, view_dim.x - draw_pos.x)
+        bottom = min(map_height, view_dim.y - draw_pos.y)
+
+        self.__redrawn_rects = []
+
+        if self.__dirty_regions:
+            self.__redraw_dirty_regions()
+
+        if right <= left or bottom <= top:
+            return []
+
+        chunks: list[tuple[Surface, tuple[int, int]]] = []
+
+        for chunk_y in range(int(top // chunk_height), int((bottom - 1) // chunk_height) + 1):
+            for chunk_x in range(int(left // chunk_width), int((right - 1) // chunk_width) + 1):
+                chunks.append((
+                    self.__get_chunk(chunk_x, chunk_y),
+                    (int(draw_pos.x) + chunk_x * chunk_width, int(draw_pos.y) + chunk_y * chunk_height)))
+
+        ## Evict the least recently drawn chunks, never evicting a chunk visible this frame.
+        while len(self.__chunks) > max(self.max_cached_chunks, len(chunks)):
+            _, evicted_chunk_surf = self.__chunks.popitem(last=False)
+            self.__invalidate_scaled_chunk(evicted_chunk_surf)
+
+        return chunks
+
+
+    def get_redrawn_rects(self) -> list[Rect]:
+        """
+        Gets the areas of cached chunks redrawn by the last draw_chunks call, after changes through set_tile /
+        set_region.
+
+        Returns:
+            list[Rect]: The redrawn areas, relative to the map's top left, in map pixels.
+        """
+        return self.__redrawn_rects
+
+
+    def draw(self) -> Surface:
+        """
+        Gets the whole map baked to one surface, as draw did before the map was chunked. This isn't used to draw the
+        map on screen (see draw_chunks), it is for callers that need the whole map at once, e.g. a minimap. The surface
+        is baked on the first call & reused until the map is changed, so is expensive for large maps.
+
+        Returns:
+            Surface: The whole map.
+        """
+
+        if self.__map_surf is None:
+            map_dim = (self.map_dim[0] * self.tile_dim[0], self.map_dim[1] * self.tile_dim[1])
+
+            if self.transparent:
+                self.__map_surf = Surface(map_dim, SRCALPHA)
+            else:
+                self.__map_surf = Surface(map_dim)
+
+            self.__draw_region(self.__map_surf, 0, 0, 0, 0, self.map_dim[0], self.map_dim[1])
+
+        return self.__map_surf
+
+
+    @property
+    def map_surf(self) -> Surface:
+        """
+        The whole map baked to one surface, see draw.
+        """
+        return self.draw()
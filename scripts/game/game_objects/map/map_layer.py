@@ -11,55 +11,104 @@ GitHub Repo: https://github.com/karkin2002/Arctic-Engine.
 """
 
 from scripts.utility.logger import Logger
-from scripts.game.game_objects.map.tile import StaticTile, DynamicTile
+from scripts.game.game_objects.map.tile import StaticTile
+from scripts.game.game_objects.map.tile_palette import TilePalette
 import numpy as np
 
 class MapLayer:
-    
+
     __GENERATE_NEW_MAP_TEXT = "Generated new map layer of size {map_dim} with tile probabilities {tile_probability}."
     __GENERATE_NEW_MAP_MISMATCH_LEN_TEXT = "Mismatch length between tiles & probabilities."
-    
-    def __init__(self, map_dim: tuple[int, int]):
-        
+
+    def __init__(self, map_dim: tuple[int, int], palette: TilePalette | None = None):
+
         self.map_dim: tuple[int, int] = map_dim
-        self.map_array: list[list[StaticTile | DynamicTile]] | None = None
-        
-    
-    def generate_map_array(self, 
-                           tiles: list[str], 
+
+        ## The layer is stored as a grid of tile ids, indexed [y, x]. The ids refer to tiles in the palette, which can
+        ## be shared between layers. Cells with no tile are TilePalette.EMPTY_TILE_ID.
+        self.palette = palette if palette is not None else TilePalette()
+        self.map_array: np.ndarray = np.full((map_dim[1], map_dim[0]), TilePalette.EMPTY_TILE_ID, dtype=np.uint16)
+
+
+    def generate_map_array(self,
+                           tiles: list[str | None],
                            probability: list[float]):
-        
+
         if not Logger.raise_incorrect_len(
-                probability, 
-                len(tiles), 
+                probability,
+                len(tiles),
                 self.__GENERATE_NEW_MAP_MISMATCH_LEN_TEXT):
-            
-            new_map_array = np.random.choice(
-                a=tiles,
+
+            tile_ids = np.array([self.palette.get_id(tile) for tile in tiles], dtype=np.uint16)
+
+            self.map_array = np.random.choice(
+                a=tile_ids,
                 p=probability,
-                size=self.map_dim
-            )
-            
-            self.map_array = [[None for _ in range(self.map_dim[1])] for _ in range(self.map_dim[0])]
-            
-            for y in range(len(new_map_array)):
-                for x in range(len(new_map_array[y])):
-                    if new_map_array[y][x] == None:
-                        self.map_array[y][x] = None
-                    else:
-                        self.map_array[y][x] = StaticTile(new_map_array[y][x])
-                
+                size=(self.map_dim[1], self.map_dim[0])
+            ).astype(np.uint16, copy=False)
+
             ## --- Used for logging ---
             tile_probability: list[tuple[float, str]] = []
-            
+
             for i in range(len(tiles)):
                 tile_probability.append((probability[i], tiles[i]))
-                
+
             tile_probability.sort(reverse=True, key=lambda x: x[0])
-            
+
             Logger.log_info(self.__GENERATE_NEW_MAP_TEXT.format(
-                map_dim = self.map_dim, 
+                map_dim = self.map_dim,
                 tile_probability = tile_probability))
-            
-    
-        
\ No newline at end of file
+
+
+    def fill(self, tile: str | None):
+        """
+        Sets every cell of the layer to a tile.
+
+        Args:
+            tile (str | None): The texture name of the tile. None to clear the layer.
+        """
+
+        self.map_array.fill(self.palette.get_id(tile))
+
+
+    def fill_region(self, x: int, y: int, width: int, height: int, tile: str | None):
+        """
+        Sets every cell within a rectangle of the layer to a tile. The rectangle is clipped to the layer's bounds.
+
+        Args:
+            x (int): The x coordinate of the region's top left cell.
+            y (int): The y coordinate of the region's top left cell.
+            width (int): The width of the region in cells.
+            height (int): The height of the region in cells.
+            tile (str | None): The texture name of the tile. None to clear the region.
+        """
+
+        self.map_array[max(0, y):max(0, y + height), max(0, x):max(0, x + width)] = self.palette.get_id(tile)
+
+
+    def set_tile(self, x: int, y: int, tile: str | None):
+        """
+        Sets a single cell of the layer to a tile.
+
+        Args:
+            x (int): The x coordinate of the cell.
+            y (int): The y coordinate of the cell.
+            tile (str | None): The texture name of the tile. None to clear the cell.
+        """
+
+        self.map_array[y, x] = self.palette.get_id(tile)
+
+
+    def get_tile(self, x: int, y: int) -> StaticTile | None:
+        """
+        Gets the tile in a cell of the layer.
+
+        Args:
+            x (int): The x coordinate of the cell.
+            y (int): The y coordinate of the cell.
+
+        Returns:
+            StaticTile | None: The tile, or None if the cell is empty.
+        """
+
+        return self.palette.get_tile(int(self.map_array[y, x]))
@@ -0,0 +1,99 @@
+__author__ = "Kaya Arkin"
+__copyright__ = "Copyright Kaya Arkin"
+__license__ = "GPL"
+__email__ = "karkin2002@gmail.com"
+__status__ = "Development"
+
+"""
+This file is part of Arctic Engine Project by Kaya Arkin. For more information,
+look at the README.md file in the root directory, or visit the
+GitHub Repo: https://github.com/karkin2002/Arctic-Engine.
+"""
+
+from pygame import Surface
+from scripts.utility.logger import Logger
+from scripts.game.game_objects.map.tile import StaticTile
+
+
+class TilePalette:
+    """
+    Maps tile texture names to the integer tile ids stored in a MapLayer's map array. Each tile type is created once
+    and shared by every cell (and every layer sharing the palette) using it. Id EMPTY_TILE_ID is reserved for cells
+    with no tile.
+    """
+
+    EMPTY_TILE_ID = 0
+    MAX_TILE_ID = 65535
+
+    __NEW_TILE_ADDED = "Tile '{tile_name}' added to palette as id {tile_id}."
+    __PALETTE_FULL = "Tile '{tile_name}' could not be added to palette, the palette is full ({max_tile_id} tiles)."
+    __TILE_ID_DOES_NOT_EXIST = "Tile id {tile_id} does not exist in palette."
+
+    def __init__(self):
+
+        self.__tiles: list[StaticTile | None] = [None]
+        self.__tile_ids: dict[str, int] = {}
+
+
+    def __len__(self) -> int:
+        return len(self.__tiles)
+
+
+    def get_id(self, tile_name: str | None) -> int:
+        """
+        Gets the id of a tile, adding it to the palette if it doesn't exist.
+
+        Args:
+            tile_name (str | None): The texture name of the tile. None for an empty cell.
+
+        Returns:
+            int: The id of the tile.
+        """
+
+        if tile_name is None:
+            return self.EMPTY_TILE_ID
+
+        tile_id = self.__tile_ids.get(tile_name)
+
+        if tile_id is None:
+
+            tile_id = len(self.__tiles)
+
+            if tile_id > self.MAX_TILE_ID:
+                Logger.raise_exception(self.__PALETTE_FULL.format(tile_name=tile_name, max_tile_id=self.MAX_TILE_ID))
+
+            self.__tiles.append(StaticTile(tile_name))
+            self.__tile_ids[tile_name] = tile_id
+
+            Logger.log_info(self.__NEW_TILE_ADDED.format(tile_name=tile_name, tile_id=tile_id))
+
+        return tile_id
+
+
+    def get_tile(self, tile_id: int) -> StaticTile | None:
+        """
+        Gets the tile with the given id.
+
+        Args:
+            tile_id (int): The id of the tile.
+
+        Returns:
+            StaticTile | None: The tile, or None for an empty cell.
+        """
+
+        if not Logger.raise_index_error(self.__tiles,
+                                        tile_id,
+                                        self.__TILE_ID_DOES_NOT_EXIST.format(tile_id=tile_id),
+                                        False):
+            return self.__tiles[tile_id]
+
+
+    def get_surfaces(self) -> list[Surface | None]:
+        """
+        Gets the texture surface of every tile in the palette, indexed by tile id.
+
+        Returns:
+            list[Surface | None]: The surfaces, None for the empty tile id.
+        """
+
+        return [tile.get_texture_surf() if tile is not None else None for tile in self.__tiles]
@@ -1,4 +1,4 @@
-from pygame import Surface
+from pygame import Surface, Vector2
 from scripts.game.game_objects.game_object import GameObject
 from scripts.game.components.animation import Animation
 from scripts.game.components.animation_handler import AnimationHandler
@@ -19,6 +19,10 @@ class Particle(GameObject):
         self.__animation_handler.set_current_animation(Particle.PARTICLE_ANIMATION_NAME)
         self.move.set_dim(animation.get_dim())
 
+    def reset(self, pos: Vector2 | None = None):
+        super().reset(pos)
+        self.__animation_handler.set_current_animation(Particle.PARTICLE_ANIMATION_NAME, animation_reset=True)
+
     def update(self):
         if self.__animation_handler.is_current_animation_finished():
             self.delete = True
@@ -0,0 +1,259 @@
+import numpy as np
+from pygame import Surface, Vector2
+from scripts.utility.logger import Logger
+from scripts.game.game_objects.game_object import GameObject
+from scripts.services.service_locator import ServiceLocator
+from scripts.services.utility.time_service import TimeService
+from scripts.services.visual.image_service import ImageService, Image
+
+
+class ParticleEmitter(GameObject):
+    """
+    Simulates & draws many particles sharing the same animation as a single game object. Rather than a GameObject per
+    particle, each particle is a row in a set of NumPy arrays (position, velocity, age), which are updated together with
+    vectorised maths every fixed update, and drawn with a single Surface.blits call.
+
+    Particle positions are in world space. The emitter's own position & dim (its bounds) are only used to cull it, so
+    the bounds should cover the area its particles travel.
+    """
+
+    chunked = True
+
+    __FRAME_DOES_NOT_EXIST = "Image '{image_name}' does not exist. Particle emitter frames could not be set."
+    __EMITTER_FULL = "Particle emitter at capacity ({capacity}). {count} particles not emitted."
+
+    def __init__(self,
+                 frames: list[str],
+                 particle_lifespan_ms: int = 1000,
+                 capacity: int = 10000,
+                 bounds: Vector2 | None = None,
+                 delete_when_empty: bool = False):
+
+        super().__init__(dim=bounds if bounds is not None else Vector2(512, 512))
+
+        self.__image_service: ImageService = ServiceLocator.get(ImageService)
+        self.__time_service: TimeService = ServiceLocator.get(TimeService)
+
+        self.particle_lifespan_ms = particle_lifespan_ms
+        self.capacity = capacity
+        self.delete_when_empty = delete_when_empty
+
+        ## Added to every particle's velocity each second, e.g. gravity.
+        self.acceleration = Vector2(0, 0)
+
+        ## The frames' images, & the surfaces taken from them at each image's generation. The surfaces are taken again
+        ## whenever an image's surface is replaced (converted, packed into an atlas, unloaded or reloaded), or the
+        ## image service's images change.
+        self.__frame_names: list[str] = []
+        self.__frame_images: list[Image] = []
+        self.__frame_generations: list[int] = []
+        self.__image_version = -1
+
+        self.__frame_surfs: list[Surface] = []
+        self.__frame_surfs_array = np.empty(0, dtype=object)
+        self.__frame_offsets = np.zeros((0, 2), dtype=np.float32)
+        self.set_frames(frames)
+
+        ## Particle state. Only the first __count rows are alive, dead particles are compacted away every update.
+        self.__count = 0
+        self.__pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.__previous_pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.__velocity = np.zeros((capacity, 2), dtype=np.float32)
+        self.__age_ms = np.zeros(capacity, dtype=np.float32)
+
+
+    def set_frames(self, frames: list[str]) -> bool:
+        """
+        Sets the animation every particle plays over its lifespan.
+
+        Args:
+            frames (list[str]): The image names of the animation's frames.
+
+        Returns:
+            bool: True if the frames were set, False if an image does not exist.
+        """
+
+        frame_images: list[Image] = []
+
+        for image_name in frames:
+
+            image = self.__image_service.get(image_name)
+
+            if image is None:
+                Logger.log_error(self.__FRAME_DOES_NOT_EXIST.format(image_name=image_name))
+                return False
+
+            frame_images.append(image)
+
+        self.__frame_names = list(frames)
+        self.__frame_images = frame_images
+
+        ## Taken after the lookups, as finishing a pending image adds it, changing the version.
+        self.__image_version = self.__image_service.get_image_version()
+
+        self.__resolve_frame_surfs()
+
+        return True
+
+
+    def __resolve_frame_surfs(self):
+        """
+        Takes the frames' surfaces from their images, reloading any unloaded temp images.
+        """
+
+        frame_surfs: list[Surface] = []
+
+        for image in self.__frame_images:
+            frame_surf = self.__image_service.get_surface(image)
+
+            ## A removed image is drawn as an empty frame.
+            frame_surfs.append(frame_surf if frame_surf is not None else Surface((0, 0)))
+
+        ## Taken after the surfaces, as reloading an image replaces its surface.
+        self.__frame_generations = [image.generation for image in self.__frame_images]
+        self.__frame_surfs = frame_surfs
+
+        ## Object array of the frames, so each particle's frame surface can be looked up with a single NumPy index.
+        self.__frame_surfs_array = np.empty(len(frame_surfs), dtype=object)
+        for frame_index, frame_surf in enumerate(frame_surfs):
+            self.__frame_surfs_array[frame_index] = frame_surf
+
+        ## Particles are drawn centered on their position.
+        self.__frame_offsets = np.array([(surf.get_width() / 2, surf.get_height() / 2) for surf in frame_surfs],
+                                        dtype=np.float32).reshape(-1, 2)
+
+
+    def __update_frame_surfs(self):
+        """
+        Takes the frames' surfaces again if any have changed since they were last taken, & marks the frames' temp
+        images as recently used, as the surfaces are drawn without getting the images again.
+        """
+
+        if self.__image_version != self.__image_service.get_image_version():
+            frame_images = [self.__image_service.find(image_name) for image_name in self.__frame_names]
+
+            self.__frame_images = [image if image is not None else previous_image
+                                   for image, previous_image in zip(frame_images, self.__frame_images)]
+            self.__image_version = self.__image_service.get_image_version()
+            self.__resolve_frame_surfs()
+
+        else:
+            for image, generation in zip(self.__frame_images, self.__frame_generations):
+                if image.generation != generation:
+                    self.__resolve_frame_surfs()
+                    break
+
+            else:
+                for image in self.__frame_images:
+                    self.__image_service.touch(image)
+
+
+    def get_particle_count(self) -> int:
+        return self.__count
+
+
+    def emit(self,
+             count: int,
+             pos: Vector2,
+             speed: tuple[float, float] = (0, 0),
+             angle: tuple[float, float] = (0, 360)):
+        """
+        Emits new particles from a point, each with a random speed & direction within the given ranges.
+
+        Args:
+            count (int): The number of particles to emit.
+            pos (Vector2): The world position to emit from.
+            speed (tuple[float, float]): The range of speeds (pixels per second). Defaults to (0, 0).
+            angle (tuple[float, float]): The range of directions (degrees). Defaults to (0, 360).
+        """
+
+        if self.__count + count > self.capacity:
+            Logger.log_warning(self.__EMITTER_FULL.format(
+                capacity=self.capacity,
+                count=self.__count + count - self.capacity))
+            count = self.capacity - self.__count
+
+        if count <= 0:
+            return
+
+        start = self.__count
+        end = start + count
+
+        speeds = np.random.uniform(speed[0], speed[1], count)
+        angles = np.radians(np.random.uniform(angle[0], angle[1], count))
+
+        self.__pos[start:end] = (pos.x, pos.y)
+        self.__previous_pos[start:end] = (pos.x, pos.y)
+        self.__velocity[start:end, 0] = np.cos(angles) * speeds
+        self.__velocity[start:end, 1] = np.sin(angles) * speeds
+        self.__age_ms[start:end] = 0
+
+        self.__count = end
+
+
+    def update(self):
+
+        count = self.__count
+
+        if count == 0:
+            return
+
+        pos = self.__pos[:count]
+        velocity = self.__velocity[:count]
+        age_ms = self.__age_ms[:count]
+
+        fixed_delta_time = self.__time_service.fixed_delta_time
+
+        self.__previous_pos[:count] = pos
+
+        if self.acceleration.x or self.acceleration.y:
+            velocity += (self.acceleration.x * fixed_delta_time, self.acceleration.y * fixed_delta_time)
+
+        pos += velocity * fixed_delta_time
+        age_ms += self.__time_service.update_time_ms
+
+        ## Compact the live particles to the front of the arrays.
+        alive = age_ms < self.particle_lifespan_ms
+
+        if not alive.all():
+            alive_count = int(np.count_nonzero(alive))
+
+            self.__pos[:alive_count] = pos[alive]
+            self.__previous_pos[:alive_count] = self.__previous_pos[:count][alive]
+            self.__velocity[:alive_count] = velocity[alive]
+            self.__age_ms[:alive_count] = age_ms[alive]
+
+            self.__count = alive_count
+
+            if alive_count == 0 and self.delete_when_empty:
+                self.delete = True
+
+
+    def draw(self) -> Surface | None:
+        return None
+
+
+    def draw_chunks(self, draw_pos: Vector2, view_dim: Vector2) -> list[tuple[Surface, tuple[int, int]]]:
+
+        count = self.__count
+
+        if count == 0 or not self.__frame_surfs:
+            return []
+
+        self.__update_frame_surfs()
+
+        ## Interpolated world positions, moved into screen space relative to the emitter's own draw position.
+        interpolated_time = max(0.0, min(1.0, self.__time_service.interpolated_time))
+        previous_pos = self.__previous_pos[:count]
+        world_pos = previous_pos + (self.__pos[:count] - previous_pos) * interpolated_time
+
+        left, top, _, _ = self.move.get_world_rect()
+
+        frame_indexes = np.minimum(
+            (self.__age_ms[:count] * (len(self.__frame_surfs) / self.particle_lifespan_ms)).astype(np.intp),
+            len(self.__frame_surfs) - 1)
+
+        screen_pos = (world_pos + (draw_pos.x - left, draw_pos.y - top) - self.__frame_offsets[frame_indexes]
+                      ).astype(np.int32)
+
+        return list(zip(self.__frame_surfs_array[frame_indexes].tolist(), screen_pos.tolist()))
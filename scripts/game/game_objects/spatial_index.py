@@ -0,0 +1,191 @@
+from math import floor
+
+
+class SpatialIndex:
+    """
+    Uniform grid spatial index of game object bounds, in world coordinates. Each cell stores the names of the objects
+    overlapping it, allowing objects within an area to be found without checking every object. Objects covering more
+    than __MAX_CELLS_PER_OBJECT cells (e.g. a map) are kept in a separate list that is always checked, instead of
+    filling thousands of cells.
+    """
+
+    __MAX_CELLS_PER_OBJECT = 64
+
+    def __init__(self, cell_size: int = 128):
+
+        self.cell_size = cell_size
+
+        self.__cells: dict[tuple[int, int], set[str]] = {}
+        self.__oversized: set[str] = set()
+
+        ## Rects are stored as (left, top, right, bottom), and cell ranges as (min_x, min_y, max_x, max_y).
+        self.__rects: dict[str, tuple[float, float, float, float]] = {}
+        self.__cell_ranges: dict[str, tuple[int, int, int, int] | None] = {}
+
+
+    def __len__(self) -> int:
+        return len(self.__rects)
+
+
+    def __get_cell_range(self, rect: tuple[float, float, float, float]) -> tuple[int, int, int, int]:
+        return (floor(rect[0] / self.cell_size),
+                floor(rect[1] / self.cell_size),
+                floor(rect[2] / self.cell_size),
+                floor(rect[3] / self.cell_size))
+
+
+    @staticmethod
+    def __to_edges(rect: tuple[float, float, float, float]) -> tuple[float, float, float, float]:
+        return rect[0], rect[1], rect[0] + rect[2], rect[1] + rect[3]
+
+
+    @staticmethod
+    def __is_overlapping(a: tuple[float, float, float, float], b: tuple[float, float, float, float]) -> bool:
+        return not (a[2] < b[0] or a[0] > b[2] or a[3] < b[1] or a[1] > b[3])
+
+
+    def insert(self, name: str, rect: tuple[float, float, float, float]):
+        """
+        Adds an object to the index, or updates it if it already exists.
+
+        Args:
+            name (str): The name of the object.
+            rect (tuple[float, float, float, float]): The bounds of the object (left, top, width, height).
+        """
+
+        edges = self.__to_edges(rect)
+        cell_range = self.__get_cell_range(edges)
+
+        if name in self.__rects:
+
+            ## Moving within the same cells only requires the stored rect to be updated.
+            if self.__cell_ranges[name] == cell_range:
+                self.__rects[name] = edges
+                return
+
+            self.remove(name)
+
+        self.__rects[name] = edges
+
+        min_x, min_y, max_x, max_y = cell_range
+
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > self.__MAX_CELLS_PER_OBJECT:
+            self.__oversized.add(name)
+            self.__cell_ranges[name] = None
+            return
+
+        for cell_y in range(min_y, max_y + 1):
+            for cell_x in range(min_x, max_x + 1):
+
+                cell = self.__cells.get((cell_x, cell_y))
+
+                if cell is None:
+                    self.__cells[(cell_x, cell_y)] = {name}
+                else:
+                    cell.add(name)
+
+        self.__cell_ranges[name] = cell_range
+
+
+    def remove(self, name: str):
+        """
+        Removes an object from the index.
+
+        Args:
+            name (str): The name of the object.
+        """
+
+        if name not in self.__rects:
+            return
+
+        del self.__rects[name]
+        cell_range = self.__cell_ranges.pop(name)
+
+        if cell_range is None:
+            self.__oversized.discard(name)
+            return
+
+        min_x, min_y, max_x, max_y = cell_range
+
+        for cell_y in range(min_y, max_y + 1):
+            for cell_x in range(min_x, max_x + 1):
+
+                cell = self.__cells[(cell_x, cell_y)]
+                cell.discard(name)
+
+                if not cell:
+                    del self.__cells[(cell_x, cell_y)]
+
+
+    def get_candidates(self, rect: tuple[float, float, float, float]) -> set[str]:
+        """
+        Returns every object in the cells the rect overlaps. This is cheaper than query_rect, but may include objects
+        slightly outside the rect.
+
+        Args:
+            rect (tuple[float, float, float, float]): The area to search (left, top, width, height).
+
+        Returns:
+            set[str]: The names of the candidate objects.
+        """
+
+        min_x, min_y, max_x, max_y = self.__get_cell_range(self.__to_edges(rect))
+
+        candidates = set(self.__oversized)
+
+        for cell_y in range(min_y, max_y + 1):
+            for cell_x in range(min_x, max_x + 1):
+
+                cell = self.__cells.get((cell_x, cell_y))
+
+                if cell is not None:
+                    candidates.update(cell)
+
+        return candidates
+
+
+    def query_rect(self, rect: tuple[float, float, float, float]) -> list[str]:
+        """
+        Returns the objects whose bounds overlap the rect.
+
+        Args:
+            rect (tuple[float, float, float, float]): The area to search (left, top, width, height).
+
+        Returns:
+            list[str]: The names of the overlapping objects.
+        """
+
+        edges = self.__to_edges(rect)
+
+        return [name for name in self.get_candidates(rect) if self.__is_overlapping(self.__rects[name], edges)]
+
+
+    def query_point(self, point: tuple[float, float], radius: float = 0) -> list[str]:
+        """
+        Returns the objects whose bounds are within the radius of a point.
+
+        Args:
+            point (tuple[float, float]): The point to search around (x, y).
+            radius (float): The distance from the point to search. Defaults to 0, only returning objects containing the
+            point.
+
+        Returns:
+            list[str]: The names of the objects near the point.
+        """
+
+        x, y = point
+        radius_squared = radius * radius
+
+        near: list[str] = []
+
+        for name in self.get_candidates((x - radius, y - radius, radius * 2, radius * 2)):
+            left, top, right, bottom = self.__rects[name]
+
+            ## Distance from the point to the closest point on the object's bounds.
+            dx = max(left - x, 0, x - right)
+            dy = max(top - y, 0, y - bottom)
+
+            if dx * dx + dy * dy <= radius_squared:
+                near.append(name)
+
+        return near
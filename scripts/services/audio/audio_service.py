@@ -11,6 +11,7 @@ GitHub Repo: https://github.com/karkin2002/Arctic-Engine.
 """
 
 
+import os
 from pygame import mixer
 from scripts.utility.logger import Logger
 from scripts.utility.basic import get_filename
@@ -286,6 +287,8 @@ class AudioService:
     CAT_ADD = "Audio category '{cat_name}' created."
     CAT_EXISTS = "Audio category '{cat_name}' already exists."
 
+    __HEADLESS_DRIVER = "dummy"
+
     def __init__(self, 
             volume: float, 
             max_channels: int = 16, 
@@ -293,12 +296,20 @@ class AudioService:
             size: int = -16, 
             channels: int = 2, 
             buffer: int = 512, 
-            device_name: str = None):
+            device_name: str = None,
+            headless: bool = False):
         
         self.volume = volume
 
         self.cat_dict = {}
 
+        ## If True, the mixer uses SDL's dummy audio driver, so the engine runs without a sound device (e.g. on build
+        ## agents). Sounds still load & play, but aren't heard.
+        self.headless = headless
+
+        if headless:
+            self.__init_headless_mixer()
+
         mixer.pre_init(frequency, size, channels, buffer, device_name) # Initialising the mixer
         mixer.init()
 
@@ -307,6 +318,18 @@ class AudioService:
         if max_channels < get_num_channels():
             set_num_channels(max_channels)
 
+    def __init_headless_mixer(self):
+        """
+        Switches the mixer to SDL's dummy audio driver, closing it if it was started with another driver (e.g. by
+        pygame.init).
+        """
+
+        if os.environ.get("SDL_AUDIODRIVER") == self.__HEADLESS_DRIVER:
+            return
+
+        mixer.quit()
+        os.environ["SDL_AUDIODRIVER"] = self.__HEADLESS_DRIVER
+
     ## Sets the overall volume for the application
     def set_volume(self, value: int):
         """Sets the overall volume for the application
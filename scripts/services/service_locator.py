@@ -32,6 +32,11 @@ class ServiceLocator:
             Logger.raise_exception(ServiceLocator.__SERVICE_NOT_REGISTERED.format(service_name=key.__name__))
 
 
+    @classmethod
+    def is_registered(cls, key: type[T]) -> bool:
+        return key in cls.__services
+
+
     @classmethod
     def clear(cls):
         cls.__services.clear()
\ No newline at end of file
@@ -0,0 +1,208 @@
+import numpy as np
+
+
+class AnimationGroup:
+    """
+    The animations sharing one definition (frame count, length & repeat). Each animation's start time is a slot in a
+    NumPy array, so the current frame of every animation in the group is computed at once, at most once per frame.
+
+    Setting up the batch has a fixed cost, so groups with fewer than __MIN_BATCH_SLOTS animations instead compute each
+    animation's frame on its own when it's looked up.
+    """
+
+    __INITIAL_CAPACITY = 16
+    __MIN_BATCH_SLOTS = 8
+
+    def __init__(self, clock: "AnimationClock", frame_count: int, animation_length_ms: float, repeat: bool):
+
+        self.__clock = clock
+
+        self.frame_count = frame_count
+        self.animation_length_ms = animation_length_ms
+        self.repeat = repeat
+
+        self.__start_ms = np.zeros(self.__INITIAL_CAPACITY, dtype=np.float64)
+        self.__free_slots: list[int] = []
+        self.__slot_count = 0
+
+        ## The frame indexes & finished flags of every slot, as lists so each animation's lookup is a plain list index.
+        ## They're recomputed when the clock's tick count no longer matches __computed_tick.
+        self.__frame_indexes: list[int] = [0] * self.__INITIAL_CAPACITY
+        self.__finished: list[bool] = [False] * self.__INITIAL_CAPACITY
+        self.__computed_tick = -1
+
+
+    def add_slot(self, start_ms: float) -> int:
+
+        if self.__free_slots:
+            slot = self.__free_slots.pop()
+
+        else:
+            slot = self.__slot_count
+            self.__slot_count += 1
+
+            if slot == len(self.__start_ms):
+                self.__start_ms = np.concatenate((self.__start_ms, np.zeros(len(self.__start_ms), dtype=np.float64)))
+                self.__frame_indexes.extend([0] * (len(self.__start_ms) - len(self.__frame_indexes)))
+                self.__finished.extend([False] * (len(self.__start_ms) - len(self.__finished)))
+
+        self.__start_ms[slot] = start_ms
+        self.__computed_tick = -1
+
+        return slot
+
+
+    def remove_slot(self, slot: int):
+        self.__free_slots.append(slot)
+
+
+    def __is_batched(self) -> bool:
+        return self.__slot_count - len(self.__free_slots) >= self.__MIN_BATCH_SLOTS
+
+
+    def restart_slot(self, slot: int):
+        """
+        Restarts a slot's animation at the clock's current time. The slot's cached frame is patched rather than the
+        whole group recomputed, so restarting many animations in one frame stays cheap.
+        """
+
+        self.__start_ms[slot] = self.__clock.time_ms
+        self.__frame_indexes[slot] = 0
+        self.__finished[slot] = False
+
+
+    def get_start_ms(self, slot: int) -> float:
+        return float(self.__start_ms[slot])
+
+
+    def update(self):
+        """
+        Computes the current frame index of every animation in the group, if not already computed this frame. Does
+        nothing for groups too small to batch.
+        """
+
+        if self.__computed_tick == self.__clock.get_tick_count() or not self.__is_batched():
+            return
+
+        self.__computed_tick = self.__clock.get_tick_count()
+
+        elapsed_ms = self.__clock.time_ms - self.__start_ms[:self.__slot_count]
+
+        if self.repeat:
+            frame_indexes = (elapsed_ms % self.animation_length_ms) * self.frame_count // self.animation_length_ms
+            finished = np.zeros(self.__slot_count, dtype=bool)
+
+        else:
+            finished = elapsed_ms >= self.animation_length_ms
+            frame_indexes = elapsed_ms * self.frame_count // self.animation_length_ms
+
+        frame_indexes = np.clip(frame_indexes, 0, self.frame_count - 1).astype(np.intp)
+
+        self.__frame_indexes[:self.__slot_count] = frame_indexes.tolist()
+        self.__finished[:self.__slot_count] = finished.tolist()
+
+
+    def __compute_slot(self, slot: int) -> tuple[int, bool]:
+        """
+        Computes the current frame index & finished flag of one slot, the same as update does for every slot.
+        """
+
+        elapsed_ms = self.__clock.time_ms - self.__start_ms.item(slot)
+
+        if self.repeat:
+            frame_index = int((elapsed_ms % self.animation_length_ms) * self.frame_count // self.animation_length_ms)
+            finished = False
+
+        else:
+            frame_index = int(elapsed_ms * self.frame_count // self.animation_length_ms)
+            finished = elapsed_ms >= self.animation_length_ms
+
+        return min(max(frame_index, 0), self.frame_count - 1), finished
+
+
+    def get_frame_index(self, slot: int) -> int:
+
+        if not self.__is_batched():
+            return self.__compute_slot(slot)[0]
+
+        self.update()
+        return self.__frame_indexes[slot]
+
+
+    def is_finished(self, slot: int) -> bool:
+
+        if not self.__is_batched():
+            return self.__compute_slot(slot)[1]
+
+        self.update()
+        return self.__finished[slot]
+
+
+class AnimationClock:
+    """
+    A clock shared by every Animation, advanced once per frame by TimeService. Animations measure their progress against
+    this clock rather than sampling the system time themselves, so setting the clock's speed (or pausing it) slows down,
+    speeds up or pauses every animation together, and stepping it by a fixed amount is deterministic.
+    """
+
+    def __init__(self):
+
+        self.time_ms: float = 0.0
+
+        ## Multiplies the time the clock advances by each frame. 0.5 is half speed, 2.0 is double speed.
+        self.speed: float = 1.0
+        self.paused: bool = False
+
+        ## Counts the times the clock has been advanced, used by groups to know when their frames are out of date.
+        self.__tick_count = 0
+
+        self.__groups: dict[tuple[int, float, bool], AnimationGroup] = {}
+
+
+    def advance(self, elapsed_ms: float):
+        """
+        Advances the clock. Run every frame by TimeService.tick, but can also be run directly to fast-forward.
+
+        Args:
+            elapsed_ms (float): The real time passed, which is scaled by speed.
+        """
+
+        if not self.paused:
+            self.time_ms += elapsed_ms * self.speed
+
+        self.__tick_count += 1
+
+
+    def get_tick_count(self) -> int:
+        return self.__tick_count
+
+
+    def get_group(self, frame_count: int, animation_length_ms: float, repeat: bool) -> AnimationGroup:
+        """
+        Gets the group of animations with a definition, creating it if it doesn't exist.
+
+        Args:
+            frame_count (int): The number of frames.
+            animation_length_ms (float): The length of the animation.
+            repeat (bool): Whether the animation repeats.
+
+        Returns:
+            AnimationGroup: The group.
+        """
+
+        key = (frame_count, animation_length_ms, repeat)
+
+        if key not in self.__groups:
+            self.__groups[key] = AnimationGroup(self, frame_count, animation_length_ms, repeat)
+
+        return self.__groups[key]
+
+
+    def update(self):
+        """
+        Computes the current frame of every animation, a batch per group. Groups are otherwise updated when one of their
+        animations is first drawn each frame, so running this is optional.
+        """
+
+        for group in self.__groups.values():
+            group.update()
@@ -2,9 +2,12 @@ from dataclasses import dataclass
 from typing import Any
 from scripts.game.components.tag_handler import TagHandler
 from os import path as os_path, makedirs
+from time import perf_counter_ns
 from json import dump as json_dump, load as json_load
 from scripts.utility.logger import Logger
 from scripts.utility.basic import get_filename
+from scripts.services.service_locator import ServiceLocator
+from scripts.services.utility.profiler_service import ProfilerService
 
 
 class PersistentData:
@@ -43,6 +46,16 @@ class PersistentDataService:
     def __init__(self):
         self.__data: dict[str, PersistentData] = {}
 
+        ## Saves & loads are added to the profiler's trace, if tracing.
+        self.__profiler: ProfilerService | None = None
+        if ServiceLocator.is_registered(ProfilerService):
+            self.__profiler = ServiceLocator.get(ProfilerService)
+
+    def __trace(self, name: str, filepath: str, start_ns: int):
+        if self.__profiler is not None:
+            self.__profiler.trace_event(
+                name, ProfilerService.CATEGORY_STORAGE, start_ns, perf_counter_ns(), {"filepath": filepath})
+
     @staticmethod
     def __load_data(filepath: str, default_data: dict | None = None) -> dict:
         if os_path.exists(filepath):
@@ -131,7 +144,11 @@ class PersistentDataService:
                 post_data=new_data
             ))
 
-        return self.__save_data(filepath = self.__data[name].filepath, data = self.__data[name].data)
+        start_ns = perf_counter_ns()
+        saved = self.__save_data(filepath = self.__data[name].filepath, data = self.__data[name].data)
+        self.__trace(f"save {name}", self.__data[name].filepath, start_ns)
+
+        return saved
 
 
     def __is_data_tagged(self, name, *tags: str) -> bool:
@@ -163,7 +180,9 @@ class PersistentDataService:
         if Logger.raise_key_error(self.__data, name, raise_exception=False):
             return None
 
+        start_ns = perf_counter_ns()
         loaded_data = self.__load_data(filepath = self.__data[name].filepath)
+        self.__trace(f"load {name}", self.__data[name].filepath, start_ns)
 
         if type(loaded_data) is dict:
             self.__data[name].data = loaded_data
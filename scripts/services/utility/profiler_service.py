@@ -0,0 +1,453 @@
+from json import dump as json_dump
+from os import path as os_path, makedirs
+from threading import Lock, current_thread, get_ident
+from time import perf_counter_ns
+from typing import Any
+import numpy as np
+from scripts.utility.logger import Logger
+
+
+class ProfilerService:
+    """
+    Records how long each phase of a frame takes, for the last capacity frames, and reports rolling percentiles of
+    them. Optionally also records how long each GameObject class spends in update & draw per frame.
+
+    Timings are taken with perf_counter_ns by the engine (ArcticEngine & GameObjectHandler) around each phase, and only
+    while enabled, so a disabled profiler costs a few attribute checks per frame. The class breakdown times every game
+    object individually, so has a noticeable cost of its own, and is off by default.
+
+    A trace of a number of frames can also be captured with start_trace, recording every phase, fixed update, game
+    object update & draw, image load & persistent data save as an event on a timeline. The trace is written as a Chrome
+    trace JSON file, which can be opened in Perfetto (ui.perfetto.dev) or chrome://tracing.
+    """
+
+    __SERVICE_START = "Profiler Service Started. Capacity: {capacity} frames."
+    __TRACE_STARTED = "Trace of {frames} frames started, to be saved to '{filepath}'."
+    __TRACE_SAVED = "Trace of {frames} frames ({event_count} events) saved to '{filepath}'."
+    __TRACE_SAVE_FAILED = "Failed to save trace to '{filepath}': {exception}."
+    __TRACE_ALREADY_RUNNING = "A trace is already running, to be saved to '{filepath}'."
+    __TRACE_EVENTS_DROPPED = "Trace reached its limit of {max_trace_events} events, {dropped} later events were dropped."
+
+    ## Phases of a frame. DRAW_OBJECTS is culling, sorting & each object's draw call, BLIT is drawing the surfaces to
+    ## the window, PRESENT is updating the display. UPDATE includes every FIXED_UPDATE run that frame.
+    FRAME = 0
+    EVENTS = 1
+    UPDATE = 2
+    FIXED_UPDATE = 3
+    DRAW = 4
+    DRAW_PREPARE = 5
+    DRAW_OBJECTS = 6
+    BLIT = 7
+    PRESENT = 8
+
+    PHASE_NAMES = ("frame", "events", "update", "fixed_update", "draw", "draw_prepare", "draw_objects", "blit", "present")
+
+    ## Kinds of time recorded per GameObject class.
+    CLASS_UPDATE = "update"
+    CLASS_DRAW = "draw"
+
+    ## Trace event categories, used to filter events in the trace viewer.
+    CATEGORY_ENGINE = "engine"
+    CATEGORY_ASSET = "asset"
+    CATEGORY_STORAGE = "storage"
+
+    __TRACE_PROCESS_NAME = "Arctic Engine"
+
+    DEFAULT_PERCENTILES = (50, 95, 99)
+
+    def __init__(self, capacity: int = 600, max_trace_events: int = 1_000_000):
+        """
+        Parameters:
+            capacity (int): The number of frames kept, i.e. the window the percentiles are taken over. Defaults to 600.
+            max_trace_events (int): The most events a trace holds, any later events are dropped. Bounds the memory used
+                by a long trace. Defaults to 1,000,000.
+        """
+
+        self.capacity = max(1, capacity)
+        self.max_trace_events = max_trace_events
+
+        ## Whether timings are being recorded.
+        self.enabled = False
+
+        ## Whether the time each GameObject class spends in update & draw is recorded, while enabled.
+        self.class_breakdown = False
+
+        ## Ring buffer of phase durations (ns), one row per frame.
+        self.__phase_ns = np.zeros((self.capacity, len(self.PHASE_NAMES)), dtype=np.int64)
+        self.__current_phase_ns = [0] * len(self.PHASE_NAMES)
+
+        ## Ring buffers of per class durations (ns) by (class name, kind). NaN for frames before the class was seen.
+        self.__class_ns: dict[tuple[str, str], np.ndarray] = {}
+        self.__current_class_ns: dict[tuple[str, str], int] = {}
+
+        self.__frame_index = 0
+        self.__frame_count = 0
+        self.__frame_start_ns: int | None = None
+
+        ## Whether trace events are being recorded (see start_trace).
+        self.tracing = False
+
+        ## Trace events, as (name, category, start ns, duration ns, thread id, args). May be added to from any thread,
+        ## so the events, thread names & tracing flag are only changed while holding the lock.
+        self.__trace_lock = Lock()
+        self.__trace_events: list[tuple[str, str, int, int, int, dict[str, Any] | None]] = []
+        self.__trace_thread_names: dict[int, str] = {}
+        self.__trace_events_dropped = 0
+        self.__trace_filepath: str | None = None
+        self.__trace_frames = 0
+        self.__trace_frames_left = 0
+        self.__trace_start_ns = 0
+        self.__enabled_before_trace = False
+
+        Logger.log_info(self.__SERVICE_START.format(capacity=self.capacity))
+
+
+    def begin_frame(self):
+        """
+        Marks the start of a frame. Run by ArcticEngine.handle_events.
+        """
+
+        ## A requested trace starts at the beginning of a frame, so it only holds whole frames.
+        if self.__trace_frames_left and not self.tracing:
+            self.__enabled_before_trace = self.enabled
+            self.enabled = True
+            self.__trace_start_ns = perf_counter_ns()
+
+            with self.__trace_lock:
+                self.tracing = True
+
+        if self.enabled:
+            self.__frame_start_ns = perf_counter_ns()
+
+
+    def end_frame(self):
+        """
+        Marks the end of a frame, adding its timings to the ring buffer. Run by ArcticEngine.draw.
+        """
+
+        if self.__frame_start_ns is None:
+            return
+
+        frame_end_ns = perf_counter_ns()
+        self.__current_phase_ns[self.FRAME] = frame_end_ns - self.__frame_start_ns
+
+        self.__phase_ns[self.__frame_index] = self.__current_phase_ns
+        self.__current_phase_ns = [0] * len(self.PHASE_NAMES)
+
+        for class_key, class_ns in self.__class_ns.items():
+            class_ns[self.__frame_index] = self.__current_class_ns.get(class_key, 0)
+
+        for class_key, duration_ns in self.__current_class_ns.items():
+            if class_key not in self.__class_ns:
+                class_ns = np.full(self.capacity, np.nan)
+                class_ns[self.__frame_index] = duration_ns
+                self.__class_ns[class_key] = class_ns
+
+        self.__current_class_ns.clear()
+
+        self.__frame_index = (self.__frame_index + 1) % self.capacity
+        self.__frame_count = min(self.__frame_count + 1, self.capacity)
+
+        if self.tracing:
+            frame_number = self.__trace_frames - self.__trace_frames_left
+            self.trace_event("frame", self.CATEGORY_ENGINE, self.__frame_start_ns, frame_end_ns, {"frame": frame_number})
+
+            self.__trace_frames_left -= 1
+            if not self.__trace_frames_left:
+                self.stop_trace()
+
+        self.__frame_start_ns = None
+
+
+    def add_phase_time(self, phase: int, duration_ns: int):
+        """
+        Adds time to a phase of the current frame. Phases run more than once a frame (e.g. FIXED_UPDATE) add up.
+
+        Parameters:
+            phase (int): The phase, e.g. ProfilerService.DRAW.
+            duration_ns (int): The time taken, in nanoseconds.
+        """
+        self.__current_phase_ns[phase] += duration_ns
+
+
+    def record_phase(self, phase: int, start_ns: int, end_ns: int):
+        """
+        Adds a run of a phase to the current frame, & to the trace if tracing.
+
+        Parameters:
+            phase (int): The phase, e.g. ProfilerService.DRAW.
+            start_ns (int): When the phase started, from perf_counter_ns.
+            end_ns (int): When the phase ended, from perf_counter_ns.
+        """
+
+        self.__current_phase_ns[phase] += end_ns - start_ns
+
+        if self.tracing:
+            self.trace_event(self.PHASE_NAMES[phase], self.CATEGORY_ENGINE, start_ns, end_ns)
+
+
+    def record_object(self, name: str, game_obj: object, kind: str, start_ns: int, end_ns: int):
+        """
+        Adds a game object's update or draw to its class's time for the current frame (if class_breakdown is
+        enabled), & to the trace if tracing.
+
+        Parameters:
+            name (str): The game object's name.
+            game_obj (object): The game object.
+            kind (str): ProfilerService.CLASS_UPDATE or ProfilerService.CLASS_DRAW.
+            start_ns (int): When the update or draw started, from perf_counter_ns.
+            end_ns (int): When the update or draw ended, from perf_counter_ns.
+        """
+
+        class_name = type(game_obj).__name__
+
+        if self.class_breakdown:
+            self.add_class_time(class_name, kind, end_ns - start_ns)
+
+        if self.tracing:
+            self.trace_event(name, kind, start_ns, end_ns, {"class": class_name})
+
+
+    def add_class_time(self, class_name: str, kind: str, duration_ns: int):
+        """
+        Adds time spent by a GameObject class to the current frame.
+
+        Parameters:
+            class_name (str): The name of the game object's class.
+            kind (str): ProfilerService.CLASS_UPDATE or ProfilerService.CLASS_DRAW.
+            duration_ns (int): The time taken, in nanoseconds.
+        """
+        class_key = (class_name, kind)
+        self.__current_class_ns[class_key] = self.__current_class_ns.get(class_key, 0) + duration_ns
+
+
+    def get_frame_count(self) -> int:
+        """
+        Returns the number of frames in the ring buffer.
+        """
+        return self.__frame_count
+
+
+    def get_phase_percentiles(self,
+                              phase: int,
+                              percentiles: tuple[float, ...] = DEFAULT_PERCENTILES) -> dict[float, float]:
+        """
+        Gets percentiles of a phase's duration over the recorded frames.
+
+        Parameters:
+            phase (int): The phase, e.g. ProfilerService.FRAME.
+            percentiles (tuple[float, ...]): The percentiles. Defaults to (50, 95, 99).
+
+        Returns:
+            dict[float, float]: The duration in milliseconds at each percentile. Empty if no frames are recorded.
+        """
+
+        if not self.__frame_count:
+            return {}
+
+        values = np.percentile(self.__phase_ns[:self.__frame_count, phase], percentiles) / 1e6
+        return dict(zip(percentiles, values.tolist()))
+
+
+    def get_report(self, percentiles: tuple[float, ...] = DEFAULT_PERCENTILES) -> dict[str, dict[float, float]]:
+        """
+        Gets percentiles of every phase's duration over the recorded frames.
+
+        Parameters:
+            percentiles (tuple[float, ...]): The percentiles. Defaults to (50, 95, 99).
+
+        Returns:
+            dict[str, dict[float, float]]: The duration in milliseconds at each percentile, by phase name.
+        """
+
+        return {phase_name: self.get_phase_percentiles(phase, percentiles)
+                for phase, phase_name in enumerate(self.PHASE_NAMES)}
+
+
+    def get_class_report(self,
+                         percentiles: tuple[float, ...] = DEFAULT_PERCENTILES) -> dict[tuple[str, str], dict[float, float]]:
+        """
+        Gets percentiles of the time spent per frame by each GameObject class, over the recorded frames since the class
+        was first seen. Only recorded while class_breakdown is enabled.
+
+        Parameters:
+            percentiles (tuple[float, ...]): The percentiles. Defaults to (50, 95, 99).
+
+        Returns:
+            dict[tuple[str, str], dict[float, float]]: The time in milliseconds at each percentile, by (class name,
+            kind), slowest first by the last percentile.
+        """
+
+        class_report = {}
+
+        for class_key, class_ns in self.__class_ns.items():
+            values = np.nanpercentile(class_ns[:self.__frame_count], percentiles) / 1e6
+            class_report[class_key] = dict(zip(percentiles, values.tolist()))
+
+        return dict(sorted(class_report.items(), key=lambda item: item[1][percentiles[-1]], reverse=True))
+
+
+    def format_report(self, percentiles: tuple[float, ...] = DEFAULT_PERCENTILES) -> str:
+        """
+        Formats the phase & class reports as a table, e.g. for printing or logging.
+        """
+
+        header = "".join(f"{f'p{percentile:g}':>10}" for percentile in percentiles)
+        lines = [f"{f'{self.__frame_count} frames (ms)':<32}{header}"]
+
+        for name, values in self.get_report(percentiles).items():
+            lines.append(f"  {name:<30}" + "".join(f"{value:>10.3f}" for value in values.values()))
+
+        for (class_name, kind), values in self.get_class_report(percentiles).items():
+            lines.append(f"  {f'{class_name}.{kind}':<30}" + "".join(f"{value:>10.3f}" for value in values.values()))
+
+        return "\n".join(lines)
+
+
+    def start_trace(self, filepath: str, frames: int = 300) -> bool:
+        """
+        Starts capturing a trace from the next frame. Once the number of frames have been traced, the trace is written
+        to a Chrome trace JSON file. The profiler is enabled while tracing.
+
+        Parameters:
+            filepath (str): The file the trace is written to, e.g. "logs/trace.json".
+            frames (int): The number of frames traced. Defaults to 300.
+
+        Returns:
+            bool: True if the trace was started, False if a trace is already running.
+        """
+
+        if self.__trace_frames_left:
+            Logger.log_warning(self.__TRACE_ALREADY_RUNNING.format(filepath=self.__trace_filepath))
+            return False
+
+        self.__trace_filepath = filepath
+        self.__trace_frames = max(1, frames)
+        self.__trace_frames_left = self.__trace_frames
+
+        with self.__trace_lock:
+            self.__trace_events = []
+            self.__trace_thread_names = {}
+            self.__trace_events_dropped = 0
+
+        Logger.log_info(self.__TRACE_STARTED.format(frames=self.__trace_frames, filepath=filepath))
+
+        return True
+
+
+    def trace_event(self, name: str, category: str, start_ns: int, end_ns: int, args: dict[str, Any] | None = None):
+        """
+        Adds an event to the trace, if tracing & the trace isn't full. Safe to run on any thread.
+
+        Parameters:
+            name (str): The event's name.
+            category (str): The event's category, e.g. ProfilerService.CATEGORY_ASSET.
+            start_ns (int): When the event started, from perf_counter_ns.
+            end_ns (int): When the event ended, from perf_counter_ns.
+            args (dict[str, Any] | None): Extra details shown with the event. Defaults to None.
+        """
+
+        if not self.tracing:
+            return
+
+        thread_id = get_ident()
+
+        with self.__trace_lock:
+
+            ## Checked again, as the trace may have been stopped since, & the events it held already saved.
+            if not self.tracing:
+                return
+
+            if len(self.__trace_events) >= self.max_trace_events:
+                self.__trace_events_dropped += 1
+                return
+
+            if thread_id not in self.__trace_thread_names:
+                self.__trace_thread_names[thread_id] = current_thread().name
+
+            self.__trace_events.append((name, category, start_ns, end_ns - start_ns, thread_id, args))
+
+
+    def stop_trace(self) -> bool:
+        """
+        Stops the running trace early & writes what was captured. Otherwise run once the trace's frames are done.
+
+        Returns:
+            bool: True if the trace was written.
+        """
+
+        if not self.__trace_frames_left and not self.tracing:
+            return False
+
+        if self.tracing:
+            self.enabled = self.__enabled_before_trace
+
+        with self.__trace_lock:
+            self.tracing = False
+            trace_events, self.__trace_events = self.__trace_events, []
+            thread_names, self.__trace_thread_names = self.__trace_thread_names, {}
+            events_dropped = self.__trace_events_dropped
+
+        frames_traced = self.__trace_frames - self.__trace_frames_left
+        self.__trace_frames_left = 0
+
+        if events_dropped:
+            Logger.log_warning(self.__TRACE_EVENTS_DROPPED.format(
+                max_trace_events=self.max_trace_events, dropped=events_dropped))
+
+        return self.__save_trace(self.__trace_filepath, trace_events, thread_names, frames_traced)
+
+
+    def __save_trace(self,
+                     filepath: str,
+                     trace_events: list[tuple[str, str, int, int, int, dict[str, Any] | None]],
+                     thread_names: dict[int, str],
+                     frames: int) -> bool:
+        """
+        Writes trace events as a Chrome trace JSON file, as complete ("X") events with microsecond timestamps.
+        """
+
+        json_events: list[dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": 0, "tid": 0, "args": {"name": self.__TRACE_PROCESS_NAME}}]
+
+        for thread_id, thread_name in thread_names.items():
+            json_events.append(
+                {"name": "thread_name", "ph": "M", "pid": 0, "tid": thread_id, "args": {"name": thread_name}})
+
+        for name, category, start_ns, duration_ns, thread_id, args in trace_events:
+            json_event = {"name": name, "cat": category, "ph": "X", "pid": 0, "tid": thread_id,
+                          "ts": (start_ns - self.__trace_start_ns) / 1000, "dur": duration_ns / 1000}
+
+            if args:
+                json_event["args"] = args
+
+            json_events.append(json_event)
+
+        try:
+            if os_path.dirname(filepath):
+                makedirs(os_path.dirname(filepath), exist_ok=True)
+
+            with open(filepath, "w") as f:
+                json_dump({"traceEvents": json_events, "displayTimeUnit": "ms"}, f)
+
+        except (OSError, TypeError, ValueError) as exception:
+            Logger.log_error(self.__TRACE_SAVE_FAILED.format(filepath=filepath, exception=exception))
+            return False
+
+        Logger.log_info(self.__TRACE_SAVED.format(frames=frames, event_count=len(trace_events), filepath=filepath))
+
+        return True
+
+
+    def reset(self):
+        """
+        Clears every recorded frame.
+        """
+
+        self.__phase_ns.fill(0)
+        self.__current_phase_ns = [0] * len(self.PHASE_NAMES)
+        self.__class_ns.clear()
+        self.__current_class_ns.clear()
+        self.__frame_index = 0
+        self.__frame_count = 0
+        self.__frame_start_ns = None
@@ -1,5 +1,6 @@
 from scripts.utility.logger import Logger
 from pygame import time as pygame_time
+from scripts.services.utility.animation_clock import AnimationClock
 
 class TimeService:
 
@@ -31,12 +32,17 @@ class TimeService:
         self.fixed_delta_time = update_time_ms / 1000.0
 
         self.__tick_method = None
+        self.__fixed_frame_time_ms: float | None = None
         self.set_stable_framerate(stable_framerate)
 
         self.elapsed_time = 0.0
+        self.total_time_ms = 0.0
         self.lag = 0.0
         self.interpolated_time = 0.0
 
+        ## Drives every Animation. Pause it or change its speed to pause, slow down or speed up all animations.
+        self.animation_clock = AnimationClock()
+
 
     def set_stable_framerate(self, stable_framerate: bool):
         """
@@ -57,13 +63,31 @@ class TimeService:
         Logger.log_info(self.__STABLE_FRAMERATE_SET_TEXT.format(stable_framerate=stable_framerate))
 
 
+    def set_fixed_frame_time(self, frame_time_ms: float | None):
+        """
+        Makes every frame take a fixed amount of time, instead of measuring it with the clock. tick then returns
+        immediately (the framerate isn't limited), so a run is deterministic & as fast as possible, e.g. when headless.
+
+        Args:
+            frame_time_ms (float | None): The time each frame takes, in milliseconds. None goes back to measuring it.
+        """
+
+        self.__fixed_frame_time_ms = frame_time_ms
+
+
     def tick(self):
         """
         Updates the time values. Should be run every frame.
         """
-        self.elapsed_time = self.__tick_method(self.framerate)
+        if self.__fixed_frame_time_ms is None:
+            self.elapsed_time = self.__tick_method(self.framerate)
+        else:
+            self.elapsed_time = self.__fixed_frame_time_ms
+
+        self.total_time_ms += self.elapsed_time
         self.lag += self.elapsed_time
         self.interpolated_time = self.lag / self.update_time_ms
+        self.animation_clock.advance(self.elapsed_time)
 
 
     def is_update(self) -> bool:
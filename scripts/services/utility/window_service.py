@@ -1,14 +1,21 @@
+import os
+from collections import deque
 from pygame import display as pygame_display, SCALED, FULLSCREEN
-from pygame import Vector2, Surface
+from pygame import Vector2, Surface, Rect
 from scripts.services.service_locator import  ServiceLocator
 from scripts.services.visual.colour_service import ColourService
+from scripts.services.visual.image_service import ImageService
 
 
 class WindowService:
+
+    __HEADLESS_DRIVER = "dummy"
+
     def __init__(self,
                  dim: tuple[int, int],
                  flags = (SCALED | FULLSCREEN),
-                 vsync: bool = True):
+                 vsync: bool = True,
+                 headless: bool = False):
 
         self.dim = Vector2(dim)
         self.center = Vector2(0, 0)
@@ -17,6 +24,20 @@ class WindowService:
         self.vsync = vsync
         self.flags = flags
 
+        ## If True, only the areas of the window that changed are redrawn & updated each frame, instead of clearing &
+        ## flipping the whole window. Worthwhile for mostly static scenes (menus, idle or turn based screens). If the
+        ## changed area is more than dirty_rect_threshold of the window, the whole window is redrawn instead.
+        self.dirty_rect_mode = False
+        self.dirty_rect_threshold = 0.5
+
+        ## If True, the window is an offscreen surface from SDL's dummy video driver, so the engine runs without a
+        ## display (e.g. for benchmarks, tests & server side simulation). Flags & vsync are ignored, and draw doesn't
+        ## update a display.
+        self.headless = headless
+
+        ## Copies of the most recently drawn frames, oldest first, if frame capture is enabled (see set_frame_capture).
+        self.captured_frames: deque[Surface] = deque(maxlen=0)
+
         self.set_win(self.dim)
         self.background_colour = None
 
@@ -29,14 +50,38 @@ class WindowService:
             win_dim (tuple[int, int]): WindowService (<width>, <height>).
         """
 
-        self.win = pygame_display.set_mode(
-            win_dim,
-            self.flags,
-            vsync = 1 if self.vsync else 0
-        )
+        if self.headless:
+            self.__init_headless_display()
+            self.win = pygame_display.set_mode(win_dim, 0, vsync = 0)
+
+        else:
+            self.win = pygame_display.set_mode(
+                win_dim,
+                self.flags,
+                vsync = 1 if self.vsync else 0
+            )
 
         self.resize()
 
+        ## Images are converted to the display's pixel format, which is only known once the display is set. Any image
+        ## still not in the display's format afterwards is logged, as every blit of it will be converted per pixel.
+        if ServiceLocator.is_registered(ImageService):
+            image_service = ServiceLocator.get(ImageService)
+            image_service.convert_images()
+            image_service.check_converted()
+
+    def __init_headless_display(self):
+        """
+        Initialises the display with SDL's dummy video driver, reinitialising it if it was started with another driver.
+        """
+
+        if pygame_display.get_init() and pygame_display.get_driver() == self.__HEADLESS_DRIVER:
+            return
+
+        pygame_display.quit()
+        os.environ["SDL_VIDEODRIVER"] = self.__HEADLESS_DRIVER
+        pygame_display.init()
+
     def resize(self):
         """
         Handles the event upon which the window is resized.
@@ -44,8 +89,35 @@ class WindowService:
         self.dim.update(self.win.get_size())
         self.center.update(round(self.dim[0] / 2), round(self.dim[1] / 2))
 
-    def draw(self):
-        pygame_display.flip()
+    def draw(self, dirty_rects: list[Rect] | None = None):
+        """
+        Updates the display, or in headless mode only captures the frame (if frame capture is enabled).
+
+        Args:
+            dirty_rects (list[Rect] | None, optional): The areas of the window to update. Defaults to None, updating
+            the whole window.
+        """
+        if self.captured_frames.maxlen:
+            self.captured_frames.append(self.win.copy())
+
+        if self.headless:
+            return
+
+        if dirty_rects is None:
+            pygame_display.flip()
+
+        elif dirty_rects:
+            pygame_display.update(dirty_rects)
+
+    def set_frame_capture(self, max_frames: int):
+        """
+        Sets how many of the most recently drawn frames are kept in captured_frames, e.g. to compare against reference
+        images. Each frame is a copy of the window, so keep this small for large windows.
+
+        Args:
+            max_frames (int): The number of frames kept. 0 disables frame capture & clears the captured frames.
+        """
+        self.captured_frames = deque(self.captured_frames, maxlen=max(0, max_frames))
 
     def draw_background(self):
         if self.background_colour is not None:
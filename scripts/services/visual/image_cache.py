@@ -0,0 +1,148 @@
+from hashlib import sha1
+from mmap import mmap, ACCESS_READ
+from os import path as os_path, makedirs, replace as os_replace, stat as os_stat, listdir as os_listdir, remove as os_remove
+from struct import Struct
+from pygame import Surface, image as py_image, SRCALPHA
+from scripts.utility.logger import Logger
+
+
+class ImageCache:
+    """
+    On-disk cache of decoded images, so that a warm start can map an image's raw pixels straight into a surface instead
+    of decoding the PNG again. Each entry is keyed by the source file's path, and stores the source's modification time
+    & size; an entry that no longer matches its source is rebuilt automatically the next time it's loaded.
+
+    Entry layout: a header (see __HEADER), followed by the raw pixels in RGB or RGBA order.
+    """
+
+    __ENTRY_FILETYPE = ".raw"
+    __MAGIC = b"AEIC"
+    __VERSION = 1
+
+    ## magic, version, source modification time (ns), source size, width, height, pixel format.
+    __HEADER = Struct("<4sHqqII4s")
+
+    __CACHE_STARTED = "Image cache started in '{cache_dir}'."
+    __ENTRY_BUILT = "Image cache entry for '{filepath}' built."
+    __ENTRY_READ_FAILED = "Image cache entry for '{filepath}' could not be read: {exception}. Rebuilding entry."
+    __ENTRY_WRITE_FAILED = "Image cache entry for '{filepath}' could not be written: {exception}."
+    __ENTRIES_PRUNED = "Pruned {entry_count} unused image cache entries."
+
+    def __init__(self, cache_dir: str):
+
+        self.cache_dir = cache_dir
+        makedirs(cache_dir, exist_ok=True)
+
+        Logger.log_info(self.__CACHE_STARTED.format(cache_dir=cache_dir))
+
+
+    def __get_entry_path(self, filepath: str) -> str:
+        key = sha1(os_path.abspath(filepath).encode()).hexdigest()
+        return os_path.join(self.cache_dir, key + self.__ENTRY_FILETYPE)
+
+
+    def __read_entry(self, entry_path: str, mtime_ns: int, file_size: int) -> Surface | None:
+        """
+        Maps an entry's pixels into a surface. Returns None if the entry doesn't exist or is stale.
+        """
+
+        if not os_path.exists(entry_path):
+            return None
+
+        with open(entry_path, "rb") as entry_file, mmap(entry_file.fileno(), 0, access=ACCESS_READ) as entry_map:
+
+            if len(entry_map) < self.__HEADER.size:
+                return None
+
+            magic, version, entry_mtime_ns, entry_file_size, width, height, pixel_format = \
+                self.__HEADER.unpack_from(entry_map)
+
+            if (magic != self.__MAGIC or version != self.__VERSION or
+                    entry_mtime_ns != mtime_ns or entry_file_size != file_size):
+                return None
+
+            pixel_format = pixel_format.rstrip(b"\0").decode()
+
+            ## The surface shares the mapped memory, so it's copied before the map is closed.
+            with memoryview(entry_map)[self.__HEADER.size:] as pixels:
+                mapped_surf = py_image.frombuffer(pixels, (width, height), pixel_format)
+                image_surf = mapped_surf.copy()
+                del mapped_surf
+
+        return image_surf
+
+
+    def __write_entry(self, entry_path: str, image_surf: Surface, mtime_ns: int, file_size: int):
+
+        pixel_format = "RGBA" if image_surf.get_flags() & SRCALPHA else "RGB"
+        width, height = image_surf.get_size()
+
+        ## Written to a temporary file first, so an interrupted write never leaves a corrupt entry.
+        temp_path = entry_path + ".tmp"
+
+        with open(temp_path, "wb") as entry_file:
+            entry_file.write(self.__HEADER.pack(
+                self.__MAGIC, self.__VERSION, mtime_ns, file_size, width, height, pixel_format.encode()))
+            entry_file.write(py_image.tobytes(image_surf, pixel_format))
+
+        os_replace(temp_path, entry_path)
+
+
+    def load(self, filepath: str) -> Surface:
+        """
+        Loads an image, from its cache entry if it's up to date, otherwise by decoding the file & rebuilding the entry.
+        Safe to run on loader threads.
+
+        Args:
+            filepath (str): The path of the image file.
+
+        Returns:
+            Surface: The loaded image.
+        """
+
+        file_stat = os_stat(filepath)
+        entry_path = self.__get_entry_path(filepath)
+
+        try:
+            image_surf = self.__read_entry(entry_path, file_stat.st_mtime_ns, file_stat.st_size)
+
+            if image_surf is not None:
+                return image_surf
+
+        except (OSError, ValueError) as exception:
+            Logger.log_warning(self.__ENTRY_READ_FAILED.format(filepath=filepath, exception=exception))
+
+        image_surf = py_image.load(filepath)
+
+        try:
+            self.__write_entry(entry_path, image_surf, file_stat.st_mtime_ns, file_stat.st_size)
+            Logger.log_info(self.__ENTRY_BUILT.format(filepath=filepath))
+
+        except OSError as exception:
+            Logger.log_warning(self.__ENTRY_WRITE_FAILED.format(filepath=filepath, exception=exception))
+
+        return image_surf
+
+
+    def prune(self, filepaths: list[str]) -> int:
+        """
+        Deletes every cache entry except those for the given files.
+
+        Args:
+            filepaths (list[str]): The image files whose entries should be kept.
+
+        Returns:
+            int: The number of entries deleted.
+        """
+
+        keep = {os_path.basename(self.__get_entry_path(filepath)) for filepath in filepaths}
+        pruned = 0
+
+        for filename in os_listdir(self.cache_dir):
+            if filename.endswith(self.__ENTRY_FILETYPE) and filename not in keep:
+                os_remove(os_path.join(self.cache_dir, filename))
+                pruned += 1
+
+        Logger.log_info(self.__ENTRIES_PRUNED.format(entry_count=pruned))
+
+        return pruned
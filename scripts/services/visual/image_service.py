@@ -1,6 +1,15 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future, wait as futures_wait
 from scripts.utility.logger import Logger
-from pygame import surface as surface, time as py_time, Surface, image as py_image
+from scripts.utility.rect_packer import pack_rects
+from scripts.services.visual.colour_service import ColourService
+from scripts.services.visual.image_cache import ImageCache
+from scripts.services.service_locator import ServiceLocator
+from scripts.services.utility.profiler_service import ProfilerService
+from pygame import (surface as surface, time as py_time, Surface, image as py_image, display as py_display, SRCALPHA,
+                    BLEND_RGBA_MAX)
 from os import path as os_path, listdir as os_listdir
+from time import perf_counter_ns
 
 
 class Image:
@@ -9,38 +18,168 @@ class Image:
 
     def __init__(self,
                  image_name: str,
-                 image_surface: surface):
+                 image_surface: surface,
+                 alpha: bool = True,
+                 filepath: str | None = None):
 
         self.image_name = image_name
+
+        ## Incremented whenever the image's surface is replaced (e.g. converted, packed into an atlas, unloaded or
+        ## reloaded), so anything holding on to the surface knows to get it again.
+        self.generation = 0
+
         self.surface = image_surface
         self.dim = image_surface.get_size()
         self.timestamp = py_time.get_ticks()
 
+        ## Whether the image is converted to the display format with per-pixel alpha (convert_alpha) or opaque
+        ## (convert).
+        self.alpha = alpha
+
+        ## (atlas name, atlas surface index, rect) if the image's surface is a subsurface of an atlas.
+        self.atlas: tuple[str, int, tuple[int, int, int, int]] | None = None
+
+        ## The file the image was loaded from, allowing it to be unloaded from memory & reloaded when next needed.
+        self.filepath = filepath
+
         Logger.log_info(self.__IMAGE_INIT_TEXT.format(image_name=image_name, timestamp=self.timestamp))
 
 
+    @property
+    def surface(self) -> Surface | None:
+        return self.__surface
+
+
+    @surface.setter
+    def surface(self, surface: Surface | None):
+        self.__surface = surface
+        self.generation += 1
+
+
+    def get_byte_size(self) -> int:
+        """
+        Returns the memory used by the image's pixels, or 0 if the image isn't loaded.
+        """
+        if self.surface is None:
+            return 0
+
+        return self.dim[0] * self.dim[1] * self.surface.get_bytesize()
+
+
+    def is_unloadable(self) -> bool:
+        """
+        Returns True if the image can be unloaded from memory & reloaded from its file. Images packed into an atlas
+        can't be, as the atlas holds their pixels.
+        """
+        return self.filepath is not None and self.atlas is None
+
+
+
+
+class ImageLoadBatch:
+    """
+    Tracks the progress of a group of images being loaded in the background by ImageService, e.g. for a loading screen.
+    """
+
+    def __init__(self, image_names: list[str], atlas_name: str | None = None):
+
+        self.image_names = image_names
+        self.atlas_name = atlas_name
+
+        self.loaded_count = 0
+        self.failed_image_names: list[str] = []
+
+
+    def get_progress(self) -> float:
+        """
+        Returns:
+            float: The fraction of the batch's images that have finished loading (or failed), from 0.0 to 1.0.
+        """
+        if not self.image_names:
+            return 1.0
+
+        return (self.loaded_count + len(self.failed_image_names)) / len(self.image_names)
+
+
+    def is_done(self) -> bool:
+        return self.loaded_count + len(self.failed_image_names) >= len(self.image_names)
+
+
 
 
 class ImageService:
 
     __IMAGE_FILETYPE = ".png"
 
-    __IMAGE_SERVICE_START = "Image Service Started. Temp Image Lifespan: {temp_image_lifespan} ms."
+    __IMAGE_SERVICE_START = ("Image Service Started. Temp Image Lifespan: {temp_image_lifespan} ms. "
+                             "Temp Image Budget: {temp_image_budget} bytes.")
     __IMAGE_ALREADY_EXISTS = "Image '{image_name}' already exists. Image not created."
     __INVALID_IMAGE_NAME = "Image '{image_name}' doesn't exist."
     __IMAGE_DELETED = "Image '{image_name}' deleted at timestamp: {timestamp} ms."
-    __TEMP_IMAGE_DELETED = "Image '{image_name}' lifespan expired."
+    __TEMP_IMAGE_UNLOADED = "Temp image '{image_name}' unloaded ({reason}). {byte_size} bytes freed."
+    __TEMP_IMAGE_RELOADED = "Temp image '{image_name}' reloaded from '{filepath}'."
+    __LIFESPAN_EXPIRED = "lifespan expired"
+    __OVER_BUDGET = "over budget"
     __FOLDER_PATH_DOES_NOT_EXIST = "Failed to load images in folder '{folder_path}' as it doesn't exist."
+    __ATLAS_BUILT = "Atlas '{atlas_name}' built from {image_count} images into {surface_count} surfaces {dims}."
+    __ATLAS_IMAGE_TOO_LARGE = "Image '{image_name}' is larger than the max atlas size {max_dim}. Image not packed."
+    __IMAGES_CONVERTED = "Converted {image_count} images & {atlas_count} atlases to the display format."
+    __IMAGE_NOT_CONVERTED = "Image '{image_name}' is not in the display format. Blits of it will be slower."
+    __IMAGE_LOAD_FAILED = "Failed to load image '{image_name}' from '{filepath}': {exception}."
+    __BATCH_LOADED = "Background loaded {loaded_count} images ({failed_count} failed) from '{folder_path}'."
+
+    __PENDING_IMAGE_NAME = "pending_image"
 
     def __init__(self,
-                 temp_image_lifespan_ms: float = 600000):
+                 temp_image_lifespan_ms: float = 600000,
+                 temp_image_budget_bytes: int | None = None,
+                 loader_threads: int = 4,
+                 cache_dir: str | None = None):
 
         self.__image_dict: dict[str, Image] = {}
 
-        self.__temp_image_dict: dict[str, Image] = {}
+        ## If set, decoded images are cached on disk, so later runs don't need to decode them again.
+        self.__image_cache = ImageCache(cache_dir) if cache_dir is not None else None
+
+        ## Loaded temp images, ordered from least to most recently used. Temp images are unloaded once they haven't
+        ## been used for temp_image_lifespan_ms, or least recently used first whenever the loaded temp images exceed
+        ## temp_image_budget_bytes (None for no budget). Unloaded images are reloaded from file by get().
+        self.__temp_image_dict: OrderedDict[str, Image] = OrderedDict()
+        self.__unloaded_temp_image_dict: dict[str, Image] = {}
+        self.__temp_image_bytes = 0
+
         self.temp_image_lifespan_ms = temp_image_lifespan_ms
+        self.temp_image_budget_bytes = temp_image_budget_bytes
+
+        ## Images being decoded on the loader threads, by image name: (batch, future, filepath, alpha, temp_image).
+        ## Decoded images are converted & added on the main thread by process_loaded_images.
+        self.__loader_threads = loader_threads
+        self.__loader: ThreadPoolExecutor | None = None
+        self.__pending_images: dict[str, tuple[ImageLoadBatch, Future, str, bool | None, bool]] = {}
+        self.__pending_batches: dict[ImageLoadBatch, str] = {}
+
+        ## If True, get() returns a placeholder image for images still loading in the background. Otherwise, get()
+        ## blocks until the image has loaded.
+        self.pending_image_fallback = False
+        self.__pending_image: Image | None = None
 
-        Logger.log_info(self.__IMAGE_SERVICE_START.format(temp_image_lifespan=temp_image_lifespan_ms))
+        ## Atlas surfaces, by atlas name. Images packed into an atlas have their surface replaced with a subsurface of
+        ## one of these.
+        self.__atlases: dict[str, list[Surface]] = {}
+
+        ## Incremented whenever an image is added or removed. Anything holding on to Image objects by name (e.g.
+        ## Animation) compares this against the version it looked them up at, to know when to look them up again.
+        ## Changes to an image's surface are tracked by the image itself, see Image.generation.
+        self.__image_version = 0
+
+        ## Image loads are added to the profiler's trace, if tracing.
+        self.__profiler: ProfilerService | None = None
+        if ServiceLocator.is_registered(ProfilerService):
+            self.__profiler = ServiceLocator.get(ProfilerService)
+
+        Logger.log_info(self.__IMAGE_SERVICE_START.format(
+            temp_image_lifespan=temp_image_lifespan_ms,
+            temp_image_budget=temp_image_budget_bytes))
 
 
     @staticmethod
@@ -50,55 +189,319 @@ class ImageService:
         return name
 
 
+    def __load_file(self, filepath: str) -> Surface:
+        """
+        Loads an image file, through the image cache if enabled. Safe to run on loader threads.
+        """
+
+        if self.__profiler is None or not self.__profiler.tracing:
+            return self.__decode_file(filepath)
+
+        start_ns = perf_counter_ns()
+        image_surface = self.__decode_file(filepath)
+        self.__profiler.trace_event(
+            os_path.basename(filepath), ProfilerService.CATEGORY_ASSET, start_ns, perf_counter_ns(),
+            {"filepath": filepath})
+
+        return image_surface
+
+
+    def __decode_file(self, filepath: str) -> Surface:
+
+        if self.__image_cache is not None:
+            return self.__image_cache.load(filepath)
+
+        return py_image.load(filepath)
+
+
+    @staticmethod
+    def __is_display_set() -> bool:
+        return py_display.get_surface() is not None
+
+
+    @staticmethod
+    def __convert_surface(image_surface: Surface, alpha: bool) -> Surface:
+        return image_surface.convert_alpha() if alpha else image_surface.convert()
+
+
     def add(self,
             image_name: str,
             image_surface: surface,
-            temp_image: bool = False):
+            temp_image: bool = False,
+            alpha: bool | None = None,
+            filepath: str | None = None):
         """
-        Adds a new image to the image dict.
+        Adds a new image to the image dict. If the display has been set, the image is converted to the display's pixel
+        format, otherwise it's converted once the display is set (see convert_images).
 
         Parameters:
             image_name (str): The name of the image.
             image_surface (Surface): The surface of the image.
-            temp_image (bool): If True the image will be temporary dependent on lifespan. Otherwise, the image will be
-            permanent until deleted. Defaults to False.
+            temp_image (bool): If True the image will be temporary, unloaded from memory when unused or over the temp
+            image budget. Otherwise, the image will be permanent until deleted. Defaults to False.
+            alpha (bool | None): If True the image keeps per-pixel alpha, if False it's converted to an opaque surface.
+            Defaults to None, which keeps per-pixel alpha only if the surface already has it.
+            filepath (str | None): The file the image was loaded from. Temp images can only be unloaded if this is set.
+            Defaults to None.
         """
 
-        if image_name not in self.__image_dict and image_name not in self.__temp_image_dict:
+        if not self.is_image(image_name):
+
+            if alpha is None:
+                alpha = bool(image_surface.get_flags() & SRCALPHA)
+
+            if self.__is_display_set():
+                image_surface = self.__convert_surface(image_surface, alpha)
+
+            image = Image(image_name, image_surface, alpha, filepath)
+
             if temp_image:
-                self.__temp_image_dict[image_name] = Image(image_name, image_surface)
+                self.__temp_image_dict[image_name] = image
+                self.__temp_image_bytes += image.get_byte_size()
+                self.unload_temp_images_over_budget()
 
             else:
-                self.__image_dict[image_name] = Image(image_name, image_surface)
+                self.__image_dict[image_name] = image
+
+            self.__image_version += 1
 
         else:
             Logger.log_warning(self.__IMAGE_ALREADY_EXISTS.format(image_name=image_name))
 
 
-    def add_from_file(self, filepath: str, name:str = None):
-        image_surf = py_image.load(filepath)
+    def add_from_file(self, filepath: str, name:str = None, alpha: bool | None = None, temp_image: bool = False):
+        image_surf = self.__load_file(filepath)
 
         if name is None:
             name = self.__extract_filename(filepath)
         else:
             name = name
 
-        self.add(name, image_surf)
+        self.add(name, image_surf, temp_image, alpha, filepath)
+
+
+    def add_folder(self,
+                   folder_path: str,
+                   atlas_name: str | None = None,
+                   asynchronous: bool = False) -> ImageLoadBatch | None:
+        """
+        Adds every image in a folder.
 
+        Parameters:
+            folder_path (str): The path of the folder.
+            atlas_name (str | None): If set, the folder's images are packed into an atlas of this name. Defaults to None.
+            asynchronous (bool): If True, the images are decoded on background threads, and added as they finish by
+            process_loaded_images. Defaults to False.
 
-    def add_folder(self, folder_path: str):
+        Returns:
+            ImageLoadBatch | None: When loading asynchronously, the batch tracking the folder's progress.
+        """
 
         if not os_path.isdir(folder_path):
             Logger.log_warning(self.__FOLDER_PATH_DOES_NOT_EXIST.format(folder_path=folder_path))
-            return
+            return None
+
+        filepaths = [os_path.join(folder_path, filename)
+                     for filename in os_listdir(folder_path)
+                     if filename.lower().endswith(self.__IMAGE_FILETYPE)]
+
+        image_names = [self.__extract_filename(filepath) for filepath in filepaths]
+
+        if asynchronous:
+            batch = ImageLoadBatch(image_names, atlas_name)
+            self.__pending_batches[batch] = folder_path
+
+            if self.__loader is None:
+                self.__loader = ThreadPoolExecutor(max_workers=self.__loader_threads)
+
+            for image_name, filepath in zip(image_names, filepaths):
+                self.__pending_images[image_name] = (
+                    batch, self.__loader.submit(self.__load_file, filepath), filepath, None, False)
+
+            if batch.is_done():
+                self.__finish_batch(batch)
+
+            return batch
+
+        for filepath in filepaths:
+            self.add_from_file(filepath)
+
+        if atlas_name is not None:
+            self.build_atlas(atlas_name, image_names)
+
+        return None
+
+
+    def __finish_pending_image(self, image_name: str):
+        """
+        Adds an image that has finished decoding (blocking until it has), on the main thread.
+        """
+
+        batch, future, filepath, alpha, temp_image = self.__pending_images.pop(image_name)
+
+        try:
+            image_surf = future.result()
+
+        except Exception as exception:
+            Logger.log_error(self.__IMAGE_LOAD_FAILED.format(
+                image_name=image_name, filepath=filepath, exception=exception))
+            batch.failed_image_names.append(image_name)
+
+        else:
+            self.add(image_name, image_surf, temp_image, alpha, filepath)
+            batch.loaded_count += 1
+
+        if batch.is_done():
+            self.__finish_batch(batch)
+
+
+    def __finish_batch(self, batch: ImageLoadBatch):
+
+        folder_path = self.__pending_batches.pop(batch)
+
+        if batch.atlas_name is not None:
+            self.build_atlas(batch.atlas_name, [image_name for image_name in batch.image_names
+                                                if image_name not in batch.failed_image_names])
+
+        Logger.log_info(self.__BATCH_LOADED.format(
+            loaded_count=batch.loaded_count,
+            failed_count=len(batch.failed_image_names),
+            folder_path=folder_path))
+
+
+    def process_loaded_images(self, max_images: int | None = None) -> int:
+        """
+        Adds images that have finished decoding in the background. Should be run on the main thread every frame (done by
+        ArcticEngine.update), or in a loading screen's loop.
+
+        Parameters:
+            max_images (int | None): The maximum number of images to add, to limit the time spent. Defaults to None,
+            adding every finished image.
+
+        Returns:
+            int: The number of images still loading.
+        """
+
+        finished_image_names = [image_name for image_name, pending in self.__pending_images.items()
+                                if pending[1].done()]
+
+        if max_images is not None:
+            finished_image_names = finished_image_names[:max_images]
+
+        for image_name in finished_image_names:
+            self.__finish_pending_image(image_name)
+
+        return len(self.__pending_images)
+
+
+    def finish_loading(self, batch: ImageLoadBatch | None = None):
+        """
+        Blocks until a batch (or every image loading in the background) has loaded, then adds the images.
+
+        Parameters:
+            batch (ImageLoadBatch | None): The batch to wait for. Defaults to None, waiting for every image.
+        """
+
+        image_names = [image_name for image_name, pending in self.__pending_images.items()
+                       if batch is None or pending[0] is batch]
+
+        futures_wait([self.__pending_images[image_name][1] for image_name in image_names])
+
+        for image_name in image_names:
+            self.__finish_pending_image(image_name)
+
+
+    def is_pending(self, image_name: str) -> bool:
+        return image_name in self.__pending_images
+
+
+    def __get_pending_image(self) -> Image:
+
+        if self.__pending_image is None:
+            pending_surf = Surface((20, 20))
+            pending_surf.fill(ColourService.ERROR_COLOUR_VALUE)
+            self.__pending_image = Image(self.__PENDING_IMAGE_NAME, pending_surf, False)
+
+        return self.__pending_image
+
+
+    def build_atlas(self, atlas_name: str, image_names: list[str], max_dim: int = 2048) -> bool:
+        """
+        Packs images into one or a few large atlas surfaces. Each image's surface is replaced with a subsurface of the
+        atlas, so existing Image objects remain valid, but blits of these images all read from the same surface.
+
+        Parameters:
+            atlas_name (str): The name of the atlas. Rebuilding an existing atlas replaces it.
+            image_names (list[str]): The names of the images to pack.
+            max_dim (int): The maximum width & height of each atlas surface. Defaults to 2048.
+
+        Returns:
+            bool: True if the atlas was built, False if none of the images could be packed.
+        """
+
+        images = [self.get(image_name) for image_name in image_names]
+        images = [image for image in images if image is not None]
+
+        placements, atlas_dims = pack_rects([image.dim for image in images], max_dim)
 
-        for filename in os_listdir(folder_path):
+        if not atlas_dims:
+            return False
 
-            if filename.lower().endswith(self.__IMAGE_FILETYPE):
+        ## The atlas only needs per-pixel alpha if an image packed into it does.
+        atlas_alpha = any(image.alpha for image in images)
+        atlas_surfs = [Surface(dim, SRCALPHA) if atlas_alpha else Surface(dim) for dim in atlas_dims]
 
-                filepath = os_path.join(folder_path, filename)
+        if self.__is_display_set():
+            atlas_surfs = [self.__convert_surface(atlas_surf, atlas_alpha) for atlas_surf in atlas_surfs]
 
-                self.add_from_file(filepath)
+        for image, placement in zip(images, placements):
+
+            if placement is None:
+                Logger.log_warning(self.__ATLAS_IMAGE_TOO_LARGE.format(image_name=image.image_name, max_dim=max_dim))
+                continue
+
+            atlas_index, x, y = placement
+
+            ## The atlas is fully transparent, so taking the max of each channel copies the image's pixels (including
+            ## alpha) exactly, rather than blending them.
+            atlas_surfs[atlas_index].blit(image.surface, (x, y), special_flags=BLEND_RGBA_MAX)
+            image.surface = atlas_surfs[atlas_index].subsurface((x, y, *image.dim))
+            image.atlas = (atlas_name, atlas_index, (x, y, *image.dim))
+
+        self.__atlases[atlas_name] = atlas_surfs
+
+        Logger.log_info(self.__ATLAS_BUILT.format(
+            atlas_name=atlas_name,
+            image_count=len(images),
+            surface_count=len(atlas_surfs),
+            dims=atlas_dims))
+
+        return True
+
+
+    def get_atlas(self, atlas_name: str) -> list[Surface] | None:
+        """
+        Gets the surfaces of an atlas.
+
+        Parameters:
+            atlas_name (str): The name of the atlas.
+
+        Returns:
+            list[Surface] | None: The atlas surfaces, or None if the atlas does not exist.
+        """
+
+        return self.__atlases.get(atlas_name)
+
+
+    def get_image_version(self) -> int:
+        """
+        Gets the image version, which changes whenever an image is added or removed. Images found by name (see find)
+        can be kept until this changes.
+
+        Returns:
+            int: The image version.
+        """
+        return self.__image_version
 
 
     def remove(self, image_name: str):
@@ -109,12 +512,19 @@ class ImageService:
             image_name (str): The name of the image.
         """
 
+        if self.is_image(image_name):
+            self.__image_version += 1
+
         if image_name in self.__image_dict:
             del self.__image_dict[image_name]
             Logger.log_info(self.__IMAGE_DELETED.format(image_name=image_name, timestamp=py_time.get_ticks()))
 
         elif image_name in self.__temp_image_dict:
-            del self.__temp_image_dict[image_name]
+            self.__temp_image_bytes -= self.__temp_image_dict.pop(image_name).get_byte_size()
+            Logger.log_info(self.__IMAGE_DELETED.format(image_name=image_name, timestamp=py_time.get_ticks()))
+
+        elif image_name in self.__unloaded_temp_image_dict:
+            del self.__unloaded_temp_image_dict[image_name]
             Logger.log_info(self.__IMAGE_DELETED.format(image_name=image_name, timestamp=py_time.get_ticks()))
 
         else:
@@ -124,7 +534,9 @@ class ImageService:
 
     def get(self, image_name: str) -> Image | None:
         """
-        Gets an image from the image dict.
+        Gets an image from the image dict. Getting a temp image marks it as recently used, and reloads it from file if
+        it has been unloaded. Getting an image still loading in the background either blocks until it has loaded, or
+        returns a placeholder image if pending_image_fallback is set.
 
         Parameters:
             image_name (str): The name of the image.
@@ -137,32 +549,259 @@ class ImageService:
             return self.__image_dict[image_name]
 
         elif image_name in self.__temp_image_dict:
-            return self.__temp_image_dict[image_name]
+            image = self.__temp_image_dict[image_name]
+            self.touch(image)
+            return image
+
+        elif image_name in self.__unloaded_temp_image_dict:
+            return self.__reload_temp_image(image_name)
+
+        elif image_name in self.__pending_images:
+
+            if self.pending_image_fallback and not self.__pending_images[image_name][1].done():
+                return self.__get_pending_image()
+
+            self.__finish_pending_image(image_name)
+            return self.get(image_name)
 
         else:
             Logger.log_error(self.__INVALID_IMAGE_NAME.format(image_name=image_name))
 
 
-    def is_image(self, image_name):
-        return image_name in self.__image_dict or image_name in self.__temp_image_dict
+    def find(self, image_name: str) -> Image | None:
+        """
+        Finds an image by name without using it, i.e. without marking a temp image as recently used, reloading an
+        unloaded temp image (its surface is None) or waiting on an image loading in the background.
+
+        Parameters:
+            image_name (str): The name of the image.
 
+        Returns:
+            Image | None: The image, or None if it does not exist or is still loading.
+        """
+
+        image = self.__image_dict.get(image_name)
+
+        if image is None:
+            image = self.__temp_image_dict.get(image_name)
+
+        if image is None:
+            image = self.__unloaded_temp_image_dict.get(image_name)
 
+        return image
 
 
-    def delete_first_temp_image_by_lifespan(self):
+    def touch(self, image: Image):
         """
-        PROOF OF CONCEPT - DON'T USE THIS METHOD YET. It doesn't preform as planned. The idea is that when an image
-        hasn't been used for a period of time, the image is deleted from memory, but it's file location is stored ready
-        to be read whenever necessary.
+        Marks a loaded temp image as recently used, so it isn't unloaded while in use. Anything holding on to an image's
+        surface rather than getting the image each time it's drawn (e.g. ParticleEmitter) should touch it instead.
 
-        This method checks the first image in the image dict and deletes it.
+        Parameters:
+            image (Image): The image, e.g. from find. Does nothing if it isn't a loaded temp image.
         """
 
-        if len(self.__temp_image_dict) > 0:
-            first_image_name = next(iter(self.__temp_image_dict))
+        if self.__temp_image_dict.get(image.image_name) is image:
+            image.timestamp = py_time.get_ticks()
+            self.__temp_image_dict.move_to_end(image.image_name)
+
+
+    def get_surface(self, image: Image) -> Surface | None:
+        """
+        Gets an image's surface, marking a temp image as recently used & reloading it if it has been unloaded.
+
+        Parameters:
+            image (Image): The image, e.g. from find.
+
+        Returns:
+            Surface | None: The image's surface, or None if the image has been removed.
+        """
+
+        if image.surface is not None:
+            self.touch(image)
+            return image.surface
+
+        reloaded_image = self.get(image.image_name) if self.is_image(image.image_name) else None
+
+        return reloaded_image.surface if reloaded_image is image else None
 
-            if py_time.get_ticks() - self.__temp_image_dict[first_image_name].timestamp >= self.temp_image_lifespan_ms:
 
-                Logger.log_info(self.__TEMP_IMAGE_DELETED.format(image_name=first_image_name))
+    def __reload_temp_image(self, image_name: str) -> Image:
 
-                self.remove(first_image_name)
\ No newline at end of file
+        image = self.__unloaded_temp_image_dict.pop(image_name)
+
+        image_surface = self.__load_file(image.filepath)
+
+        if self.__is_display_set():
+            image_surface = self.__convert_surface(image_surface, image.alpha)
+
+        image.surface = image_surface
+        image.timestamp = py_time.get_ticks()
+
+        self.__temp_image_dict[image_name] = image
+        self.__temp_image_bytes += image.get_byte_size()
+
+        Logger.log_info(self.__TEMP_IMAGE_RELOADED.format(image_name=image_name, filepath=image.filepath))
+
+        self.unload_temp_images_over_budget()
+
+        return image
+
+
+    def __unload_temp_image(self, image_name: str, reason: str):
+
+        image = self.__temp_image_dict.pop(image_name)
+        byte_size = image.get_byte_size()
+
+        self.__temp_image_bytes -= byte_size
+        image.surface = None
+        self.__unloaded_temp_image_dict[image_name] = image
+
+        Logger.log_info(self.__TEMP_IMAGE_UNLOADED.format(image_name=image_name, reason=reason, byte_size=byte_size))
+
+
+    def get_temp_image_bytes(self) -> int:
+        """
+        Returns the memory used by the loaded temp images' pixels.
+        """
+        return self.__temp_image_bytes
+
+
+    def unload_temp_images_over_budget(self):
+        """
+        Unloads the least recently used temp images until the loaded temp images are within temp_image_budget_bytes.
+        The most recently used image is never unloaded, even if it alone exceeds the budget.
+        """
+
+        if self.temp_image_budget_bytes is None or self.__temp_image_bytes <= self.temp_image_budget_bytes:
+            return
+
+        most_recent_image_name = next(reversed(self.__temp_image_dict))
+        bytes_to_free = self.__temp_image_bytes - self.temp_image_budget_bytes
+        image_names_to_unload: list[str] = []
+
+        ## Images that can't be unloaded are skipped over, left in their place in the usage order.
+        for image_name, image in self.__temp_image_dict.items():
+
+            if bytes_to_free <= 0 or image_name == most_recent_image_name:
+                break
+
+            if image.is_unloadable():
+                image_names_to_unload.append(image_name)
+                bytes_to_free -= image.get_byte_size()
+
+        for image_name in image_names_to_unload:
+            self.__unload_temp_image(image_name, self.__OVER_BUDGET)
+
+
+    def unload_expired_temp_images(self):
+        """
+        Unloads temp images that haven't been used for temp_image_lifespan_ms. As temp images are ordered by when they
+        were last used, this stops at the first image that hasn't expired, so is cheap enough to run every frame.
+        """
+
+        expire_time = py_time.get_ticks() - self.temp_image_lifespan_ms
+
+        image_names_to_unload: list[str] = []
+
+        for image_name, image in self.__temp_image_dict.items():
+
+            if image.timestamp > expire_time:
+                break
+
+            if image.is_unloadable():
+                image_names_to_unload.append(image_name)
+
+        for image_name in image_names_to_unload:
+            self.__unload_temp_image(image_name, self.__LIFESPAN_EXPIRED)
+
+
+    def convert_images(self):
+        """
+        Converts every image & atlas to the display's pixel format, so blitting them doesn't require a per-pixel format
+        conversion. Run automatically by WindowService whenever the display is set, converting any images added before
+        the display existed (or whose format no longer matches the display's).
+        """
+
+        if not self.__is_display_set():
+            return
+
+        for atlas_name in self.__atlases:
+            self.__atlases[atlas_name] = [self.__convert_surface(atlas_surf, bool(atlas_surf.get_flags() & SRCALPHA))
+                                          for atlas_surf in self.__atlases[atlas_name]]
+
+        images = list(self.__image_dict.values()) + list(self.__temp_image_dict.values())
+
+        for image in images:
+
+            ## Converting can change a temp image's pixel size (e.g. 24 to 32 bits), so it's re-counted in the budget.
+            is_temp_image = self.__temp_image_dict.get(image.image_name) is image
+
+            if is_temp_image:
+                self.__temp_image_bytes -= image.get_byte_size()
+
+            if image.atlas is not None:
+                atlas_name, atlas_index, rect = image.atlas
+                image.surface = self.__atlases[atlas_name][atlas_index].subsurface(rect)
+
+            else:
+                image.surface = self.__convert_surface(image.surface, image.alpha)
+
+            if is_temp_image:
+                self.__temp_image_bytes += image.get_byte_size()
+
+
+        Logger.log_info(self.__IMAGES_CONVERTED.format(image_count=len(images), atlas_count=len(self.__atlases)))
+
+        self.unload_temp_images_over_budget()
+
+
+    @staticmethod
+    def is_display_format(image_surface: Surface) -> bool:
+        """
+        Checks whether a surface is in the display's pixel format (or the display's format plus per-pixel alpha).
+
+        Parameters:
+            image_surface (Surface): The surface to check.
+
+        Returns:
+            bool: True if the surface can be blitted to the display without a format conversion.
+        """
+
+        display_surf = py_display.get_surface()
+
+        if display_surf is None:
+            return False
+
+        if image_surface.get_flags() & SRCALPHA:
+            return (image_surface.get_bitsize() == 32 and
+                    image_surface.get_masks()[:3] == display_surf.get_masks()[:3])
+
+        return (image_surface.get_bitsize() == display_surf.get_bitsize() and
+                image_surface.get_masks() == display_surf.get_masks())
+
+
+    def check_converted(self) -> list[str]:
+        """
+        Checks every image is in the display's pixel format, logging a warning for each that isn't (e.g. a surface
+        assigned directly to Image.surface).
+
+        Returns:
+            list[str]: The names of the images not in the display's pixel format.
+        """
+
+        unconverted: list[str] = []
+
+        for image_dict in (self.__image_dict, self.__temp_image_dict):
+            for image_name, image in image_dict.items():
+
+                if not self.is_display_format(image.surface):
+                    Logger.log_warning(self.__IMAGE_NOT_CONVERTED.format(image_name=image_name))
+                    unconverted.append(image_name)
+
+        return unconverted
+
+
+    def is_image(self, image_name):
+        return (image_name in self.__image_dict or
+                image_name in self.__temp_image_dict or
+                image_name in self.__unloaded_temp_image_dict)
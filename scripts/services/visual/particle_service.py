@@ -2,6 +2,8 @@ from pygame import Vector2
 from scripts.utility.logger import Logger
 from scripts.game.components.animation import Animation
 from scripts.game.game_objects.particle.particle import Particle
+from scripts.game.game_objects.particle.particle_emitter import ParticleEmitter
+from scripts.game.game_objects.game_object_pool import GameObjectPool, GameObjectPoolStats
 from scripts.services.service_locator import ServiceLocator
 from scripts.services.utility.persistent_storage_service import PersistentDataService
 from scripts.services.utility.persistent_storage_service import PersistentData
@@ -22,15 +24,18 @@ class ParticleService:
 
     __FAILED_TO_PARSE_CONFIG = "Failed to parse config '{config_path}' for particle '{particle_name}'."
 
-    def __init__(self):
+    def __init__(self, async_image_loading: bool = False):
         self.__particles: dict[str, list] = {}
 
+        ## Finished particles are returned to a pool per particle name, and reused by create_particle.
+        self.__pools: dict[str, GameObjectPool] = {}
+
         self.__persistent_data = ServiceLocator.get(PersistentDataService)
         self.__persistent_data.add(ParticleService.__CONFIG_PATH)
 
         self.__image_service = ServiceLocator.get(ImageService)
 
-        self.load_config()
+        self.load_config(async_image_loading)
 
 
     def __parse_config(self, name: str, config_data: PersistentData):
@@ -49,20 +54,57 @@ class ParticleService:
             Logger.log_error(ParticleService.__FAILED_TO_PARSE_CONFIG.format(config_path=ParticleService.__CONFIG_PATH, particle_name=name))
 
 
-    def load_config(self):
+    def load_config(self, async_image_loading: bool = False):
         particle_config_data = self.__persistent_data.load(ParticleService.__CONFIG_NAME)
 
         for particle_name in particle_config_data.data:
-            self.__image_service.add_folder(ParticleService.__TEXTURE_PATH.format(particle_name=particle_name))
+            self.__image_service.add_folder(ParticleService.__TEXTURE_PATH.format(particle_name=particle_name),
+                                            atlas_name=particle_name,
+                                            asynchronous=async_image_loading)
             self.__parse_config(particle_name, particle_config_data)
 
 
+    def __get_pool(self, name: str) -> GameObjectPool:
+
+        if name not in self.__pools:
+            self.__pools[name] = GameObjectPool(lambda: Particle(Animation(*self.__particles[name])))
+
+        return self.__pools[name]
+
+
     def create_particle(self, name: str, pos: Vector2 = Vector2(0, 0)) -> Particle | None:
 
         if name in self.__particles:
-            new_particle = Particle(Animation(*self.__particles[name]))
-            new_particle.move.set_pos(pos)
+            new_particle = self.__get_pool(name).acquire()
+            new_particle.reset(pos)
             return new_particle
 
         return None
 
+
+    def get_pool_stats(self, name: str) -> GameObjectPoolStats | None:
+        """
+        Gets the stats of a particle's pool, e.g. to size it.
+        """
+
+        if name in self.__pools:
+            return self.__pools[name].get_stats()
+
+        return None
+
+
+    def create_emitter(self,
+                       name: str,
+                       capacity: int = 10000,
+                       bounds: Vector2 | None = None,
+                       delete_when_empty: bool = False) -> ParticleEmitter | None:
+        """
+        Creates an emitter for a configured particle, which simulates many particles as a single game object. Prefer
+        this over create_particle when creating more than a handful of particles at once.
+        """
+
+        if name in self.__particles:
+            frames, duration, _ = self.__particles[name]
+            return ParticleEmitter(frames, duration, capacity, bounds, delete_when_empty)
+
+        return None
@@ -0,0 +1,293 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+from math import ceil, log2
+from weakref import ref
+from pygame import Surface, transform as py_transform
+from scripts.utility.logger import Logger
+
+
+class ScaledSurfaceService:
+    """
+    Cache of scaled copies of surfaces, used to draw game objects when the camera is zoomed. Copies are keyed by the
+    source surface's identity & the scale, which is quantized to a fixed number of steps per octave, so a smooth zoom
+    only needs a new copy every step, rather than every frame. The cache is kept within a memory budget, evicting the
+    least recently used copies first.
+
+    At most max_rescales_per_frame copies are scaled on the main thread each frame, any other surfaces are drawn from
+    their closest cached copy. Once the zoom has settled, surfaces that already have a copy at another scale are
+    refined on a background thread instead, and added to the cache by update. Surfaces without any copy are always
+    scaled on the main thread first (within the per frame limit), so they're never drawn unscaled while zoomed for
+    longer than necessary.
+
+    Source surfaces are only weakly referenced, so their copies are dropped once they're garbage collected (e.g. an
+    image unloaded or replaced by its converted surface). A cached copy is not updated when its source surface is drawn
+    to. Call invalidate after modifying a surface that may have been drawn scaled.
+    """
+
+    __SERVICE_START = ("Scaled Surface Service Started. Budget: {budget_bytes} bytes. Steps Per Octave: "
+                       "{steps_per_octave}. Max Rescales Per Frame: {max_rescales_per_frame}.")
+    __RESCALE_FAILED = "Failed to rescale surface to scale {scale}: {exception}."
+
+    def __init__(self,
+                 budget_bytes: int = 64 * 1024 * 1024,
+                 steps_per_octave: int = 16,
+                 max_rescales_per_frame: int = 16):
+        """
+        Parameters:
+            budget_bytes (int): The most memory used by the cached copies' pixels. Defaults to 64 MiB.
+            steps_per_octave (int): The number of scales cached between each doubling of the scale. Defaults to 16.
+            max_rescales_per_frame (int): The most copies scaled on the main thread per frame while zooming. Defaults
+            to 16.
+        """
+
+        self.budget_bytes = budget_bytes
+        self.steps_per_octave = steps_per_octave
+        self.max_rescales_per_frame = max_rescales_per_frame
+
+        ## If False, copies are always scaled on the main thread (within the per frame limit), so which copy is drawn
+        ## doesn't depend on thread timing, e.g. for deterministic headless runs.
+        self.background_rescaling = True
+
+        ## Cached copies, ordered from least to most recently used, by (id(source), scale): (copy, byte size).
+        self.__cache: OrderedDict[tuple[int, float], tuple[Surface, int]] = OrderedDict()
+        self.__cache_bytes = 0
+
+        ## Weak references to the source surfaces with cached or pending copies, by id(source). A source's id can be
+        ## reused once it's collected, so a reference no longer pointing at the surface looked up means its entries are
+        ## stale. Collected sources are queued (from whichever thread collects them) & dropped by update.
+        self.__source_refs: dict[int, ref] = {}
+        self.__collected_source_ids: list[int] = []
+
+        ## The scales cached for each source surface, by id(source), used to find the closest copy while zooming.
+        self.__source_scales: dict[int, set[float]] = {}
+
+        self.__rescales_this_frame = 0
+
+        ## Copies being scaled on the background thread, by (id(source), scale).
+        self.__rescaler: ThreadPoolExecutor | None = None
+        self.__pending: dict[tuple[int, float], Future] = {}
+
+        Logger.log_info(self.__SERVICE_START.format(
+            budget_bytes=budget_bytes,
+            steps_per_octave=steps_per_octave,
+            max_rescales_per_frame=max_rescales_per_frame))
+
+
+    def quantize_scale(self, scale: float) -> float:
+        """
+        Rounds a scale to the closest step that copies are cached at.
+
+        Parameters:
+            scale (float): The scale.
+
+        Returns:
+            float: The quantized scale.
+        """
+
+        return 2 ** (round(log2(scale) * self.steps_per_octave) / self.steps_per_octave)
+
+
+    @staticmethod
+    def __rescale(source: Surface, scale: float) -> Surface:
+        """
+        Scales a surface. Rounded up, so that adjacent surfaces (e.g. map chunks) don't leave gaps between them. Safe to
+        run on the background thread.
+        """
+
+        width, height = source.get_size()
+        return py_transform.scale(source, (max(1, ceil(width * scale)), max(1, ceil(height * scale))))
+
+
+    def __track_source(self, source: Surface) -> bool:
+        """
+        Weakly references a source surface, dropping the stale entries of a collected surface that had the same id.
+
+        Returns:
+            bool: True if the source already had cached or pending copies.
+        """
+
+        source_id = id(source)
+        source_ref = self.__source_refs.get(source_id)
+
+        if source_ref is not None:
+
+            if source_ref() is source:
+                return True
+
+            self.__drop_source(source_id)
+
+        collected_source_ids = self.__collected_source_ids
+        self.__source_refs[source_id] = ref(source, lambda _: collected_source_ids.append(source_id))
+
+        return False
+
+
+    def __drop_source(self, source_id: int):
+        """
+        Removes every cached & pending copy of a source, & stops tracking it.
+        """
+
+        for scale in list(self.__source_scales.get(source_id, ())):
+            self.__remove((source_id, scale))
+
+        for key in [key for key in self.__pending if key[0] == source_id]:
+            del self.__pending[key]
+
+        self.__source_refs.pop(source_id, None)
+
+
+    def __add(self, key: tuple[int, float], scaled_surf: Surface):
+
+        byte_size = scaled_surf.get_bytesize() * scaled_surf.get_width() * scaled_surf.get_height()
+
+        self.__cache[key] = (scaled_surf, byte_size)
+        self.__cache_bytes += byte_size
+        self.__source_scales.setdefault(key[0], set()).add(key[1])
+
+        self.__evict_over_budget()
+
+
+    def __remove(self, key: tuple[int, float]):
+
+        _, byte_size = self.__cache.pop(key)
+        self.__cache_bytes -= byte_size
+
+        source_scales = self.__source_scales[key[0]]
+        source_scales.discard(key[1])
+
+        if not source_scales:
+            del self.__source_scales[key[0]]
+
+
+    def __evict_over_budget(self):
+
+        ## The most recently used copy is never evicted, even if it alone exceeds the budget.
+        while self.__cache_bytes > self.budget_bytes and len(self.__cache) > 1:
+            self.__remove(next(iter(self.__cache)))
+
+
+    def __get_closest(self, source: Surface, scale: float) -> Surface:
+        """
+        Gets the cached copy closest to a scale, or the source itself if it's closer.
+        """
+
+        source_scales = self.__source_scales.get(id(source))
+
+        if not source_scales:
+            return source
+
+        closest_scale = min(source_scales, key=lambda cached_scale: abs(log2(cached_scale / scale)))
+
+        if abs(log2(scale)) <= abs(log2(closest_scale / scale)):
+            return source
+
+        key = (id(source), closest_scale)
+        self.__cache.move_to_end(key)
+
+        return self.__cache[key][0]
+
+
+    def get(self, source: Surface, scale: float, settled: bool = True) -> Surface:
+        """
+        Gets a surface scaled to a (quantized) scale, from the cache if possible.
+
+        Parameters:
+            source (Surface): The surface to scale.
+            scale (float): The scale.
+            settled (bool): Whether the scale has stopped changing. If True & the surface has a copy at another scale,
+            the missing copy is scaled in the background, otherwise it's scaled on the main thread if this frame's
+            rescale limit allows it. Until the copy is ready the closest cached copy is returned. Defaults to True.
+
+        Returns:
+            Surface: The scaled surface.
+        """
+
+        scale = self.quantize_scale(scale)
+
+        if scale == 1:
+            return source
+
+        has_copies = self.__track_source(source)
+
+        key = (id(source), scale)
+        cached = self.__cache.get(key)
+
+        if cached is not None:
+            self.__cache.move_to_end(key)
+            return cached[0]
+
+        refine_in_background = settled and self.background_rescaling and id(source) in self.__source_scales
+
+        if not refine_in_background and self.__rescales_this_frame < self.max_rescales_per_frame:
+            self.__rescales_this_frame += 1
+            scaled_surf = self.__rescale(source, scale)
+            self.__add(key, scaled_surf)
+            return scaled_surf
+
+        if settled and self.background_rescaling and key not in self.__pending:
+            if self.__rescaler is None:
+                self.__rescaler = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ScaledSurfaceService")
+
+            ## Scaling locks the surface it reads from, so the background thread scales a copy, leaving the source
+            ## free to be drawn in the meantime.
+            self.__pending[key] = self.__rescaler.submit(self.__rescale, source.copy(), scale)
+
+        if not has_copies and key not in self.__pending:
+            self.__source_refs.pop(id(source), None)
+
+        return self.__get_closest(source, scale)
+
+
+    def update(self):
+        """
+        Adds copies that have finished scaling in the background, and resets the per frame rescale limit. Should be run
+        on the main thread every frame (done by ArcticEngine.update).
+        """
+
+        self.__rescales_this_frame = 0
+
+        while self.__collected_source_ids:
+            source_id = self.__collected_source_ids.pop()
+            source_ref = self.__source_refs.get(source_id)
+
+            ## The id may already have been reused by a new source.
+            if source_ref is not None and source_ref() is None:
+                self.__drop_source(source_id)
+
+        for key in [key for key, future in self.__pending.items() if future.done()]:
+            future = self.__pending.pop(key)
+
+            try:
+                self.__add(key, future.result())
+
+            except Exception as exception:
+                Logger.log_error(self.__RESCALE_FAILED.format(scale=key[1], exception=exception))
+
+
+    def invalidate(self, source: Surface):
+        """
+        Removes every cached copy of a surface, e.g. after it's been drawn to.
+
+        Parameters:
+            source (Surface): The source surface.
+        """
+
+        source_ref = self.__source_refs.get(id(source))
+
+        if source_ref is not None and source_ref() is source:
+            self.__drop_source(id(source))
+
+
+    def clear(self):
+        self.__cache.clear()
+        self.__source_scales.clear()
+        self.__pending.clear()
+        self.__source_refs.clear()
+        self.__cache_bytes = 0
+
+
+    def get_cache_bytes(self) -> int:
+        """
+        Returns the memory used by the cached copies' pixels.
+        """
+        return self.__cache_bytes
@@ -0,0 +1,74 @@
+__author__ = "Kaya Arkin"
+__copyright__ = "Copyright Kaya Arkin"
+__license__ = "GPL"
+__email__ = "karkin2002@gmail.com"
+__status__ = "Development"
+
+"""
+This file is part of Arctic Engine Project by Kaya Arkin. For more information,
+look at the README.md file in the root directory, or visit the
+GitHub Repo: https://github.com/karkin2002/Arctic-Engine.
+"""
+
+from math import ceil, sqrt
+
+
+def pack_rects(rect_dims: list[tuple[int, int]],
+               max_dim: int = 2048,
+               padding: int = 0) -> tuple[list[tuple[int, int, int] | None], list[tuple[int, int]]]:
+    """
+    Packs rectangles into as few bins as possible using a shelf packer. Rectangles are placed tallest first, left to
+    right along shelves, starting a new shelf when a row is full and a new bin when a bin is full.
+
+    Args:
+        rect_dims (list[tuple[int, int]]): The dimensions (width, height) of each rectangle.
+        max_dim (int, optional): The maximum width & height of a bin. Defaults to 2048.
+        padding (int, optional): Space left between rectangles. Defaults to 0.
+
+    Returns:
+        tuple[list[tuple[int, int, int] | None], list[tuple[int, int]]]: For each rectangle, the (bin index, x, y) it
+        was placed at, or None if it is larger than max_dim. Followed by the dimensions of each bin.
+    """
+
+    placements: list[tuple[int, int, int] | None] = [None] * len(rect_dims)
+
+    packable = [i for i, (width, height) in enumerate(rect_dims) if width <= max_dim and height <= max_dim]
+
+    if not packable:
+        return placements, []
+
+    ## Aim for a roughly square bin, wide enough for the widest rectangle.
+    total_area = sum((rect_dims[i][0] + padding) * (rect_dims[i][1] + padding) for i in packable)
+    widest = max(rect_dims[i][0] for i in packable)
+    bin_width = min(max_dim, max(widest, ceil(sqrt(total_area))))
+
+    packable.sort(key=lambda i: (rect_dims[i][1], rect_dims[i][0]), reverse=True)
+
+    bin_dims: list[tuple[int, int]] = []
+    bin_index = 0
+    shelf_x = shelf_y = shelf_height = 0
+    used_width = 0
+
+    for i in packable:
+        width, height = rect_dims[i]
+
+        ## Start a new shelf.
+        if shelf_x + width > bin_width:
+            shelf_y += shelf_height + padding
+            shelf_x = shelf_height = 0
+
+        ## Start a new bin.
+        if shelf_y + height > max_dim:
+            bin_dims.append((used_width, shelf_y - padding))
+            bin_index += 1
+            shelf_x = shelf_y = shelf_height = used_width = 0
+
+        placements[i] = (bin_index, shelf_x, shelf_y)
+
+        shelf_x += width + padding
+        shelf_height = max(shelf_height, height)
+        used_width = max(used_width, shelf_x - padding)
+
+    bin_dims.append((used_width, shelf_y + shelf_height))
+
+    return placements, bin_dims